@@ -93,8 +93,54 @@ public class Plugin
             { "telemetry.distro.version", Version.version + "-aws" },
         };
 
+    // Providers seen by this plugin, kept only so ForceFlush can reach them: the agent owns the
+    // tracer and meter providers and does not otherwise hand them out.
+    private static readonly object ProvidersLock = new();
+    private static readonly List<MeterProvider> MeterProviders = new();
+    private static TracerProvider? initializedTracerProvider;
+
     private Sampler? sampler;
 
+    /// <summary>
+    /// Export everything buffered in the tracer and meter providers this plugin has seen, and in
+    /// ServiceEvents, without waiting for the batch or metric export intervals.
+    /// </summary>
+    /// <remarks>
+    /// Intended for tests: the contract-test applications call it from a flush endpoint (through
+    /// reflection, as they do not reference the distro) so suites can assert on telemetry right after
+    /// sending requests. Logs written through the agent's logger provider are not covered; the plugin
+    /// has no hook that exposes that provider.
+    /// </remarks>
+    /// <param name="timeoutMilliseconds">Upper bound for each provider's flush.</param>
+    /// <returns>True if every flush completed within the timeout.</returns>
+    public static bool ForceFlush(int timeoutMilliseconds = 5000)
+    {
+        var flushed = true;
+
+#if !NETFRAMEWORK
+        // First: its collectors emit metrics and logs that the flushes below would otherwise miss.
+        flushed &= ServiceEventsInstrumentation.Current?.ForceFlush(timeoutMilliseconds) ?? true;
+#endif
+
+        TracerProvider? tracerProvider;
+        MeterProvider[] meterProviders;
+        lock (ProvidersLock)
+        {
+            tracerProvider = initializedTracerProvider;
+            meterProviders = MeterProviders.ToArray();
+        }
+
+        // Spans before metrics: the span metrics processor records on span end, so the traces flush
+        // must not leave measurements behind that the meter flush has already passed.
+        flushed &= tracerProvider?.ForceFlush(timeoutMilliseconds) ?? true;
+        foreach (var meterProvider in meterProviders)
+        {
+            flushed &= meterProvider.ForceFlush(timeoutMilliseconds);
+        }
+
+        return flushed;
+    }
+
     /// <summary>
     /// To configure plugin, before OTel SDK configuration is called.
     /// </summary>public void Initializing()
@@ -112,6 +158,11 @@ public class Plugin
     /// <param name="tracerProvider"><see cref="TracerProvider"/> Provider to configure</param>
     public void TracerProviderInitialized(TracerProvider tracerProvider)
     {
+        lock (ProvidersLock)
+        {
+            initializedTracerProvider = tracerProvider;
+        }
+
         if (this.IsApplicationSignalsEnabled())
         {
             // setting the default propagators to be W3C tracecontext, b3, b3multi and xray
@@ -153,6 +204,7 @@ public class Plugin
                                 : null;
                 })
                 .Build();
+                TrackMeterProvider(provider);
 
                 Resource resource = provider.GetResource();
                 BaseProcessor<Activity> spanMetricsProcessor = AwsSpanMetricsProcessorBuilder.Create(resource, provider).Build();
@@ -332,6 +384,15 @@ public class Plugin
         return builder;
     }
 
+    /// <summary>
+    /// To access MeterProvider right after MeterProviderBuilder.Build() is executed.
+    /// </summary>
+    /// <param name="meterProvider"><see cref="MeterProvider"/> Provider built by the agent</param>
+    public void MeterProviderInitialized(MeterProvider meterProvider)
+    {
+        TrackMeterProvider(meterProvider);
+    }
+
     /// <summary>
     /// // To configure metrics SDK after Auto Instrumentation configured SDK
     /// </summary>
@@ -654,6 +715,14 @@ public class Plugin
         return headers;
     }
 
+    private static void TrackMeterProvider(MeterProvider meterProvider)
+    {
+        lock (ProvidersLock)
+        {
+            MeterProviders.Add(meterProvider);
+        }
+    }
+
     // Whether ServiceEvents actually came up. Initializing() runs before AfterConfigureTracerProvider,
     // so by the time the tracer pipeline is configured this reflects the real outcome of enablement
     // (including the Lambda opt-out and the refusal-to-start path) rather than just the env flag.
@@ -143,8 +143,58 @@ internal abstract class CollectorBase : IDisposable
             }
         }
 
-        // Final flush outside the lock so we don't hold it during emission.
-        this.RunCollectSafely();
+        // A Flush() can hold the guard too, and it runs on its caller's thread, which the timer drain
+        // above does not cover. Skipping the final flush when the guard is taken, as a tick does, would
+        // bring back the problem the drain fixed: the last window is lost and the caller disposes the
+        // providers underneath a Collect() that is still emitting. So wait for it as Flush() waits for a
+        // tick, within the same budget, and skip the final flush only on timeout. Final flush outside the
+        // lock so we don't hold it during emission.
+        var flushWait = budget.Clamp(TimerDrainWait);
+        if (!SpinWait.SpinUntil(() => Interlocked.CompareExchange(ref this.collecting, 1, 0) == 0, flushWait))
+        {
+            return;
+        }
+
+        this.CollectHoldingGuard();
+    }
+
+    /// <summary>
+    /// Run <see cref="Collect" /> now, outside the timer schedule, so the current window is emitted
+    /// without waiting for the next tick. Used by <see cref="ServiceEventsInstrumentation.ForceFlush" />.
+    /// </summary>
+    /// <remarks>
+    /// Unlike a timer tick, a flush that finds a <see cref="Collect" /> in flight waits for it instead
+    /// of being skipped: the caller expects everything recorded before the call to have been emitted
+    /// when this returns, and the in-flight tick may have swapped its window before those records landed.
+    /// </remarks>
+    /// <param name="timeout">How long to wait for an in-flight <see cref="Collect" /> to finish.</param>
+    /// <returns>False if the collector is not running or the in-flight collection did not finish in time.</returns>
+    internal bool Flush(TimeSpan timeout)
+    {
+        lock (this.stateLock)
+        {
+            if (!this.started || this.disposed)
+            {
+                return false;
+            }
+        }
+
+        if (!SpinWait.SpinUntil(() => Interlocked.CompareExchange(ref this.collecting, 1, 0) == 0, timeout))
+        {
+            return false;
+        }
+
+        // Dispose may have started while this call waited for the guard; its final drain collects then.
+        lock (this.stateLock)
+        {
+            if (this.disposed)
+            {
+                Interlocked.Exchange(ref this.collecting, 0);
+                return false;
+            }
+        }
+
+        return this.CollectHoldingGuard();
     }
 
     /// <summary>
@@ -177,13 +227,25 @@ internal abstract class CollectorBase : IDisposable
             return;
         }
 
+        this.CollectHoldingGuard();
+    }
+
+    /// <summary>
+    /// Run <see cref="Collect" /> with exception isolation, then release the non-reentrancy guard,
+    /// which the caller must have acquired.
+    /// </summary>
+    /// <returns>False if <see cref="Collect" /> threw.</returns>
+    private bool CollectHoldingGuard()
+    {
         try
         {
             this.Collect();
+            return true;
         }
         catch
         {
             // Telemetry must never crash the host. Drop and continue.
+            return false;
         }
         finally
         {
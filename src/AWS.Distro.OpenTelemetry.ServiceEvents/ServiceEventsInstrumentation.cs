@@ -43,6 +43,7 @@ public sealed class ServiceEventsInstrumentation : IDisposable
     private readonly WatcherConfigSyncer watcherSyncer = new();
 
     private ILoggerFactory? generalLoggerFactory;
+    private BaseProcessor<LogRecord>? logProcessor;
     private MeterProvider? meterProvider;
     private Meter? meter;
     private ServiceEventsOtlpEmitter? emitter;
@@ -174,6 +175,31 @@ public sealed class ServiceEventsInstrumentation : IDisposable
         this.initialized = false;
     }
 
+    /// <summary>
+    /// Emit the endpoint collector's current window and push every buffered ServiceEvents log record and
+    /// metric to its exporter, without waiting for the flush interval or the 60s metric reader cadence.
+    /// </summary>
+    /// <remarks>
+    /// Test-only in practice: the contract-test applications expose it on a flush endpoint so suites can
+    /// assert right after the requests they sent instead of polling through a full export window. The
+    /// collector is flushed first because its <c>Collect()</c> emits through the log and metric pipelines
+    /// flushed after it. No-op (returns true) when ServiceEvents is not initialized.
+    /// </remarks>
+    /// <param name="timeoutMilliseconds">Upper bound for each flush step.</param>
+    /// <returns>True if every step completed within the timeout.</returns>
+    public bool ForceFlush(int timeoutMilliseconds = 5000)
+    {
+        if (!this.initialized)
+        {
+            return true;
+        }
+
+        var flushed = this.endpointCollector?.Flush(TimeSpan.FromMilliseconds(timeoutMilliseconds)) ?? true;
+        flushed &= this.logProcessor?.ForceFlush(timeoutMilliseconds) ?? true;
+        flushed &= this.meterProvider?.ForceFlush(timeoutMilliseconds) ?? true;
+        return flushed;
+    }
+
     /// <summary>
     /// Register ServiceEvents' tracer processors on the customer's
     /// <c>TracerProvider</c>. Called from the plugin's
@@ -250,7 +276,27 @@ public sealed class ServiceEventsInstrumentation : IDisposable
             .Build();
     }
 
-    private static ILoggerFactory BuildLoggerFactory(ServiceEventsConfig config, Dictionary<string, object> resourceAttrs)
+    // Built outside the logger factory so ForceFlush can reach it: ILoggerFactory exposes no flush.
+    private static BaseProcessor<LogRecord> BuildLogProcessor(ServiceEventsConfig config)
+    {
+        if (!string.IsNullOrEmpty(config.OutputFile))
+        {
+            return new SimpleLogRecordExportProcessor(new ServiceEventsCloudWatchFileExporter(config.OutputFile));
+        }
+
+        var endpoint = string.IsNullOrEmpty(config.LogsEndpoint)
+            ? "http://localhost:4316/v1/logs"
+            : config.LogsEndpoint;
+
+        // Custom OTLP/JSON exporter (not the stock AddOtlpExporter): emits the
+        // structured nested body + serviceevents/1.0 scope that the cross-SDK wire
+        // format requires. OTel .NET's string-only LogRecord.Body makes the stock
+        // exporter emit a stringified body + wrong scope. See ServiceEventsOtlpLogExporter.
+        return new BatchLogRecordExportProcessor(
+            new ServiceEventsOtlpLogExporter(endpoint, config.LogGroup, config.LogStream));
+    }
+
+    private static ILoggerFactory BuildLoggerFactory(BaseProcessor<LogRecord> processor, Dictionary<string, object> resourceAttrs)
     {
         return LoggerFactory.Create(builder =>
         {
@@ -261,23 +307,7 @@ public sealed class ServiceEventsInstrumentation : IDisposable
                 options.ParseStateValues = true;
 
                 options.SetResourceBuilder(ResourceBuilder.CreateEmpty().AddAttributes(resourceAttrs));
-
-                if (!string.IsNullOrEmpty(config.OutputFile))
-                {
-                    options.AddProcessor(new SimpleLogRecordExportProcessor(new ServiceEventsCloudWatchFileExporter(config.OutputFile)));
-                    return;
-                }
-
-                var endpoint = string.IsNullOrEmpty(config.LogsEndpoint)
-                    ? "http://localhost:4316/v1/logs"
-                    : config.LogsEndpoint;
-
-                // Custom OTLP/JSON exporter (not the stock AddOtlpExporter): emits the
-                // structured nested body + serviceevents/1.0 scope that the cross-SDK wire
-                // format requires. OTel .NET's string-only LogRecord.Body makes the stock
-                // exporter emit a stringified body + wrong scope. See ServiceEventsOtlpLogExporter.
-                options.AddProcessor(new BatchLogRecordExportProcessor(
-                    new ServiceEventsOtlpLogExporter(endpoint, config.LogGroup, config.LogStream)));
+                options.AddProcessor(processor);
             });
         });
     }
@@ -370,6 +400,7 @@ public sealed class ServiceEventsInstrumentation : IDisposable
         this.endpointCollector = null;
         this.deploymentEventEmitter = null;
         this.generalLoggerFactory = null;
+        this.logProcessor = null;
         this.meterProvider = null;
         this.meter?.Dispose();
         this.meter = null;
@@ -408,7 +439,8 @@ public sealed class ServiceEventsInstrumentation : IDisposable
     {
         var resourceAttrs = this.BuildResourceAttributes();
 
-        this.generalLoggerFactory = BuildLoggerFactory(this.config, resourceAttrs);
+        this.logProcessor = BuildLogProcessor(this.config);
+        this.generalLoggerFactory = BuildLoggerFactory(this.logProcessor, resourceAttrs);
         this.meterProvider = BuildMeterProvider(this.config, resourceAttrs);
         this.meter = new Meter(ServiceEventsOtlpEmitter.InstrumentationScopeName, ServiceEventsOtlpEmitter.InstrumentationScopeVersion);
 
@@ -192,6 +192,73 @@ public class CollectorBaseTests
             "a second Dispose must not emit another window");
     }
 
+    /// <summary>
+    /// A flush that lands during a tick must wait for it and collect again, not be skipped the way an
+    /// overlapping tick is: the tick may have swapped its window before the caller's records landed,
+    /// and the caller asserts on them as soon as the flush returns.
+    /// </summary>
+    [Fact]
+    public void Flush_WhenATickIsInFlight_WaitsForItAndCollectsAgain()
+    {
+        var collector = new BlockingCollector(flushIntervalMs: 50, firstTickBlockMs: 300);
+
+        collector.Start();
+        collector.WaitForFirstTick(TimeSpan.FromSeconds(10))
+            .Should().BeTrue("the timer should have fired at least one tick");
+
+        collector.Flush(TimeSpan.FromSeconds(10)).Should().BeTrue();
+
+        collector.WaitForFirstTickCompleted(TimeSpan.Zero)
+            .Should().BeTrue("Flush must not return before the in-flight tick has finished");
+        collector.CollectCount.Should().BeGreaterThanOrEqualTo(2, "Flush must collect after the in-flight tick");
+
+        collector.Dispose();
+    }
+
+    [Fact]
+    public void Flush_BeforeStartOrAfterDispose_DoesNotCollect()
+    {
+        var collector = new BlockingCollector(flushIntervalMs: 60_000, firstTickBlockMs: 0);
+
+        collector.Flush(TimeSpan.FromSeconds(1)).Should().BeFalse();
+
+        collector.Start();
+        collector.Flush(TimeSpan.FromSeconds(1)).Should().BeTrue();
+        collector.CollectCount.Should().Be(1);
+
+        collector.Dispose();
+        var afterDispose = collector.CollectCount;
+
+        collector.Flush(TimeSpan.FromSeconds(1)).Should().BeFalse();
+        collector.CollectCount.Should().Be(afterDispose, "a disposed collector must not emit again");
+    }
+
+    /// <summary>
+    /// The flush counterpart of <see cref="Dispose_WhenATickIsInFlight_StillPerformsTheFinalDrain" />.
+    /// A flush runs on its caller's thread, so the timer drain does not wait for it; without a wait of
+    /// its own, Dispose found the guard taken, skipped the final drain and returned while the flush's
+    /// Collect() was still emitting into providers the caller was about to dispose.
+    /// </summary>
+    [Fact]
+    public void Dispose_WhenAFlushIsInFlight_WaitsForItAndStillPerformsTheFinalDrain()
+    {
+        // No tick fires during the test, so the first Collect() is the flush's.
+        var collector = new BlockingCollector(flushIntervalMs: 60_000, firstTickBlockMs: 300);
+
+        collector.Start();
+        var flush = Task.Run(() => collector.Flush(TimeSpan.FromSeconds(10)));
+        collector.WaitForFirstTick(TimeSpan.FromSeconds(10))
+            .Should().BeTrue("the flush should be collecting before Dispose runs");
+
+        collector.Dispose();
+
+        collector.WaitForFirstTickCompleted(TimeSpan.Zero)
+            .Should().BeTrue("Dispose must not return before the in-flight flush has finished");
+        collector.CollectCount.Should().Be(2, "the final drain must still run after the flush");
+        flush.Wait(TimeSpan.FromSeconds(10)).Should().BeTrue();
+        flush.Result.Should().BeTrue();
+    }
+
     /// <summary>
     /// A collector whose first <see cref="Collect" /> blocks, so a test can deterministically
     /// arrange for <c>Dispose</c> to arrive while a tick is still running. Later ticks return
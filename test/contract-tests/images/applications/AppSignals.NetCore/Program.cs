@@ -1,4 +1,5 @@
 using System;
+using System.Diagnostics;
 
 var builder = WebApplication.CreateBuilder(args);
 
@@ -66,4 +67,48 @@ app.MapPost("/fault/postmethod", async () =>
     .WithName("FaultPost")
     .WithOpenApi();
 
+// Cardinality stress (see netcore_cardinality_benchmark.py): CARDINALITY_ROUTES distinct routes, and a client span
+// shaped like an S3 call whose remote operation and bucket come from the path. The span's source is exported when
+// OTEL_DOTNET_AUTO_TRACES_ADDITIONAL_SOURCES names it.
+int.TryParse(Environment.GetEnvironmentVariable("CARDINALITY_ROUTES"), out var cardinalityRoutes);
+for (var i = 0; i < cardinalityRoutes; i++)
+{
+    app.MapGet($"/cardinality/route{i}", async () =>
+        {
+            return Results.Ok();
+        })
+        .WithName($"CardinalityRoute{i}");
+}
+
+var cardinalitySource = new ActivitySource("AppSignals.NetCore.Cardinality");
+app.MapGet("/cardinality/remote/{operation}/{bucket}", async (string operation, string bucket) =>
+    {
+        using (var activity = cardinalitySource.StartActivity($"S3.{operation}", ActivityKind.Client))
+        {
+            activity?.SetTag("rpc.system", "aws-api");
+            activity?.SetTag("rpc.service", "S3");
+            activity?.SetTag("rpc.method", operation);
+            activity?.SetTag("aws.s3.bucket", bucket);
+        }
+
+        return Results.Ok();
+    })
+    .WithName("CardinalityRemote")
+    .WithOpenApi();
+
+// Test-only: force-flush the agent's tracer/meter providers and ServiceEvents so the harness can assert
+// without waiting for export intervals. The plugin's static ForceFlush is found by reflection, as the
+// app does not reference the distro; 503 when the distro is not loaded or a flush timed out.
+app.MapPost("/test/flush", async () =>
+    {
+        var forceFlush = AppDomain.CurrentDomain.GetAssemblies()
+            .Select(assembly => assembly.GetType("AWS.Distro.OpenTelemetry.AutoInstrumentation.Plugin"))
+            .FirstOrDefault(type => type is not null)
+            ?.GetMethod("ForceFlush", new[] { typeof(int) });
+        var flushed = forceFlush?.Invoke(null, new object[] { 5000 }) as bool?;
+        return flushed == true ? Results.Ok() : Results.StatusCode(503);
+    })
+    .WithName("TestFlush")
+    .WithOpenApi();
+
 app.Run();
@@ -93,6 +93,53 @@ app.MapPost("/data", async (HttpRequest request) =>
     return Results.Ok("data");
 });
 
+// Benchmark-only (see serviceevents_benchmark.py): BENCHMARK_ROUTES distinct route templates, so one
+// EndpointMetricCollector aggregation each. `?exception={k}` makes a route throw the k-th (modulo) concrete
+// exception type of System.Private.CoreLib, so one exception_breakdown entry per type.
+int.TryParse(Environment.GetEnvironmentVariable("BENCHMARK_ROUTES"), out var benchmarkRoutes);
+if (benchmarkRoutes > 0)
+{
+    var exceptionTypes = typeof(object).Assembly.GetExportedTypes()
+        .Where(type => typeof(Exception).IsAssignableFrom(type) && !type.IsAbstract && !type.ContainsGenericParameters)
+        .Where(type => type.GetConstructor(new[] { typeof(string) }) is not null)
+        .OrderBy(type => type.FullName, StringComparer.Ordinal)
+        .ToArray();
+
+    for (var i = 0; i < benchmarkRoutes; i++)
+    {
+        app.MapGet($"/benchmark/route{i}", (int? exception) =>
+        {
+            if (exception is int k)
+            {
+                var type = exceptionTypes[k % exceptionTypes.Length];
+                throw (Exception)Activator.CreateInstance(type, "benchmark exception")!;
+            }
+
+            return Results.Ok("ok");
+        });
+    }
+
+    app.MapGet("/benchmark/exception-types", () => Results.Ok(exceptionTypes.Length));
+
+    // Live managed heap after a full collection: read before and after a flush, the difference is what the
+    // flushed window's aggregations kept alive.
+    app.MapGet("/benchmark/memory", () => Results.Ok(GC.GetTotalMemory(forceFullCollection: true)));
+}
+
+// Test-only: force-flush the agent's tracer/meter providers and ServiceEvents (collectors, log and
+// metric pipelines) so the harness can assert without waiting for the 60s metric export cadence.
+// The app does not reference the distro, so the plugin's static ForceFlush is found by reflection in
+// the assemblies the auto-instrumentation loaded. 503 when the distro is not loaded or a flush timed out.
+app.MapPost("/test/flush", () =>
+{
+    var forceFlush = AppDomain.CurrentDomain.GetAssemblies()
+        .Select(assembly => assembly.GetType("AWS.Distro.OpenTelemetry.AutoInstrumentation.Plugin"))
+        .FirstOrDefault(type => type is not null)
+        ?.GetMethod("ForceFlush", new[] { typeof(int) });
+    var flushed = forceFlush?.Invoke(null, new object[] { 5000 }) as bool?;
+    return flushed == true ? Results.Ok("flushed") : Results.StatusCode(503);
+});
+
 // Signal readiness once Kestrel is listening so the contract-test harness's
 // wait_for_logs("Ready") returns.
 app.Lifetime.ApplicationStarted.Register(() => Console.WriteLine("Ready"));
@@ -1,22 +1,29 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from datetime import datetime, timedelta
-from logging import Logger, getLogger
-from time import sleep
-from typing import Callable, List, Set, TypeVar
+import asyncio
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar, Union
 
 from google.protobuf.internal.containers import RepeatedScalarFieldContainer
-from grpc import Channel, insecure_channel
+from grpc import Channel, StatusCode, aio, insecure_channel
 from mock_collector_service_pb2 import (
     ClearRequest,
+    ClearResponse,
     GetLogsRequest,
     GetLogsResponse,
     GetMetricsRequest,
     GetMetricsResponse,
     GetTracesRequest,
     GetTracesResponse,
+    Query,
+    QueryResult,
 )
+from mock_collector_projection import LazyExport, Projection, decode_all
+from mock_collector_query import Column, TelemetryQuery, result_from_proto
+from mock_collector_service import MockCollectorService
 from mock_collector_service_pb2_grpc import MockCollectorServiceStub
+from mock_collector_tables import LogTable, MetricTable, SpanTable
+from mock_collector_wait import FixedIntervalWait, WaitStrategy
 
 from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
 from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
@@ -25,11 +32,14 @@ from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord, ResourceLogs, ScopeL
 from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric, ResourceMetrics, ScopeMetrics
 from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span
 
-_logger: Logger = getLogger(__name__)
 _TIMEOUT_DELAY: timedelta = timedelta(seconds=20)
 _WAIT_INTERVAL_SEC: float = 0.1
 T: TypeVar = TypeVar("T")
 
+# Polls only look at these fields; full export requests are decoded once, after the wait is over.
+_METRIC_NAMES: Projection = Projection(ExportMetricsServiceRequest, ["resource_metrics.scope_metrics.metrics.name"])
+_LOG_ATTRIBUTES: Projection = Projection(ExportLogsServiceRequest, ["resource_logs.scope_logs.log_records.attributes"])
+
 
 class ResourceScopeSpan:
     """Data class used to correlate resources, scope and telemetry signals.
@@ -67,12 +77,109 @@ class ResourceScopeLogRecord:
         self.log_record: LogRecord = log_record
 
 
+class _LazyResourceScopeLogRecord(ResourceScopeLogRecord):
+    """`ResourceScopeLogRecord` located by index in an export request that is only decoded in full on first access."""
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, export: LazyExport[ExportLogsServiceRequest], position: Tuple[int, int, int]):
+        self._export: LazyExport[ExportLogsServiceRequest] = export
+        self._position: Tuple[int, int, int] = position
+
+    @property
+    def resource_logs(self) -> ResourceLogs:
+        return self._export.message.resource_logs[self._position[0]]
+
+    @property
+    def scope_logs(self) -> ScopeLogs:
+        return self.resource_logs.scope_logs[self._position[1]]
+
+    @property
+    def log_record(self) -> LogRecord:
+        return self.scope_logs.log_records[self._position[2]]
+
+
+class _InProcessContext:
+    """The part of `grpc.ServicerContext` that `MockCollectorService` uses, for calls that bypass gRPC."""
+
+    def abort(self, code: StatusCode, details: str) -> None:
+        raise ValueError(f"{code.name}: {details}")
+
+
+class _InProcessStub:
+    """Stands in for `MockCollectorServiceStub`, calling a `MockCollectorService` of this process directly."""
+
+    def __init__(self, service: MockCollectorService):
+        self._service: MockCollectorService = service
+        self._context: _InProcessContext = _InProcessContext()
+
+    def clear(self, request: ClearRequest) -> ClearResponse:
+        return self._service.clear(request, self._context)
+
+    def get_traces(self, request: GetTracesRequest) -> GetTracesResponse:
+        return self._service.get_traces(request, self._context)
+
+    def get_metrics(self, request: GetMetricsRequest) -> GetMetricsResponse:
+        return self._service.get_metrics(request, self._context)
+
+    def get_logs(self, request: GetLogsRequest) -> GetLogsResponse:
+        return self._service.get_logs(request, self._context)
+
+    def query(self, request: Query) -> QueryResult:
+        return self._service.query(request, self._context)
+
+
+class _AsyncInProcessStub:
+    """`_InProcessStub` for `AsyncMockCollectorClient`: the same direct calls, awaitable like `grpc.aio` ones."""
+
+    def __init__(self, service: MockCollectorService):
+        self._stub: _InProcessStub = _InProcessStub(service)
+
+    async def clear(self, request: ClearRequest) -> ClearResponse:
+        return self._stub.clear(request)
+
+    async def get_traces(self, request: GetTracesRequest) -> GetTracesResponse:
+        return self._stub.get_traces(request)
+
+    async def get_metrics(self, request: GetMetricsRequest) -> GetMetricsResponse:
+        return self._stub.get_metrics(request)
+
+    async def get_logs(self, request: GetLogsRequest) -> GetLogsResponse:
+        return self._stub.get_logs(request)
+
+
 class MockCollectorClient:
     """The mock collector client is used to interact with the Mock collector image, used in the tests."""
 
-    def __init__(self, mock_collector_address: str, mock_collector_port: str):
-        channel: Channel = insecure_channel(f"{mock_collector_address}:{mock_collector_port}")
-        self.client: MockCollectorServiceStub = MockCollectorServiceStub(channel)
+    def __init__(
+        self,
+        mock_collector_address: str,
+        mock_collector_port: str,
+        wait_strategy: Optional[WaitStrategy] = None,
+        service: Optional[MockCollectorService] = None,
+    ):
+        self.mock_collector_address: str = mock_collector_address
+        self.mock_collector_port: str = mock_collector_port
+        # The metrics settle condition counts exports between two polls, so it relies on a fixed interval.
+        self.wait_strategy: WaitStrategy = wait_strategy or _default_wait_strategy()
+        self._service: Optional[MockCollectorService] = service
+        self.client: Union[MockCollectorServiceStub, _InProcessStub]
+        if service is not None:
+            self.client = _InProcessStub(service)
+        else:
+            channel: Channel = insecure_channel(f"{mock_collector_address}:{mock_collector_port}")
+            self.client = MockCollectorServiceStub(channel)
+
+    @classmethod
+    def in_process(
+        cls, service: MockCollectorService, wait_strategy: Optional[WaitStrategy] = None
+    ) -> "MockCollectorClient":
+        """A client of a collector started in this process (see `mock_collector_server.start_server`).
+
+        Polls call the collector's service directly instead of going through a gRPC channel, so nothing is sent over
+        HTTP/2. The service still serializes the stored exports and the client decodes them, as over gRPC, since the
+        waits and decoders work on serialized exports. Invalid queries raise `ValueError` instead of `grpc.RpcError`.
+        """
+        return cls("in-process", "", wait_strategy, service)
 
     def clear_signals(self) -> None:
         """Clear all the signals in the backend collector"""
@@ -85,23 +192,45 @@ class MockCollectorClient:
             List of `ResourceScopeSpan` which is essentially a flat list containing all the spans and their related
             scope and resources.
         """
+        return list(self.iter_spans())
 
-        def get_export() -> List[ExportTraceServiceRequest]:
-            response: GetTracesResponse = self.client.get_traces(GetTracesRequest())
-            serialized_traces: RepeatedScalarFieldContainer[bytes] = response.traces
-            return list(map(ExportTraceServiceRequest.FromString, serialized_traces))
+    def iter_spans(self, *predicates: Callable[[ResourceScopeSpan], bool]) -> Iterator[ResourceScopeSpan]:
+        """Stream the spans stored in the collector, keeping those that satisfy every predicate.
 
-        def wait_condition(exported: List[ExportTraceServiceRequest], current: List[ExportTraceServiceRequest]) -> bool:
-            return 0 < len(exported) == len(current)
+        Waits like `get_traces` when iteration starts, then decodes one export request at a time, so a caller that
+        does not keep the records holds at most one decoded request and can stop early.
+        """
+        return _select(_iter_spans(self._wait_for_traces()), predicates)
+
+    def get_traces_and_metrics(
+        self, present_metrics: Set[str], exact_match=True
+    ) -> Tuple[List[ResourceScopeSpan], List[ResourceScopeMetric]]:
+        """Like `get_traces` followed by `get_metrics`, but both waits run concurrently under one timeout.
 
-        exported_traces: List[ExportTraceServiceRequest] = _wait_for_content(get_export, wait_condition)
-        spans: List[ResourceScopeSpan] = []
-        for exported_trace in exported_traces:
-            for resource_span in exported_trace.resource_spans:
-                for scope_span in resource_span.scope_spans:
-                    for span in scope_span.spans:
-                        spans.append(ResourceScopeSpan(resource_span, scope_span, span))
-        return spans
+        Returns:
+            Tuple of the `get_traces` and `get_metrics` results.
+        """
+
+        async def gather() -> Tuple[List[ResourceScopeSpan], List[ResourceScopeMetric]]:
+            async with AsyncMockCollectorClient(
+                self.mock_collector_address, self.mock_collector_port, self.wait_strategy, self._service
+            ) as client:
+                return await client.get_traces_and_metrics(present_metrics, exact_match)
+
+        return asyncio.run(gather())
+
+    def get_span_table(self) -> SpanTable:
+        """Like `get_traces`, but returns the spans as a columnar `SpanTable`.
+
+        Returns:
+            `SpanTable` with one row per span, built in one pass without per-span Python objects.
+        """
+        return SpanTable.from_exports(decode_all(self._wait_for_traces(), ExportTraceServiceRequest))
+
+    def peek_span_table(self) -> SpanTable:
+        """Like `get_span_table`, but non-blocking: the spans stored right now, an empty table if there are none."""
+        response: GetTracesResponse = self.client.get_traces(GetTracesRequest())
+        return SpanTable.from_exports(decode_all(response.traces, ExportTraceServiceRequest))
 
     def get_metrics(self, present_metrics: Set[str], exact_match=True) -> List[ResourceScopeMetric]:
         """Get all metrics that are currently stored in the mock collector.
@@ -110,35 +239,25 @@ class MockCollectorClient:
              List of `ResourceScopeMetric` which is a flat list containing all metrics and their related scope and
              resources.
         """
+        return list(self.iter_metrics(present_metrics, exact_match=exact_match))
 
-        present_metrics_lower: Set[str] = {s.lower() for s in present_metrics}
+    def iter_metrics(
+        self, present_metrics: Set[str], *predicates: Callable[[ResourceScopeMetric], bool], exact_match=True
+    ) -> Iterator[ResourceScopeMetric]:
+        """Stream the metrics stored in the mock collector, keeping those that satisfy every predicate.
 
-        def get_export() -> List[ExportMetricsServiceRequest]:
-            response: GetMetricsResponse = self.client.get_metrics(GetMetricsRequest())
-            serialized_metrics: RepeatedScalarFieldContainer[bytes] = response.metrics
-            return list(map(ExportMetricsServiceRequest.FromString, serialized_metrics))
-
-        def wait_condition(
-            exported: List[ExportMetricsServiceRequest], current: List[ExportMetricsServiceRequest]
-        ) -> bool:
-            received_metrics: Set[str] = set()
-            for exported_metric in current:
-                for resource_metric in exported_metric.resource_metrics:
-                    for scope_metric in resource_metric.scope_metrics:
-                        for metric in scope_metric.metrics:
-                            received_metrics.add(metric.name.lower())
-            if exact_match:
-                return 0 < len(exported) == (len(current) - 2) and present_metrics_lower.issubset(received_metrics)
-            return present_metrics_lower.issubset(received_metrics)
-
-        exported_metrics: List[ExportMetricsServiceRequest] = _wait_for_content(get_export, wait_condition)
-        metrics: List[ResourceScopeMetric] = []
-        for exported_metric in exported_metrics:
-            for resource_metric in exported_metric.resource_metrics:
-                for scope_metric in resource_metric.scope_metrics:
-                    for metric in scope_metric.metrics:
-                        metrics.append(ResourceScopeMetric(resource_metric, scope_metric, metric))
-        return metrics
+        Waits like `get_metrics` when iteration starts, then decodes one export request at a time.
+        """
+        return _select(_iter_metrics(self._wait_for_metrics(present_metrics, exact_match)), predicates)
+
+    def get_metric_table(self, present_metrics: Set[str], exact_match=True) -> MetricTable:
+        """Like `get_metrics`, but returns the data points as a columnar `MetricTable`.
+
+        Returns:
+            `MetricTable` with one row per data point of every metric stored in the mock collector.
+        """
+        serialized_metrics: List[bytes] = self._wait_for_metrics(present_metrics, exact_match)
+        return MetricTable.from_exports(decode_all(serialized_metrics, ExportMetricsServiceRequest))
 
     def get_logs(self) -> List[ResourceScopeLogRecord]:
         """Get all logs that are currently stored in the mock collector.
@@ -147,69 +266,284 @@ class MockCollectorClient:
             List of `ResourceScopeLogRecord` which is a flat list containing all log records and their related
             scope and resources.
         """
+        return list(self.iter_logs())
 
-        def get_export() -> List[ExportLogsServiceRequest]:
-            response: GetLogsResponse = self.client.get_logs(GetLogsRequest())
-            serialized_logs: RepeatedScalarFieldContainer[bytes] = response.logs
-            return list(map(ExportLogsServiceRequest.FromString, serialized_logs))
+    def iter_logs(self, *predicates: Callable[[ResourceScopeLogRecord], bool]) -> Iterator[ResourceScopeLogRecord]:
+        """Stream the log records stored in the mock collector, keeping those that satisfy every predicate.
+
+        Waits like `get_logs` when iteration starts, then decodes one export request at a time.
+        """
+        return _select(_iter_logs(self._wait_for_logs()), predicates)
 
-        def wait_condition(exported: List[ExportLogsServiceRequest], current: List[ExportLogsServiceRequest]) -> bool:
-            return 0 < len(exported) == len(current)
+    def get_log_table(self) -> LogTable:
+        """Like `get_logs`, but returns the records as a columnar `LogTable`.
 
-        exported_logs: List[ExportLogsServiceRequest] = _wait_for_content(get_export, wait_condition)
-        records: List[ResourceScopeLogRecord] = []
-        for exported_log in exported_logs:
-            for resource_log in exported_log.resource_logs:
-                for scope_log in resource_log.scope_logs:
-                    for log_record in scope_log.log_records:
-                        records.append(ResourceScopeLogRecord(resource_log, scope_log, log_record))
-        return records
+        Returns:
+            `LogTable` with one row per log record stored in the mock collector.
+        """
+        return LogTable.from_exports(decode_all(self._wait_for_logs(), ExportLogsServiceRequest))
 
     def get_logs_by_event_name(self, event_name: str) -> List[ResourceScopeLogRecord]:
-        """Get log records matching a specific event.name attribute value."""
-        return [
-            r
-            for r in self.get_logs()
-            if any(kv.key == "event.name" and kv.value.string_value == event_name for kv in r.log_record.attributes)
-        ]
+        """Get log records matching a specific event.name attribute value.
+
+        Only the log record attributes are decoded to find the matches; resource, scope, body and the rest of each
+        record are decoded when first accessed.
+        """
+        return _filter_by_event_name(self._wait_for_logs(), event_name)
+
+    def peek_traces(self) -> List[ResourceScopeSpan]:
+        """Return all spans currently stored without waiting for new ones. Safe when empty."""
+        response: GetTracesResponse = self.client.get_traces(GetTracesRequest())
+        return list(_iter_spans(response.traces))
+
+    def peek_metrics(self) -> List[ResourceScopeMetric]:
+        """Return all metrics currently stored without waiting for new ones. Safe when empty."""
+        response: GetMetricsResponse = self.client.get_metrics(GetMetricsRequest())
+        return list(_iter_metrics(response.metrics))
 
     def peek_logs(self) -> List[ResourceScopeLogRecord]:
         """Return all logs currently stored without waiting for new ones. Safe when empty."""
         response: GetLogsResponse = self.client.get_logs(GetLogsRequest())
-        serialized_logs: RepeatedScalarFieldContainer[bytes] = response.logs
-        exported_logs: List[ExportLogsServiceRequest] = list(map(ExportLogsServiceRequest.FromString, serialized_logs))
-        records: List[ResourceScopeLogRecord] = []
-        for exported_log in exported_logs:
-            for resource_log in exported_log.resource_logs:
-                for scope_log in resource_log.scope_logs:
-                    for log_record in scope_log.log_records:
-                        records.append(ResourceScopeLogRecord(resource_log, scope_log, log_record))
-        return records
+        return list(_iter_logs(response.logs))
 
     def peek_logs_by_event_name(self, event_name: str) -> List[ResourceScopeLogRecord]:
         """Like get_logs_by_event_name but non-blocking — returns empty list if no logs."""
-        return [
-            r
-            for r in self.peek_logs()
-            if any(kv.key == "event.name" and kv.value.string_value == event_name for kv in r.log_record.attributes)
-        ]
-
-
-def _wait_for_content(get_export: Callable[[], List[T]], wait_condition: Callable[[List[T], List[T]], bool]) -> List[T]:
-    # Verify that there is no more data to be received
-    deadline: datetime = datetime.now() + _TIMEOUT_DELAY
-    exported: List[T] = []
-
-    while deadline > datetime.now():
-        try:
-            current_exported: List[T] = get_export()
-            if wait_condition(exported, current_exported):
-                return current_exported
-            exported = current_exported
-
-            sleep(_WAIT_INTERVAL_SEC)
-        # pylint: disable=broad-exception-caught
-        except Exception:
-            _logger.exception("Error while reading content")
-
-    raise RuntimeError("Timeout waiting for content")
+        response: GetLogsResponse = self.client.get_logs(GetLogsRequest())
+        return _filter_by_event_name(response.logs, event_name)
+
+    def get_export_counts(self) -> Dict[str, int]:
+        """Number of export requests stored right now per signal ("traces", "metrics", "logs"), without waiting."""
+        return {
+            "traces": len(self.client.get_traces(GetTracesRequest()).traces),
+            "metrics": len(self.client.get_metrics(GetMetricsRequest()).metrics),
+            "logs": len(self.client.get_logs(GetLogsRequest()).logs),
+        }
+
+    def get_export_sizes(self) -> Dict[str, int]:
+        """Total serialized size in bytes of the export requests stored right now per signal, without waiting."""
+        return {
+            "traces": sum(len(export) for export in self.client.get_traces(GetTracesRequest()).traces),
+            "metrics": sum(len(export) for export in self.client.get_metrics(GetMetricsRequest()).metrics),
+            "logs": sum(len(export) for export in self.client.get_logs(GetLogsRequest()).logs),
+        }
+
+    def query(self, query: TelemetryQuery, sum_column: Optional[Column] = None) -> Any:
+        """Evaluate `query` in the mock collector over the telemetry stored right now, without waiting.
+
+        Returns:
+            The count (or the sum of `sum_column`) of the matching rows, or a dict of group key tuple to aggregate
+            when the query is grouped. Only the aggregate crosses the wire.
+        """
+        aggregate: str = "count" if sum_column is None else "sum"
+        result: QueryResult = self.client.query(query.to_proto(aggregate, sum_column))
+        return result_from_proto(result, grouped=bool(query.groups), is_count=sum_column is None)
+
+    def _wait_for_traces(self) -> List[bytes]:
+        def get_export() -> List[bytes]:
+            response: GetTracesResponse = self.client.get_traces(GetTracesRequest())
+            serialized_traces: RepeatedScalarFieldContainer[bytes] = response.traces
+            return list(serialized_traces)
+
+        return self.wait_strategy.until(get_export, _settled(_count_settled), "traces")
+
+    def _wait_for_metrics(self, present_metrics: Set[str], exact_match: bool) -> List[bytes]:
+        def get_export() -> List[bytes]:
+            response: GetMetricsResponse = self.client.get_metrics(GetMetricsRequest())
+            serialized_metrics: RepeatedScalarFieldContainer[bytes] = response.metrics
+            return list(serialized_metrics)
+
+        return self.wait_strategy.until(
+            get_export, _settled(_metrics_settled(present_metrics, exact_match)), f"metrics {sorted(present_metrics)}"
+        )
+
+    def _wait_for_logs(self) -> List[bytes]:
+        def get_export() -> List[bytes]:
+            response: GetLogsResponse = self.client.get_logs(GetLogsRequest())
+            serialized_logs: RepeatedScalarFieldContainer[bytes] = response.logs
+            return list(serialized_logs)
+
+        return self.wait_strategy.until(get_export, _settled(_count_settled), "logs")
+
+
+class AsyncMockCollectorClient:
+    """`grpc.aio` variant of `MockCollectorClient` whose waits can run concurrently.
+
+    Every wait takes an optional `deadline` (in `loop.time()` seconds), so waits gathered together share one deadline
+    instead of each getting their own timeout. Must be created and used inside one running event loop; use it as an
+    async context manager to close the channel. Given a `service`, it calls that collector of this process directly,
+    like `MockCollectorClient.in_process`, and opens no channel.
+    """
+
+    def __init__(
+        self,
+        mock_collector_address: str,
+        mock_collector_port: str,
+        wait_strategy: Optional[WaitStrategy] = None,
+        service: Optional[MockCollectorService] = None,
+    ):
+        self.wait_strategy: WaitStrategy = wait_strategy or _default_wait_strategy()
+        self._channel: Optional[aio.Channel] = None
+        self.client: Union[MockCollectorServiceStub, _AsyncInProcessStub]
+        if service is not None:
+            self.client = _AsyncInProcessStub(service)
+        else:
+            self._channel = aio.insecure_channel(f"{mock_collector_address}:{mock_collector_port}")
+            self.client = MockCollectorServiceStub(self._channel)
+
+    async def __aenter__(self) -> "AsyncMockCollectorClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._channel is not None:
+            await self._channel.close()
+
+    async def clear_signals(self) -> None:
+        await self.client.clear(ClearRequest())
+
+    async def get_traces(self, deadline: Optional[float] = None) -> List[ResourceScopeSpan]:
+        async def get_export() -> List[bytes]:
+            response: GetTracesResponse = await self.client.get_traces(GetTracesRequest())
+            return list(response.traces)
+
+        serialized_traces: List[bytes] = await self.wait_strategy.until_async(
+            get_export, _settled(_count_settled), "traces", deadline
+        )
+        return list(_iter_spans(serialized_traces))
+
+    async def get_metrics(
+        self, present_metrics: Set[str], exact_match=True, deadline: Optional[float] = None
+    ) -> List[ResourceScopeMetric]:
+        async def get_export() -> List[bytes]:
+            response: GetMetricsResponse = await self.client.get_metrics(GetMetricsRequest())
+            return list(response.metrics)
+
+        serialized_metrics: List[bytes] = await self.wait_strategy.until_async(
+            get_export, _settled(_metrics_settled(present_metrics, exact_match)), "metrics", deadline
+        )
+        return list(_iter_metrics(serialized_metrics))
+
+    async def get_logs(self, deadline: Optional[float] = None) -> List[ResourceScopeLogRecord]:
+        async def get_export() -> List[bytes]:
+            response: GetLogsResponse = await self.client.get_logs(GetLogsRequest())
+            return list(response.logs)
+
+        serialized_logs: List[bytes] = await self.wait_strategy.until_async(
+            get_export, _settled(_count_settled), "logs", deadline
+        )
+        return list(_iter_logs(serialized_logs))
+
+    async def get_traces_and_metrics(
+        self, present_metrics: Set[str], exact_match=True
+    ) -> Tuple[List[ResourceScopeSpan], List[ResourceScopeMetric]]:
+        """Wait for traces and metrics concurrently, under one shared deadline."""
+        deadline: float = asyncio.get_running_loop().time() + self.wait_strategy.timeout
+        spans, metrics = await asyncio.gather(
+            self.get_traces(deadline), self.get_metrics(present_metrics, exact_match, deadline)
+        )
+        return spans, metrics
+
+
+def span_named(name: str) -> Callable[[ResourceScopeSpan], bool]:
+    return lambda record: record.span.name == name
+
+
+def span_of_kind(kind: int) -> Callable[[ResourceScopeSpan], bool]:
+    return lambda record: record.span.kind == kind
+
+
+def span_attribute_is(key: str, value: str) -> Callable[[ResourceScopeSpan], bool]:
+    return lambda record: any(kv.key == key and kv.value.string_value == value for kv in record.span.attributes)
+
+
+def metric_named(name: str) -> Callable[[ResourceScopeMetric], bool]:
+    return lambda record: record.metric.name.lower() == name.lower()
+
+
+def log_event_named(event_name: str) -> Callable[[ResourceScopeLogRecord], bool]:
+    return lambda record: _has_event_name(record.log_record, event_name)
+
+
+def _select(records: Iterable[T], predicates: Sequence[Callable[[T], bool]]) -> Iterator[T]:
+    for record in records:
+        if all(predicate(record) for predicate in predicates):
+            yield record
+
+
+def _iter_spans(serialized_traces: Iterable[bytes]) -> Iterator[ResourceScopeSpan]:
+    for serialized_trace in serialized_traces:
+        for resource_span in ExportTraceServiceRequest.FromString(serialized_trace).resource_spans:
+            for scope_span in resource_span.scope_spans:
+                for span in scope_span.spans:
+                    yield ResourceScopeSpan(resource_span, scope_span, span)
+
+
+def _iter_metrics(serialized_metrics: Iterable[bytes]) -> Iterator[ResourceScopeMetric]:
+    for serialized_metric in serialized_metrics:
+        for resource_metric in ExportMetricsServiceRequest.FromString(serialized_metric).resource_metrics:
+            for scope_metric in resource_metric.scope_metrics:
+                for metric in scope_metric.metrics:
+                    yield ResourceScopeMetric(resource_metric, scope_metric, metric)
+
+
+def _iter_logs(serialized_logs: Iterable[bytes]) -> Iterator[ResourceScopeLogRecord]:
+    for serialized_log in serialized_logs:
+        for resource_log in ExportLogsServiceRequest.FromString(serialized_log).resource_logs:
+            for scope_log in resource_log.scope_logs:
+                for log_record in scope_log.log_records:
+                    yield ResourceScopeLogRecord(resource_log, scope_log, log_record)
+
+
+def _has_event_name(log_record: LogRecord, event_name: str) -> bool:
+    return any(kv.key == "event.name" and kv.value.string_value == event_name for kv in log_record.attributes)
+
+
+def _filter_by_event_name(serialized_logs: Iterable[bytes], event_name: str) -> List[ResourceScopeLogRecord]:
+    records: List[ResourceScopeLogRecord] = []
+    for serialized_log in serialized_logs:
+        export: LazyExport[ExportLogsServiceRequest] = LazyExport(serialized_log, ExportLogsServiceRequest)
+        for resource_index, resource_log in enumerate(_LOG_ATTRIBUTES.decode(serialized_log).resource_logs):
+            for scope_index, scope_log in enumerate(resource_log.scope_logs):
+                for record_index, log_record in enumerate(scope_log.log_records):
+                    if _has_event_name(log_record, event_name):
+                        records.append(_LazyResourceScopeLogRecord(export, (resource_index, scope_index, record_index)))
+    return records
+
+
+def _count_settled(exported: List[bytes], current: List[bytes]) -> bool:
+    return 0 < len(exported) == len(current)
+
+
+def _metrics_settled(present_metrics: Set[str], exact_match: bool) -> Callable[[List[bytes], List[bytes]], bool]:
+    present_metrics_lower: Set[str] = {s.lower() for s in present_metrics}
+
+    def wait_condition(exported: List[bytes], current: List[bytes]) -> bool:
+        received_metrics: Set[str] = set()
+        for serialized_metric in current:
+            for resource_metric in _METRIC_NAMES.decode(serialized_metric).resource_metrics:
+                for scope_metric in resource_metric.scope_metrics:
+                    for metric in scope_metric.metrics:
+                        received_metrics.add(metric.name.lower())
+        if exact_match:
+            return 0 < len(exported) == (len(current) - 2) and present_metrics_lower.issubset(received_metrics)
+        return present_metrics_lower.issubset(received_metrics)
+
+    return wait_condition
+
+
+def _settled(condition: Callable[[List[T], List[T]], bool]) -> Callable[[List[T]], bool]:
+    """Adapt a condition on (previous poll, current poll) to the single-result form `WaitStrategy` takes."""
+    previous: List[List[T]] = [[]]
+
+    def done(current: List[T]) -> bool:
+        settled: bool = condition(previous[0], current)
+        previous[0] = current
+        return settled
+
+    return done
+
+
+def _default_wait_strategy() -> WaitStrategy:
+    return FixedIntervalWait(_WAIT_INTERVAL_SEC, _TIMEOUT_DELAY.total_seconds())
@@ -0,0 +1,181 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Turns stdout of an application container into a log signal source for the mock collector.
+
+In Lambda the distro writes logs with `CompactConsoleLogRecordExporter`: one JSON object per line on stdout, with
+keys resource, scope, body, severityNumber, severityText, attributes, droppedAttributes, timeUnixNano,
+observedTimeUnixNano, traceId, spanId, flags (and exportPath when ADOT_TEST_EXPORT_PATH_ENABLED). `ConsoleLogForwarder`
+follows a container's stdout, recognizes those lines, converts each to an OTLP `ExportLogsServiceRequest` and exports
+it to the mock collector's OTLP logs receiver, so the records are stored alongside other logs and are returned by
+`MockCollectorClient.get_logs()`. Any other output (application prints, the exporter's serialization-failure fallback,
+multi-line console output) is counted and skipped.
+"""
+import json
+import threading
+from logging import Logger, getLogger
+from typing import Any, Dict, Iterable, List, Optional
+
+from grpc import Channel, insecure_channel
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2_grpc import LogsServiceStub
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, InstrumentationScope, KeyValue
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord, ResourceLogs, ScopeLogs
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+
+_logger: Logger = getLogger(__name__)
+_COMPACT_LOG_KEYS: frozenset = frozenset(
+    {"resource", "scope", "severityNumber", "severityText", "attributes", "timeUnixNano", "traceId", "spanId"}
+)
+
+
+class ConsoleLogStats:
+    """Counters for one forwarder; bytes are of the raw stdout lines, newline excluded."""
+
+    def __init__(self):
+        self.lines: int = 0
+        self.bytes: int = 0
+        self.compact_log_lines: int = 0
+        self.compact_log_bytes: int = 0
+        self.forwarded: int = 0
+        self.failed: int = 0
+
+
+class ConsoleLogForwarder:
+    """Forwards compact console logs from a stream of stdout chunks to the mock collector, in a background thread.
+
+    `output` is any iterable of byte chunks, typically
+    `container.get_wrapped_container().logs(stdout=True, stderr=False, stream=True, follow=True)`. Chunks need not be
+    line aligned. The thread ends when the stream does, i.e. when the container stops.
+    """
+
+    def __init__(self, output: Iterable[bytes], mock_collector_address: str, mock_collector_port: str):
+        channel: Channel = insecure_channel(f"{mock_collector_address}:{mock_collector_port}")
+        self._client: LogsServiceStub = LogsServiceStub(channel)
+        self._output: Iterable[bytes] = output
+        self._lock: threading.Lock = threading.Lock()
+        self._stats: ConsoleLogStats = ConsoleLogStats()
+        self._thread: threading.Thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def join(self, timeout: float) -> None:
+        """Wait for the stream to end, e.g. after the container was stopped."""
+        self._thread.join(timeout)
+
+    @property
+    def stats(self) -> ConsoleLogStats:
+        with self._lock:
+            snapshot: ConsoleLogStats = ConsoleLogStats()
+            snapshot.__dict__.update(self._stats.__dict__)
+            return snapshot
+
+    def _run(self) -> None:
+        pending: bytes = b""
+        try:
+            for chunk in self._output:
+                lines: List[bytes] = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    self._handle_line(line)
+            if pending:
+                self._handle_line(pending)
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            _logger.exception("Error while reading console output")
+
+    def _handle_line(self, line: bytes) -> None:
+        line = line.rstrip(b"\r")
+        request: Optional[ExportLogsServiceRequest] = parse_compact_log_line(line)
+        with self._lock:
+            self._stats.lines += 1
+            self._stats.bytes += len(line)
+            if request is not None:
+                self._stats.compact_log_lines += 1
+                self._stats.compact_log_bytes += len(line)
+        if request is None:
+            return
+        try:
+            self._client.Export(request)
+            with self._lock:
+                self._stats.forwarded += 1
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            _logger.exception("Failed to forward console log record")
+            with self._lock:
+                self._stats.failed += 1
+
+
+def parse_compact_log_line(line: bytes) -> Optional[ExportLogsServiceRequest]:
+    """Return the OTLP export request for a compact console log line, or None if the line is not a well-formed one."""
+    stripped: bytes = line.strip()
+    if not stripped.startswith(b"{"):
+        return None
+    try:
+        document: Any = json.loads(stripped)
+    except ValueError:
+        return None
+    if not isinstance(document, dict) or not _COMPACT_LOG_KEYS.issubset(document):
+        return None
+    # A line with the compact keys but malformed values (e.g. a non-hex traceId) is skipped like any other output;
+    # raising would end the forwarder thread and drop every later line.
+    try:
+        return compact_log_to_export_request(document)
+    except (TypeError, ValueError):
+        return None
+
+
+def compact_log_to_export_request(document: Dict[str, Any]) -> ExportLogsServiceRequest:
+    resource: Dict[str, Any] = document.get("resource") or {}
+    scope: Dict[str, Any] = document.get("scope") or {}
+    resource_logs: ResourceLogs = ResourceLogs(
+        resource=Resource(attributes=to_key_values(resource.get("attributes") or {})),
+        schema_url=resource.get("schemaUrl") or "",
+    )
+    scope_logs: ScopeLogs = resource_logs.scope_logs.add(
+        scope=InstrumentationScope(name=scope.get("name") or "", version=scope.get("version") or ""),
+        schema_url=scope.get("schemaUrl") or "",
+    )
+    log_record: LogRecord = scope_logs.log_records.add(
+        time_unix_nano=int(document.get("timeUnixNano") or 0),
+        observed_time_unix_nano=int(document.get("observedTimeUnixNano") or 0),
+        severity_number=int(document.get("severityNumber") or 0),
+        severity_text=document.get("severityText") or "",
+        attributes=to_key_values(document.get("attributes") or {}),
+        dropped_attributes_count=int(document.get("droppedAttributes") or 0),
+        flags=int(document.get("flags") or 0),
+        trace_id=bytes.fromhex(document.get("traceId") or ""),
+        span_id=bytes.fromhex(document.get("spanId") or ""),
+    )
+    if document.get("body") is not None:
+        log_record.body.CopyFrom(to_any_value(document["body"]))
+    return ExportLogsServiceRequest(resource_logs=[resource_logs])
+
+
+def to_key_values(values: Dict[str, Any]) -> List[KeyValue]:
+    """Convert a JSON object of attributes into OTLP `KeyValue`s, preserving value types."""
+    return [KeyValue(key=key, value=to_any_value(value)) for key, value in values.items()]
+
+
+def to_any_value(value: Any) -> AnyValue:
+    """Convert a JSON value into an OTLP `AnyValue`. `None` becomes an empty `AnyValue`."""
+    # bool is checked before int because it is a subclass of it.
+    if isinstance(value, bool):
+        return AnyValue(bool_value=value)
+    if isinstance(value, int):
+        return AnyValue(int_value=value)
+    if isinstance(value, float):
+        return AnyValue(double_value=value)
+    if isinstance(value, str):
+        return AnyValue(string_value=value)
+    if isinstance(value, list):
+        any_value: AnyValue = AnyValue()
+        any_value.array_value.values.extend(to_any_value(item) for item in value)
+        return any_value
+    if isinstance(value, dict):
+        any_value = AnyValue()
+        any_value.kvlist_value.values.extend(to_key_values(value))
+        return any_value
+    return AnyValue()
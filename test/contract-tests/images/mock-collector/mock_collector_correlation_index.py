@@ -0,0 +1,138 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Joins between captured spans, log records and metric exemplars on their `(trace_id, span_id)`.
+
+Log records carry the ids of the span that was active when they were emitted (for ServiceEvents, incident snapshots
+of sampled requests), and metric data points may carry exemplars pointing at the span that recorded the measurement.
+`CorrelationIndex` hashes all three signals by that key once, so joins such as "spans referenced by incident snapshot
+logs" or "exemplars whose span was never exported" are dictionary lookups, and `completeness()` summarizes how much of
+the captured telemetry can be joined back to a span.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from mock_collector_client import ResourceScopeLogRecord, ResourceScopeMetric, ResourceScopeSpan
+
+from opentelemetry.proto.metrics.v1.metrics_pb2 import Exemplar
+
+SpanKey = Tuple[bytes, bytes]
+
+
+class MetricExemplar:
+    """Data class used to correlate an exemplar with its metric and data point."""
+
+    def __init__(self, resource_scope_metric: ResourceScopeMetric, data_point, exemplar: Exemplar):
+        self.resource_scope_metric: ResourceScopeMetric = resource_scope_metric
+        self.data_point = data_point
+        self.exemplar: Exemplar = exemplar
+
+
+class CorrelationCompleteness:
+    """Share of the log records and exemplars with trace context whose span was captured."""
+
+    def __init__(
+        self, spans: int, logs: int, logs_with_context: int, logs_joined: int, exemplars: int, exemplars_joined: int
+    ):
+        self.spans: int = spans
+        self.logs: int = logs
+        self.logs_with_context: int = logs_with_context
+        self.logs_joined: int = logs_joined
+        self.exemplars: int = exemplars
+        self.exemplars_joined: int = exemplars_joined
+
+    @property
+    def log_ratio(self) -> float:
+        return self.logs_joined / self.logs_with_context if self.logs_with_context else 1.0
+
+    @property
+    def exemplar_ratio(self) -> float:
+        return self.exemplars_joined / self.exemplars if self.exemplars else 1.0
+
+    def to_report(self) -> Dict[str, float]:
+        report: Dict[str, float] = dict(self.__dict__)
+        report["log_ratio"] = self.log_ratio
+        report["exemplar_ratio"] = self.exemplar_ratio
+        return report
+
+
+class CorrelationIndex:
+    """Spans, log records and exemplars hashed by `(trace_id, span_id)`.
+
+    Log records and exemplars without trace context are kept out of the index; they are counted in `completeness()`.
+    """
+
+    def __init__(
+        self,
+        spans: Iterable[ResourceScopeSpan] = (),
+        logs: Iterable[ResourceScopeLogRecord] = (),
+        metrics: Iterable[ResourceScopeMetric] = (),
+    ):
+        self._spans: Dict[SpanKey, ResourceScopeSpan] = {}
+        self._logs: Dict[SpanKey, List[ResourceScopeLogRecord]] = {}
+        self._exemplars: Dict[SpanKey, List[MetricExemplar]] = {}
+        self._log_count: int = 0
+
+        for record in spans:
+            self._spans[(record.span.trace_id, record.span.span_id)] = record
+        for record in logs:
+            self._log_count += 1
+            if record.log_record.trace_id and record.log_record.span_id:
+                key: SpanKey = (record.log_record.trace_id, record.log_record.span_id)
+                self._logs.setdefault(key, []).append(record)
+        for record in metrics:
+            data: Optional[str] = record.metric.WhichOneof("data")
+            # Summary data points have no exemplars.
+            if data is None or data == "summary":
+                continue
+            for data_point in getattr(record.metric, data).data_points:
+                for exemplar in data_point.exemplars:
+                    if exemplar.trace_id and exemplar.span_id:
+                        key = (exemplar.trace_id, exemplar.span_id)
+                        self._exemplars.setdefault(key, []).append(MetricExemplar(record, data_point, exemplar))
+
+    def span(self, key: SpanKey) -> Optional[ResourceScopeSpan]:
+        return self._spans.get(key)
+
+    def logs_for(self, key: SpanKey) -> List[ResourceScopeLogRecord]:
+        return list(self._logs.get(key, []))
+
+    def exemplars_for(self, key: SpanKey) -> List[MetricExemplar]:
+        return list(self._exemplars.get(key, []))
+
+    def spans_referenced_by_logs(
+        self, *predicates: Callable[[ResourceScopeLogRecord], bool]
+    ) -> List[ResourceScopeSpan]:
+        """Captured spans that at least one log record satisfying every predicate points at."""
+        return [
+            self._spans[key]
+            for key, records in self._logs.items()
+            if key in self._spans and any(all(p(record) for p in predicates) for record in records)
+        ]
+
+    def logs_without_span(self, *predicates: Callable[[ResourceScopeLogRecord], bool]) -> List[ResourceScopeLogRecord]:
+        """Log records with trace context, satisfying every predicate, whose span was not captured."""
+        return [
+            record
+            for key, records in self._logs.items()
+            if key not in self._spans
+            for record in records
+            if all(p(record) for p in predicates)
+        ]
+
+    def spans_referenced_by_exemplars(self) -> List[ResourceScopeSpan]:
+        return [self._spans[key] for key in self._exemplars if key in self._spans]
+
+    def exemplars_without_span(self) -> List[MetricExemplar]:
+        return [
+            exemplar for key, exemplars in self._exemplars.items() if key not in self._spans for exemplar in exemplars
+        ]
+
+    def completeness(self) -> CorrelationCompleteness:
+        return CorrelationCompleteness(
+            spans=len(self._spans),
+            logs=self._log_count,
+            logs_with_context=sum(len(records) for records in self._logs.values()),
+            logs_joined=sum(len(records) for key, records in self._logs.items() if key in self._spans),
+            exemplars=sum(len(exemplars) for exemplars in self._exemplars.values()),
+            exemplars_joined=sum(len(exemplars) for key, exemplars in self._exemplars.items() if key in self._spans),
+        )
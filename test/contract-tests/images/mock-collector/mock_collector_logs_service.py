@@ -11,7 +11,10 @@ from opentelemetry.proto.collector.logs.v1.logs_service_pb2_grpc import LogsServ
 
 
 class MockCollectorLogsService(LogsServiceServicer):
-    _export_requests: Queue = Queue(maxsize=-1)
+    def __init__(self):
+        super().__init__()
+        # Per instance, so that several collectors can run in one process (see `mock_collector_server.start_server`).
+        self._export_requests: Queue = Queue(maxsize=-1)
 
     def get_requests(self) -> List[ExportLogsServiceRequest]:
         with self._export_requests.mutex:
@@ -14,7 +14,10 @@ from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2_grpc import Me
 
 
 class MockCollectorMetricsService(MetricsServiceServicer):
-    _export_requests: Queue = Queue(maxsize=-1)
+    def __init__(self):
+        super().__init__()
+        # Per instance, so that several collectors can run in one process (see `mock_collector_server.start_server`).
+        self._export_requests: Queue = Queue(maxsize=-1)
 
     def get_requests(self) -> List[ExportMetricsServiceRequest]:
         with self._export_requests.mutex:
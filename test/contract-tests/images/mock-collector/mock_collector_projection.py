@@ -0,0 +1,124 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Partial decoding of OTLP export requests.
+
+A `Projection` is a message class generated at runtime from a real message descriptor, keeping only the fields named
+by a list of dotted paths (e.g. `resource_metrics.scope_metrics.metrics.name`). Parsing serialized bytes with it only
+materializes those fields; everything else is skipped as unknown data, so no nested messages are built for spans,
+data points or attributes the caller does not look at. A path that stops at a message field keeps that field's full
+type, e.g. `...log_records.attributes` decodes complete `KeyValue`s.
+
+`LazyExport` pairs the serialized bytes of one export request with a cached full decode, so a poll can look at a
+projection of every request and only fully decode the ones an assertion ends up touching.
+"""
+import hashlib
+from typing import Dict, Generic, Iterable, List, Optional, Set, Type, TypeVar
+
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+from google.protobuf.descriptor import Descriptor, FieldDescriptor, FileDescriptor
+from google.protobuf.message import Message
+
+M = TypeVar("M", bound=Message)
+_PathTree = Dict[str, "_PathTree"]
+
+
+class Projection:
+    """Decoder for the subset of `message_type` selected by `paths`."""
+
+    def __init__(self, message_type: Type[Message], paths: Iterable[str]):
+        tree: _PathTree = {}
+        for path in paths:
+            node: _PathTree = tree
+            for part in path.split("."):
+                node = node.setdefault(part, {})
+
+        descriptor: Descriptor = message_type.DESCRIPTOR
+        package: str = (
+            "projection_"
+            + hashlib.sha1((descriptor.full_name + "|" + "|".join(sorted(paths))).encode()).hexdigest()[:12]
+        )
+        file_proto: descriptor_pb2.FileDescriptorProto = descriptor_pb2.FileDescriptorProto(
+            name=f"{package}.proto", package=package, syntax="proto3"
+        )
+        dependencies: Set[str] = set()
+        _add_projected_message(descriptor, tree, file_proto, package, dependencies)
+        file_proto.dependency.extend(sorted(dependencies))
+
+        pool: descriptor_pool.DescriptorPool = descriptor_pool.DescriptorPool()
+        added: Set[str] = set()
+        for dependency in dependencies:
+            _add_file_with_dependencies(pool, descriptor_pool.Default().FindFileByName(dependency), added)
+        pool.Add(file_proto)
+        self._message_class: Type[Message] = message_factory.GetMessageClass(
+            pool.FindMessageTypeByName(f"{package}.{file_proto.message_type[0].name}")
+        )
+
+    def decode(self, data: bytes) -> Message:
+        return self._message_class.FromString(data)
+
+
+class LazyExport(Generic[M]):
+    """One serialized export request, decoded in full at most once and only when `message` is first accessed."""
+
+    __slots__ = ("data", "_message_type", "_message")
+
+    def __init__(self, data: bytes, message_type: Type[M]):
+        self.data: bytes = data
+        self._message_type: Type[M] = message_type
+        self._message: Optional[M] = None
+
+    @property
+    def message(self) -> M:
+        if self._message is None:
+            self._message = self._message_type.FromString(self.data)
+        return self._message
+
+
+def decode_all(serialized: Iterable[bytes], message_type: Type[M]) -> List[M]:
+    return [message_type.FromString(data) for data in serialized]
+
+
+def _add_projected_message(
+    descriptor: Descriptor,
+    tree: _PathTree,
+    file_proto: descriptor_pb2.FileDescriptorProto,
+    package: str,
+    dependencies: Set[str],
+) -> str:
+    name: str = f"P{len(file_proto.message_type)}_{descriptor.name}"
+    message_proto: descriptor_pb2.DescriptorProto = file_proto.message_type.add(name=name)
+    for field_name, subtree in tree.items():
+        field: FieldDescriptor = descriptor.fields_by_name[field_name]
+        field_proto: descriptor_pb2.FieldDescriptorProto = message_proto.field.add(
+            name=field.name,
+            number=field.number,
+            type=field.type,
+            label=(
+                descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED
+                if field.is_repeated
+                else descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL
+            ),
+        )
+        if subtree and field.message_type is not None:
+            field_proto.type_name = f".{package}." + _add_projected_message(
+                field.message_type, subtree, file_proto, package, dependencies
+            )
+        elif field.message_type is not None:
+            field_proto.type_name = "." + field.message_type.full_name
+            dependencies.add(field.message_type.file.name)
+        elif field.enum_type is not None:
+            field_proto.type_name = "." + field.enum_type.full_name
+            dependencies.add(field.enum_type.file.name)
+    return name
+
+
+def _add_file_with_dependencies(pool: descriptor_pool.DescriptorPool, file: FileDescriptor, added: Set[str]) -> None:
+    if file.name in added:
+        return
+    for dependency in file.dependencies:
+        _add_file_with_dependencies(pool, dependency, added)
+    file_proto: descriptor_pb2.FileDescriptorProto = descriptor_pb2.FileDescriptorProto()
+    file.CopyToProto(file_proto)
+    pool.Add(file_proto)
+    added.add(file.name)
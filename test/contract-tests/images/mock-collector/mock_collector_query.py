@@ -0,0 +1,283 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+A small query language over the columnar tables of `mock_collector_tables`.
+
+    query = spans().where(field("kind") == Span.SPAN_KIND_CLIENT, attr("aws.remote.service").matches("AWS::.*"))
+    query.count(table)
+    query.group_by(attr("aws.remote.operation")).count(table)
+
+Queries are plain values; `compile(table)` turns every condition into a closure over the table's columns once, so a
+compiled query can be run repeatedly. Conditions on dictionary-encoded columns (span names, attribute values) are
+resolved against the distinct values first: `==` becomes one code, `isin` and `matches` a set of codes, and rows are
+then filtered by comparing integers, so a regular expression runs once per distinct value rather than once per row.
+
+`to_proto`/`from_proto` convert a query to and from the `Query` message of the mock collector service, which evaluates
+it next to the stored telemetry (`MockCollectorClient.query`) instead of shipping every export request to the test.
+"""
+import re
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Sequence, Set, Tuple
+
+from mock_collector_service_pb2 import ColumnRef, Condition, Query, QueryResult, QueryValue
+from mock_collector_tables import EncodedColumn, LogTable, MetricTable, Selection, SpanTable, _Table
+
+SIGNAL_TABLES: Dict[str, type] = {"spans": SpanTable, "metrics": MetricTable, "logs": LogTable}
+
+_RowFilter = Callable[[array], array]
+
+
+class Column:
+    """Reference to a table column (`field`) or to an attribute key (`attr`); comparisons build `Predicate`s."""
+
+    def __init__(self, name: str, is_attribute: bool):
+        self.name: str = name
+        self.is_attribute: bool = is_attribute
+
+    def __eq__(self, value: Any) -> "Predicate":  # type: ignore[override]
+        return Predicate(self, "eq", (value,))
+
+    def __ne__(self, value: Any) -> "Predicate":  # type: ignore[override]
+        return Predicate(self, "ne", (value,))
+
+    __hash__ = None
+
+    def isin(self, values: Iterable[Any]) -> "Predicate":
+        return Predicate(self, "in", tuple(values))
+
+    def matches(self, pattern: str) -> "Predicate":
+        """Full match of a regular expression against the string form of the value."""
+        return Predicate(self, "regex", (pattern,))
+
+    def exists(self) -> "Predicate":
+        """Rows that have a value. Only attributes and the table's `nullable_fields` can lack one."""
+        return Predicate(self, "exists", ())
+
+    def resolve(self, table: _Table) -> Any:
+        return table.attribute_column(self.name) if self.is_attribute else getattr(table, self.name)
+
+    def __repr__(self) -> str:
+        return f"{'attr' if self.is_attribute else 'field'}({self.name!r})"
+
+
+def field(name: str) -> Column:
+    return Column(name, is_attribute=False)
+
+
+def attr(key: str) -> Column:
+    return Column(key, is_attribute=True)
+
+
+class Predicate:
+    def __init__(self, column: Column, operator: str, operands: Tuple[Any, ...]):
+        self.column: Column = column
+        self.operator: str = operator
+        self.operands: Tuple[Any, ...] = operands
+
+    def compile(self, table: _Table) -> _RowFilter:
+        if self.operator == "exists" and not self.column.is_attribute and self.column.name not in table.nullable_fields:
+            raise ValueError(
+                f"{self.column!r} has a value in every row; exists() applies to attributes and to "
+                f"{', '.join(table.nullable_fields) or 'no field'} of {type(table).__name__}"
+            )
+        column: Any = self.column.resolve(table)
+        if isinstance(column, EncodedColumn):
+            return self._compile_encoded(column)
+        return self._compile_plain(column)
+
+    def _compile_encoded(self, column: EncodedColumn) -> _RowFilter:
+        codes: array = column.codes
+        if self.operator == "eq":
+            code: int = column.code_of(self.operands[0])
+            return lambda rows: array("i", (row for row in rows if codes[row] == code)) if code >= 0 else array("i")
+        if self.operator == "ne":
+            code = column.code_of(self.operands[0])
+            # Rows without a value are kept, as by `_compile_plain`; a value never seen excludes no row.
+            return lambda rows: array("i", (row for row in rows if codes[row] != code)) if code >= 0 else rows
+        if self.operator == "exists":
+            return lambda rows: array("i", (row for row in rows if codes[row] >= 0))
+        test: Callable[[Any], bool] = self._value_test()
+        accepted: Set[int] = {code for code, value in enumerate(column.values) if self._value_matches(value, test)}
+        return lambda rows: array("i", (row for row in rows if codes[row] in accepted))
+
+    def _compile_plain(self, column: Sequence[Any]) -> _RowFilter:
+        if self.operator == "eq":
+            expected: Any = self.operands[0]
+            return lambda rows: array("i", (row for row in rows if column[row] == expected))
+        if self.operator == "ne":
+            expected = self.operands[0]
+            return lambda rows: array("i", (row for row in rows if column[row] != expected))
+        if self.operator == "exists":
+            return lambda rows: array("i", (row for row in rows if column[row] is not None))
+        test: Callable[[Any], bool] = self._value_test()
+        return lambda rows: array("i", (row for row in rows if self._value_matches(column[row], test)))
+
+    def _value_test(self) -> Callable[[Any], bool]:
+        if self.operator == "in":
+            operands: Tuple[Any, ...] = self.operands
+            return lambda value: value in operands
+        if self.operator == "regex":
+            pattern: Pattern = re.compile(self.operands[0])
+            return lambda value: pattern.fullmatch(value if isinstance(value, str) else str(value)) is not None
+        raise ValueError(f"Unknown operator {self.operator!r}")
+
+    @staticmethod
+    def _value_matches(value: Any, test: Callable[[Any], bool]) -> bool:
+        return value is not None and test(value)
+
+    def __repr__(self) -> str:
+        return f"{self.column!r} {self.operator} {self.operands!r}"
+
+
+class CompiledQuery:
+    """A query bound to one table; `select()` runs the compiled filters, narrowing the rows one condition at a time."""
+
+    def __init__(self, table: _Table, filters: List[_RowFilter]):
+        self.table: _Table = table
+        self._filters: List[_RowFilter] = filters
+
+    def select(self) -> Selection:
+        rows: array = array("i", range(len(self.table)))
+        for row_filter in self._filters:
+            if not rows:
+                break
+            rows = row_filter(rows)
+        return Selection(self.table, rows)
+
+
+class TelemetryQuery:
+    """Immutable query: the signal, conditions (all must hold) and optional group-by columns."""
+
+    def __init__(self, signal: str, predicates: Tuple[Predicate, ...] = (), groups: Tuple[Column, ...] = ()):
+        if signal not in SIGNAL_TABLES:
+            raise ValueError(f"Unknown signal {signal!r}, expected one of {sorted(SIGNAL_TABLES)}")
+        self.signal: str = signal
+        self.predicates: Tuple[Predicate, ...] = predicates
+        self.groups: Tuple[Column, ...] = groups
+
+    def where(self, *predicates: Predicate) -> "TelemetryQuery":
+        return TelemetryQuery(self.signal, self.predicates + predicates, self.groups)
+
+    def group_by(self, *columns: Column) -> "TelemetryQuery":
+        return TelemetryQuery(self.signal, self.predicates, self.groups + columns)
+
+    def compile(self, table: _Table) -> CompiledQuery:
+        if not isinstance(table, SIGNAL_TABLES[self.signal]):
+            raise TypeError(f"A {self.signal} query cannot run on {type(table).__name__}")
+        return CompiledQuery(table, [predicate.compile(table) for predicate in self.predicates])
+
+    def select(self, table: _Table) -> Selection:
+        return self.compile(table).select()
+
+    def count(self, table: _Table) -> Any:
+        """Number of matching rows, or a dict of group key tuple to count when grouped."""
+        return self._aggregate(table, None)
+
+    def sum(self, table: _Table, column: Column) -> Any:
+        """Sum of `column` over the matching rows, or a dict of group key tuple to sum when grouped."""
+        return self._aggregate(table, column)
+
+    def _aggregate(self, table: _Table, column: Optional[Column]) -> Any:
+        rows: array = self.select(table).rows
+        values: Optional[Sequence[Any]] = None if column is None else column.resolve(table)
+        if not self.groups:
+            return len(rows) if values is None else sum(values[row] or 0 for row in rows)
+        keys: List[Sequence[Any]] = [group.resolve(table) for group in self.groups]
+        result: Dict[Tuple[Any, ...], Any] = {}
+        for row in rows:
+            key: Tuple[Any, ...] = tuple(key_column[row] for key_column in keys)
+            result[key] = result.get(key, 0) + (1 if values is None else values[row] or 0)
+        return result
+
+    def to_proto(self, aggregate: str = "count", sum_column: Optional[Column] = None) -> Query:
+        return Query(
+            signal=self.signal,
+            conditions=[
+                Condition(
+                    column=_column_to_proto(predicate.column),
+                    operator=predicate.operator,
+                    operands=[_value_to_proto(operand) for operand in predicate.operands],
+                )
+                for predicate in self.predicates
+            ],
+            group_by=[_column_to_proto(group) for group in self.groups],
+            aggregate=aggregate,
+            sum_column=_column_to_proto(sum_column) if sum_column is not None else None,
+        )
+
+    @staticmethod
+    def from_proto(query: Query) -> "TelemetryQuery":
+        return TelemetryQuery(
+            query.signal,
+            tuple(
+                Predicate(
+                    _column_from_proto(condition.column),
+                    condition.operator,
+                    tuple(_value_from_proto(operand) for operand in condition.operands),
+                )
+                for condition in query.conditions
+            ),
+            tuple(_column_from_proto(group) for group in query.group_by),
+        )
+
+
+def spans() -> TelemetryQuery:
+    return TelemetryQuery("spans")
+
+
+def metrics() -> TelemetryQuery:
+    return TelemetryQuery("metrics")
+
+
+def logs() -> TelemetryQuery:
+    return TelemetryQuery("logs")
+
+
+def evaluate(query: Query, table: _Table) -> QueryResult:
+    """Server side of `MockCollectorClient.query`: run a `Query` message on a table and encode the result."""
+    telemetry_query: TelemetryQuery = TelemetryQuery.from_proto(query)
+    sum_column: Optional[Column] = _column_from_proto(query.sum_column) if query.aggregate == "sum" else None
+    aggregated: Any = telemetry_query._aggregate(table, sum_column)  # pylint: disable=protected-access
+    if not telemetry_query.groups:
+        return QueryResult(rows=[QueryResult.Row(value=float(aggregated))])
+    return QueryResult(
+        rows=[
+            QueryResult.Row(key=[_value_to_proto(part) for part in key], value=float(value))
+            for key, value in aggregated.items()
+        ]
+    )
+
+
+def result_from_proto(result: QueryResult, grouped: bool, is_count: bool) -> Any:
+    convert: Callable[[float], Any] = int if is_count else float
+    if not grouped:
+        return convert(result.rows[0].value) if result.rows else convert(0)
+    return {tuple(_value_from_proto(part) for part in row.key): convert(row.value) for row in result.rows}
+
+
+def _column_to_proto(column: Column) -> ColumnRef:
+    return ColumnRef(name=column.name, attribute=column.is_attribute)
+
+
+def _column_from_proto(column: ColumnRef) -> Column:
+    return Column(column.name, column.attribute)
+
+
+def _value_to_proto(value: Any) -> QueryValue:
+    # bool is checked before int because it is a subclass of it.
+    if value is None:
+        return QueryValue()
+    if isinstance(value, bool):
+        return QueryValue(bool_value=value)
+    if isinstance(value, int):
+        return QueryValue(int_value=value)
+    if isinstance(value, float):
+        return QueryValue(double_value=value)
+    if isinstance(value, bytes):
+        return QueryValue(bytes_value=value)
+    return QueryValue(string_value=str(value))
+
+
+def _value_from_proto(value: QueryValue) -> Any:
+    kind: Optional[str] = value.WhichOneof("value")
+    return None if kind is None else getattr(value, kind)
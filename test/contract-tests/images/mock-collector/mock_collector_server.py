@@ -71,10 +71,39 @@ def _create_http_handler(logs_collector: MockCollectorLogsService, metrics_colle
     return OtlpHttpHandler
 
 
-def main() -> None:
-    # gRPC server on port 4315 (traces, metrics, logs via gRPC + query service)
+class MockCollectorServer:
+    """A started mock collector: its gRPC and OTLP/HTTP servers, the ports they listen on and the telemetry store."""
+
+    def __init__(
+        self,
+        grpc_server: server,
+        http_server: HTTPServer,
+        service: MockCollectorService,
+        grpc_port: int,
+    ):
+        self.grpc_server: server = grpc_server
+        self.http_server: HTTPServer = http_server
+        self.service: MockCollectorService = service
+        self.grpc_port: int = grpc_port
+
+    @property
+    def http_port(self) -> int:
+        return self.http_server.server_address[1]
+
+    def stop(self) -> None:
+        self.http_server.shutdown()
+        self.http_server.server_close()
+        self.grpc_server.stop(None)
+
+
+def start_server(grpc_port: int = 4315, http_port: int = 4316, host: str = "0.0.0.0") -> MockCollectorServer:
+    """Start the gRPC server (traces, metrics, logs and the query service) and the OTLP/HTTP server (logs and
+    metrics, for the ServiceEvents emitter). Port 0 picks a free port; read it back from the returned server.
+
+    Every call has its own telemetry store, so the server can also run inside the test process.
+    """
     mock_collector_server: server = server(thread_pool=ThreadPoolExecutor(max_workers=10))
-    mock_collector_server.add_insecure_port("0.0.0.0:4315")
+    bound_grpc_port: int = mock_collector_server.add_insecure_port(f"{host}:{grpc_port}")
 
     trace_collector: MockCollectorTraceService = MockCollectorTraceService()
     metrics_collector: MockCollectorMetricsService = MockCollectorMetricsService()
@@ -87,16 +116,21 @@ def main() -> None:
     add_MockCollectorServiceServicer_to_server(mock_collector, mock_collector_server)
 
     mock_collector_server.start()
-    atexit.register(mock_collector_server.stop, None)
 
-    # HTTP server on port 4316 (OTLP HTTP /v1/logs and /v1/metrics for ServiceEvents emitter)
     handler_class = _create_http_handler(logs_collector, metrics_collector)
-    http_server = HTTPServer(("0.0.0.0", 4316), handler_class)
+    http_server = HTTPServer((host, http_port), handler_class)
     http_thread = threading.Thread(target=http_server.serve_forever, daemon=True)
     http_thread.start()
 
+    return MockCollectorServer(mock_collector_server, http_server, mock_collector, bound_grpc_port)
+
+
+def main() -> None:
+    mock_collector_server: MockCollectorServer = start_server()
+    atexit.register(mock_collector_server.stop)
+
     print("Ready")
-    mock_collector_server.wait_for_termination(None)
+    mock_collector_server.grpc_server.wait_for_termination(None)
 
 
 if __name__ == "__main__":
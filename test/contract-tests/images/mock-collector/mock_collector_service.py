@@ -1,10 +1,13 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from typing import List
+import operator
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
-from grpc import ServicerContext
+from grpc import ServicerContext, StatusCode
 from mock_collector_logs_service import MockCollectorLogsService
 from mock_collector_metrics_service import MockCollectorMetricsService
+from mock_collector_query import evaluate
 from mock_collector_service_pb2 import (
     ClearRequest,
     ClearResponse,
@@ -14,8 +17,11 @@ from mock_collector_service_pb2 import (
     GetMetricsResponse,
     GetTracesRequest,
     GetTracesResponse,
+    Query,
+    QueryResult,
 )
 from mock_collector_service_pb2_grpc import MockCollectorServiceServicer
+from mock_collector_tables import LogTable, MetricTable, SpanTable, _Table
 from mock_collector_trace_service import MockCollectorTraceService
 from typing_extensions import override
 
@@ -25,7 +31,7 @@ from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTrace
 
 
 class MockCollectorService(MockCollectorServiceServicer):
-    """Implements clear, get_traces, get_metrics, and get_logs for the mock collector.
+    """Implements clear, get_traces, get_metrics, get_logs and query for the mock collector.
 
     Relies on metrics, trace, and logs collector services to collect the telemetry.
     """
@@ -40,6 +46,9 @@ class MockCollectorService(MockCollectorServiceServicer):
         self.trace_collector: MockCollectorTraceService = trace_collector
         self.metrics_collector: MockCollectorMetricsService = metrics_collector
         self.logs_collector: MockCollectorLogsService = logs_collector
+        # Per signal, the requests the last query ran on and their table.
+        self._tables: Dict[str, Tuple[List[Any], _Table]] = {}
+        self._tables_lock: threading.Lock = threading.Lock()
 
     @override
     def clear(self, request: ClearRequest, context: ServicerContext) -> ClearResponse:
@@ -68,3 +77,33 @@ class MockCollectorService(MockCollectorServiceServicer):
         logs: List[bytes] = list(map(ExportLogsServiceRequest.SerializeToString, log_requests))
         response: GetLogsResponse = GetLogsResponse(logs=logs)
         return response
+
+    @override
+    def query(self, request: Query, context: ServicerContext) -> QueryResult:
+        table: Union[SpanTable, MetricTable, LogTable]
+        if request.signal == "spans":
+            table = self._table(request.signal, SpanTable, self.trace_collector.get_requests())
+        elif request.signal == "metrics":
+            table = self._table(request.signal, MetricTable, self.metrics_collector.get_requests())
+        elif request.signal == "logs":
+            table = self._table(request.signal, LogTable, self.logs_collector.get_requests())
+        else:
+            context.abort(StatusCode.INVALID_ARGUMENT, f"Unknown signal {request.signal!r}")
+        try:
+            return evaluate(request, table)
+        except (AttributeError, TypeError, ValueError) as error:
+            context.abort(StatusCode.INVALID_ARGUMENT, str(error))
+
+    def _table(self, signal: str, table_type: Type[_Table], requests: List[Any]) -> Any:
+        """The table of `requests`, built again only when an export or a clear changed them since the last query."""
+        with self._tables_lock:
+            cached: Optional[Tuple[List[Any], _Table]] = self._tables.get(signal)
+            # The cache holds the stored requests, so none of them is freed and their ids cannot be reused.
+            if cached is not None and len(cached[0]) == len(requests) and all(map(operator.is_, cached[0], requests)):
+                return cached[1]
+            table: _Table = table_type.from_exports(requests)
+            # Pad every attribute column now: queries run concurrently and must not pad a shared table.
+            for key in table.attributes:
+                table.attribute_column(key)
+            self._tables[signal] = (requests, table)
+            return table
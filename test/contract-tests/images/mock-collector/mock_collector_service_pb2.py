@@ -1,12 +1,22 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
 # source: mock_collector_service.proto
-# Protobuf Python Version: 4.25.0
+# Protobuf Python Version: 6.31.1
 """Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
 from google.protobuf import symbol_database as _symbol_database
 from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'mock_collector_service.proto'
+)
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -14,13 +24,13 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cmock_collector_service.proto\"\x0e\n\x0c\x43learRequest\"\x0f\n\rClearResponse\"\x12\n\x10GetTracesRequest\"#\n\x11GetTracesResponse\x12\x0e\n\x06traces\x18\x01 \x03(\x0c\"\x13\n\x11GetMetricsRequest\"%\n\x12GetMetricsResponse\x12\x0f\n\x07metrics\x18\x01 \x03(\x0c\"\x10\n\x0eGetLogsRequest\"\x1f\n\x0fGetLogsResponse\x12\x0c\n\x04logs\x18\x01 \x03(\x0c\x32\xe2\x01\n\x14MockCollectorService\x12(\n\x05\x63lear\x12\r.ClearRequest\x1a\x0e.ClearResponse\"\x00\x12\x35\n\nget_traces\x12\x11.GetTracesRequest\x1a\x12.GetTracesResponse\"\x00\x12\x38\n\x0bget_metrics\x12\x12.GetMetricsRequest\x1a\x13.GetMetricsResponse\"\x00\x12/\n\x08get_logs\x12\x0f.GetLogsRequest\x1a\x10.GetLogsResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cmock_collector_service.proto\"\x0e\n\x0c\x43learRequest\"\x0f\n\rClearResponse\"\x12\n\x10GetTracesRequest\"#\n\x11GetTracesResponse\x12\x0e\n\x06traces\x18\x01 \x03(\x0c\"\x13\n\x11GetMetricsRequest\"%\n\x12GetMetricsResponse\x12\x0f\n\x07metrics\x18\x01 \x03(\x0c\"\x10\n\x0eGetLogsRequest\"\x1f\n\x0fGetLogsResponse\x12\x0c\n\x04logs\x18\x01 \x03(\x0c\",\n\tColumnRef\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tattribute\x18\x02 \x01(\x08\"\x87\x01\n\nQueryValue\x12\x16\n\x0cstring_value\x18\x01 \x01(\tH\x00\x12\x13\n\tint_value\x18\x02 \x01(\x03H\x00\x12\x16\n\x0c\x64ouble_value\x18\x03 \x01(\x01H\x00\x12\x14\n\nbool_value\x18\x04 \x01(\x08H\x00\x12\x15\n\x0b\x62ytes_value\x18\x05 \x01(\x0cH\x00\x42\x07\n\x05value\"X\n\tCondition\x12\x1a\n\x06\x63olumn\x18\x01 \x01(\x0b\x32\n.ColumnRef\x12\x10\n\x08operator\x18\x02 \x01(\t\x12\x1d\n\x08operands\x18\x03 \x03(\x0b\x32\x0b.QueryValue\"\x88\x01\n\x05Query\x12\x0e\n\x06signal\x18\x01 \x01(\t\x12\x1e\n\nconditions\x18\x02 \x03(\x0b\x32\n.Condition\x12\x1c\n\x08group_by\x18\x03 \x03(\x0b\x32\n.ColumnRef\x12\x11\n\taggregate\x18\x04 \x01(\t\x12\x1e\n\nsum_column\x18\x05 \x01(\x0b\x32\n.ColumnRef\"]\n\x0bQueryResult\x12\x1e\n\x04rows\x18\x01 \x03(\x0b\x32\x10.QueryResult.Row\x1a.\n\x03Row\x12\x18\n\x03key\x18\x01 \x03(\x0b\x32\x0b.QueryValue\x12\r\n\x05value\x18\x02 \x01(\x01\x32\x83\x02\n\x14MockCollectorService\x12(\n\x05\x63lear\x12\r.ClearRequest\x1a\x0e.ClearResponse\"\x00\x12\x35\n\nget_traces\x12\x11.GetTracesRequest\x1a\x12.GetTracesResponse\"\x00\x12\x38\n\x0bget_metrics\x12\x12.GetMetricsRequest\x1a\x13.GetMetricsResponse\"\x00\x12/\n\x08get_logs\x12\x0f.GetLogsRequest\x1a\x10.GetLogsResponse\"\x00\x12\x1f\n\x05query\x12\x06.Query\x1a\x0c.QueryResult\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mock_collector_service_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-  DESCRIPTOR._options = None
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
   _globals['_CLEARREQUEST']._serialized_start=32
   _globals['_CLEARREQUEST']._serialized_end=46
   _globals['_CLEARRESPONSE']._serialized_start=48
@@ -37,6 +47,18 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_GETLOGSREQUEST']._serialized_end=198
   _globals['_GETLOGSRESPONSE']._serialized_start=200
   _globals['_GETLOGSRESPONSE']._serialized_end=231
-  _globals['_MOCKCOLLECTORSERVICE']._serialized_start=234
-  _globals['_MOCKCOLLECTORSERVICE']._serialized_end=460
+  _globals['_COLUMNREF']._serialized_start=233
+  _globals['_COLUMNREF']._serialized_end=277
+  _globals['_QUERYVALUE']._serialized_start=280
+  _globals['_QUERYVALUE']._serialized_end=415
+  _globals['_CONDITION']._serialized_start=417
+  _globals['_CONDITION']._serialized_end=505
+  _globals['_QUERY']._serialized_start=508
+  _globals['_QUERY']._serialized_end=644
+  _globals['_QUERYRESULT']._serialized_start=646
+  _globals['_QUERYRESULT']._serialized_end=739
+  _globals['_QUERYRESULT_ROW']._serialized_start=693
+  _globals['_QUERYRESULT_ROW']._serialized_end=739
+  _globals['_MOCKCOLLECTORSERVICE']._serialized_start=742
+  _globals['_MOCKCOLLECTORSERVICE']._serialized_end=1001
 # @@protoc_insertion_point(module_scope)
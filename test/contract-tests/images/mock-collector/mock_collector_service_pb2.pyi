@@ -1,8 +1,8 @@
 from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from collections.abc import Iterable as _Iterable
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
@@ -43,3 +43,62 @@ class GetLogsResponse(_message.Message):
     LOGS_FIELD_NUMBER: _ClassVar[int]
     logs: _containers.RepeatedScalarFieldContainer[bytes]
     def __init__(self, logs: _Optional[_Iterable[bytes]] = ...) -> None: ...
+
+class ColumnRef(_message.Message):
+    __slots__ = ("name", "attribute")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    attribute: bool
+    def __init__(self, name: _Optional[str] = ..., attribute: bool = ...) -> None: ...
+
+class QueryValue(_message.Message):
+    __slots__ = ("string_value", "int_value", "double_value", "bool_value", "bytes_value")
+    STRING_VALUE_FIELD_NUMBER: _ClassVar[int]
+    INT_VALUE_FIELD_NUMBER: _ClassVar[int]
+    DOUBLE_VALUE_FIELD_NUMBER: _ClassVar[int]
+    BOOL_VALUE_FIELD_NUMBER: _ClassVar[int]
+    BYTES_VALUE_FIELD_NUMBER: _ClassVar[int]
+    string_value: str
+    int_value: int
+    double_value: float
+    bool_value: bool
+    bytes_value: bytes
+    def __init__(self, string_value: _Optional[str] = ..., int_value: _Optional[int] = ..., double_value: _Optional[float] = ..., bool_value: bool = ..., bytes_value: _Optional[bytes] = ...) -> None: ...
+
+class Condition(_message.Message):
+    __slots__ = ("column", "operator", "operands")
+    COLUMN_FIELD_NUMBER: _ClassVar[int]
+    OPERATOR_FIELD_NUMBER: _ClassVar[int]
+    OPERANDS_FIELD_NUMBER: _ClassVar[int]
+    column: ColumnRef
+    operator: str
+    operands: _containers.RepeatedCompositeFieldContainer[QueryValue]
+    def __init__(self, column: _Optional[_Union[ColumnRef, _Mapping]] = ..., operator: _Optional[str] = ..., operands: _Optional[_Iterable[_Union[QueryValue, _Mapping]]] = ...) -> None: ...
+
+class Query(_message.Message):
+    __slots__ = ("signal", "conditions", "group_by", "aggregate", "sum_column")
+    SIGNAL_FIELD_NUMBER: _ClassVar[int]
+    CONDITIONS_FIELD_NUMBER: _ClassVar[int]
+    GROUP_BY_FIELD_NUMBER: _ClassVar[int]
+    AGGREGATE_FIELD_NUMBER: _ClassVar[int]
+    SUM_COLUMN_FIELD_NUMBER: _ClassVar[int]
+    signal: str
+    conditions: _containers.RepeatedCompositeFieldContainer[Condition]
+    group_by: _containers.RepeatedCompositeFieldContainer[ColumnRef]
+    aggregate: str
+    sum_column: ColumnRef
+    def __init__(self, signal: _Optional[str] = ..., conditions: _Optional[_Iterable[_Union[Condition, _Mapping]]] = ..., group_by: _Optional[_Iterable[_Union[ColumnRef, _Mapping]]] = ..., aggregate: _Optional[str] = ..., sum_column: _Optional[_Union[ColumnRef, _Mapping]] = ...) -> None: ...
+
+class QueryResult(_message.Message):
+    __slots__ = ("rows",)
+    class Row(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: _containers.RepeatedCompositeFieldContainer[QueryValue]
+        value: float
+        def __init__(self, key: _Optional[_Iterable[_Union[QueryValue, _Mapping]]] = ..., value: _Optional[float] = ...) -> None: ...
+    ROWS_FIELD_NUMBER: _ClassVar[int]
+    rows: _containers.RepeatedCompositeFieldContainer[QueryResult.Row]
+    def __init__(self, rows: _Optional[_Iterable[_Union[QueryResult.Row, _Mapping]]] = ...) -> None: ...
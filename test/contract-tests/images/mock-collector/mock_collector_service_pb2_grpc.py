@@ -1,9 +1,29 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
 """Client and server classes corresponding to protobuf-defined services."""
 import grpc
+import warnings
 
 import mock_collector_service_pb2 as mock__collector__service__pb2
 
+GRPC_GENERATED_VERSION = '1.76.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in mock_collector_service_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
 
 class MockCollectorServiceStub(object):
     """Service definition for mock collector
@@ -19,22 +39,27 @@ class MockCollectorServiceStub(object):
                 '/MockCollectorService/clear',
                 request_serializer=mock__collector__service__pb2.ClearRequest.SerializeToString,
                 response_deserializer=mock__collector__service__pb2.ClearResponse.FromString,
-                )
+                _registered_method=True)
         self.get_traces = channel.unary_unary(
                 '/MockCollectorService/get_traces',
                 request_serializer=mock__collector__service__pb2.GetTracesRequest.SerializeToString,
                 response_deserializer=mock__collector__service__pb2.GetTracesResponse.FromString,
-                )
+                _registered_method=True)
         self.get_metrics = channel.unary_unary(
                 '/MockCollectorService/get_metrics',
                 request_serializer=mock__collector__service__pb2.GetMetricsRequest.SerializeToString,
                 response_deserializer=mock__collector__service__pb2.GetMetricsResponse.FromString,
-                )
+                _registered_method=True)
         self.get_logs = channel.unary_unary(
                 '/MockCollectorService/get_logs',
                 request_serializer=mock__collector__service__pb2.GetLogsRequest.SerializeToString,
                 response_deserializer=mock__collector__service__pb2.GetLogsResponse.FromString,
-                )
+                _registered_method=True)
+        self.query = channel.unary_unary(
+                '/MockCollectorService/query',
+                request_serializer=mock__collector__service__pb2.Query.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.QueryResult.FromString,
+                _registered_method=True)
 
 
 class MockCollectorServiceServicer(object):
@@ -69,6 +94,13 @@ class MockCollectorServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def query(self, request, context):
+        """Evaluates a query over the telemetry currently captured, see mock_collector_query.py
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MockCollectorServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -92,10 +124,16 @@ def add_MockCollectorServiceServicer_to_server(servicer, server):
                     request_deserializer=mock__collector__service__pb2.GetLogsRequest.FromString,
                     response_serializer=mock__collector__service__pb2.GetLogsResponse.SerializeToString,
             ),
+            'query': grpc.unary_unary_rpc_method_handler(
+                    servicer.query,
+                    request_deserializer=mock__collector__service__pb2.Query.FromString,
+                    response_serializer=mock__collector__service__pb2.QueryResult.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'MockCollectorService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('MockCollectorService', rpc_method_handlers)
 
 
  # This class is part of an EXPERIMENTAL API.
@@ -114,11 +152,21 @@ class MockCollectorService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/clear',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/MockCollectorService/clear',
             mock__collector__service__pb2.ClearRequest.SerializeToString,
             mock__collector__service__pb2.ClearResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def get_traces(request,
@@ -131,11 +179,21 @@ class MockCollectorService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_traces',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/MockCollectorService/get_traces',
             mock__collector__service__pb2.GetTracesRequest.SerializeToString,
             mock__collector__service__pb2.GetTracesResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def get_metrics(request,
@@ -148,11 +206,21 @@ class MockCollectorService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_metrics',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/MockCollectorService/get_metrics',
             mock__collector__service__pb2.GetMetricsRequest.SerializeToString,
             mock__collector__service__pb2.GetMetricsResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def get_logs(request,
@@ -165,8 +233,45 @@ class MockCollectorService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_logs',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/MockCollectorService/get_logs',
             mock__collector__service__pb2.GetLogsRequest.SerializeToString,
             mock__collector__service__pb2.GetLogsResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def query(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/MockCollectorService/query',
+            mock__collector__service__pb2.Query.SerializeToString,
+            mock__collector__service__pb2.QueryResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
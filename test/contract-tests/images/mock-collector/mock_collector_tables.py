@@ -0,0 +1,463 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Columnar views over captured telemetry, as an alternative to the flat `ResourceScope*` lists.
+
+A table is built in a single pass over the export requests and keeps one column per field instead of one Python
+object per record: numeric columns are `array`s, strings and attribute values are dictionary encoded (each distinct
+value is stored once and rows hold an `array` of codes), and resources and scopes are stored once per distinct
+resource/scope rather than once per record. Row views use `__slots__` and only hold the table and a row index.
+
+Filters take column values and return a `Selection` of row indices. Equality on an encoded column is resolved to a
+code once and then compared as integers over the code array, so selecting the client spans of a large capture does
+not touch any protobuf object.
+"""
+import sys
+from array import array
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, InstrumentationScope, KeyValue
+from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric
+
+_MISSING: int = -1
+R = TypeVar("R")
+
+
+def any_value_to_python(value: AnyValue) -> Any:
+    """Convert an OTLP `AnyValue` to a hashable Python value: arrays become tuples, kvlists tuples of pairs."""
+    kind: Optional[str] = value.WhichOneof("value")
+    if kind == "string_value":
+        return sys.intern(value.string_value)
+    if kind == "array_value":
+        return tuple(any_value_to_python(item) for item in value.array_value.values)
+    if kind == "kvlist_value":
+        return tuple((kv.key, any_value_to_python(kv.value)) for kv in value.kvlist_value.values)
+    if kind is None:
+        return None
+    return getattr(value, kind)
+
+
+class EncodedColumn:
+    """Dictionary-encoded column. `codes[row]` indexes `values`, or is -1 when the row has no value."""
+
+    __slots__ = ("codes", "values", "_index")
+
+    def __init__(self):
+        self.codes: array = array("i")
+        self.values: List[Any] = []
+        # Keyed by (type, value) so that True, 1 and 1.0 get distinct codes.
+        self._index: Dict[Tuple[type, Hashable], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Any:
+        code: int = self.codes[row]
+        return None if code == _MISSING else self.values[code]
+
+    def code_of(self, value: Any) -> int:
+        return self._index.get((type(value), value), _MISSING)
+
+    def append(self, value: Any) -> None:
+        self.codes.append(self._encode(value))
+
+    def pad_to(self, length: int) -> None:
+        """Fill rows that never received a value; used by sparse attribute columns."""
+        missing: int = length - len(self.codes)
+        if missing > 0:
+            self.codes.extend(array("i", [_MISSING]) * missing)
+
+    def set(self, row: int, value: Any) -> None:
+        """Store `value` at `row`, which must not be before the last row written. Writing the last row again replaces
+        its value, so a record that repeats an attribute key keeps the last value, as a dict of its attributes would."""
+        if row < len(self.codes):
+            self.codes[row] = self._encode(value)
+            return
+        self.pad_to(row)
+        self.codes.append(self._encode(value))
+
+    def _encode(self, value: Any) -> int:
+        if value is None:
+            return _MISSING
+        key: Tuple[type, Hashable] = (type(value), value)
+        code: Optional[int] = self._index.get(key)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._index[key] = code
+        return code
+
+
+class NumberColumn:
+    """Column of numbers that keeps ints and floats apart, so an int above 2**53 or a sum of ints reads back exactly.
+
+    `is_int[row]` tells which of `ints` and `doubles` holds the value of a row; the other holds 0.
+    """
+
+    __slots__ = ("is_int", "ints", "doubles")
+
+    def __init__(self):
+        self.is_int: array = array("b")
+        self.ints: array = array("q")
+        self.doubles: array = array("d")
+
+    def __len__(self) -> int:
+        return len(self.is_int)
+
+    def __getitem__(self, row: int) -> Union[int, float]:
+        return self.ints[row] if self.is_int[row] else self.doubles[row]
+
+    def append(self, value: Union[int, float]) -> None:
+        if isinstance(value, int):
+            self.is_int.append(1)
+            self.ints.append(value)
+            self.doubles.append(0.0)
+        else:
+            self.is_int.append(0)
+            self.ints.append(0)
+            self.doubles.append(value)
+
+
+class Selection:
+    """Row indices of a table, produced by filters and combinable with further filters."""
+
+    __slots__ = ("table", "rows")
+
+    def __init__(self, table: "_Table", rows: array):
+        self.table: _Table = table
+        self.rows: array = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self.table.row(index) for index in self.rows)
+
+    def where(self, **conditions: Any) -> "Selection":
+        return self.table.where(_rows=self.rows, **conditions)
+
+    def where_attribute(self, key: str, value: Any) -> "Selection":
+        return self.table.where_attribute(key, value, _rows=self.rows)
+
+    def filter(self, predicate: Callable[[Any], bool]) -> "Selection":
+        return Selection(self.table, array("i", (index for index in self.rows if predicate(self.table.row(index)))))
+
+    def first(self) -> Any:
+        return self.table.row(self.rows[0]) if self.rows else None
+
+
+class _Table(Generic[R]):
+    """Shared storage for resource/scope/attribute columns; subclasses add their signal-specific columns."""
+
+    _row_type: type = None
+    _encoded_columns: Tuple[str, ...] = ()
+    # Fields that can be None for a row; every other field has a value in every row.
+    nullable_fields: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self._length: int = 0
+        self.resource_index: array = array("i")
+        self.scope_index: array = array("i")
+        self.resources: List[Dict[str, Any]] = []
+        self.scopes: List[Tuple[str, str]] = []
+        self.attributes: Dict[str, EncodedColumn] = {}
+        self._resource_lookup: Dict[Tuple[Tuple[str, Any], ...], int] = {}
+        self._scope_lookup: Dict[Tuple[str, str], int] = {}
+        for name in self._encoded_columns:
+            setattr(self, name, EncodedColumn())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[R]:
+        return (self.row(index) for index in range(self._length))
+
+    def row(self, index: int) -> R:
+        return self._row_type(self, index)
+
+    def all(self) -> Selection:
+        return Selection(self, array("i", range(self._length)))
+
+    def attribute_column(self, key: str) -> EncodedColumn:
+        """Column of one attribute key, padded so it has a (possibly missing) value for every row."""
+        column: Optional[EncodedColumn] = self.attributes.get(key)
+        if column is None:
+            column = EncodedColumn()
+        column.pad_to(self._length)
+        return column
+
+    def where(self, _rows: Optional[Iterable[int]] = None, **conditions: Any) -> Selection:
+        """Rows whose columns equal the given values, e.g. `where(name="GET /success", kind=SPAN_KIND_SERVER)`."""
+        rows: Iterable[int] = range(self._length) if _rows is None else _rows
+        selected: array = array("i", rows)
+        for name, expected in conditions.items():
+            column: Any = getattr(self, name)
+            if isinstance(column, EncodedColumn):
+                code: int = column.code_of(expected)
+                if code < 0:
+                    return Selection(self, array("i"))
+                codes: array = column.codes
+                selected = array("i", (index for index in selected if codes[index] == code))
+            else:
+                selected = array("i", (index for index in selected if column[index] == expected))
+        return Selection(self, selected)
+
+    def where_attribute(self, key: str, value: Any, _rows: Optional[Iterable[int]] = None) -> Selection:
+        column: EncodedColumn = self.attribute_column(key)
+        code: int = column.code_of(value)
+        rows: Iterable[int] = range(self._length) if _rows is None else _rows
+        if code < 0:
+            return Selection(self, array("i"))
+        codes: array = column.codes
+        return Selection(self, array("i", (index for index in rows if codes[index] == code)))
+
+    def _add_resource(self, attributes: Iterable[KeyValue]) -> int:
+        resource: Dict[str, Any] = {kv.key: any_value_to_python(kv.value) for kv in attributes}
+        key: Tuple[Tuple[str, Any], ...] = tuple(sorted(resource.items()))
+        index: Optional[int] = self._resource_lookup.get(key)
+        if index is None:
+            index = self._resource_lookup[key] = len(self.resources)
+            self.resources.append(resource)
+        return index
+
+    def _add_scope(self, scope: InstrumentationScope) -> int:
+        key: Tuple[str, str] = (sys.intern(scope.name), sys.intern(scope.version))
+        index: Optional[int] = self._scope_lookup.get(key)
+        if index is None:
+            index = self._scope_lookup[key] = len(self.scopes)
+            self.scopes.append(key)
+        return index
+
+    def _append_common(self, resource: int, scope: int, attributes: Iterable[KeyValue]) -> None:
+        row: int = self._length
+        self.resource_index.append(resource)
+        self.scope_index.append(scope)
+        for kv in attributes:
+            column: Optional[EncodedColumn] = self.attributes.get(kv.key)
+            if column is None:
+                column = self.attributes[sys.intern(kv.key)] = EncodedColumn()
+            column.set(row, any_value_to_python(kv.value))
+        self._length += 1
+
+
+class _RowView:
+    """Base row view: a (table, index) pair with accessors for the shared columns."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: _Table, index: int):
+        self._table: _Table = table
+        self._index: int = index
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def resource_attributes(self) -> Dict[str, Any]:
+        return self._table.resources[self._table.resource_index[self._index]]
+
+    @property
+    def scope_name(self) -> str:
+        return self._table.scopes[self._table.scope_index[self._index]][0]
+
+    @property
+    def scope_version(self) -> str:
+        return self._table.scopes[self._table.scope_index[self._index]][1]
+
+    def attribute(self, key: str, default: Any = None) -> Any:
+        column: Optional[EncodedColumn] = self._table.attributes.get(key)
+        if column is None or self._index >= len(column):
+            return default
+        value: Any = column[self._index]
+        return default if value is None else value
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """All attributes of the row. Builds a dict, so prefer `attribute(key)` in loops."""
+        result: Dict[str, Any] = {}
+        for key, column in self._table.attributes.items():
+            if self._index < len(column):
+                value: Any = column[self._index]
+                if value is not None:
+                    result[key] = value
+        return result
+
+
+class SpanRow(_RowView):
+    __slots__ = ()
+
+    name = property(lambda self: self._table.name[self._index])
+    kind = property(lambda self: self._table.kind[self._index])
+    trace_id = property(lambda self: self._table.trace_id[self._index])
+    span_id = property(lambda self: self._table.span_id[self._index])
+    parent_span_id = property(lambda self: self._table.parent_span_id[self._index])
+    start_time_unix_nano = property(lambda self: self._table.start_time_unix_nano[self._index])
+    end_time_unix_nano = property(lambda self: self._table.end_time_unix_nano[self._index])
+    status_code = property(lambda self: self._table.status_code[self._index])
+
+    @property
+    def duration_nanos(self) -> int:
+        return self._table.end_time_unix_nano[self._index] - self._table.start_time_unix_nano[self._index]
+
+
+class SpanTable(_Table[SpanRow]):
+    """One row per span. Columns: name (encoded), kind, trace_id, span_id, parent_span_id, start/end time, status."""
+
+    _row_type = SpanRow
+    _encoded_columns = ("name",)
+
+    def __init__(self):
+        super().__init__()
+        self.kind: array = array("b")
+        self.status_code: array = array("b")
+        self.start_time_unix_nano: array = array("Q")
+        self.end_time_unix_nano: array = array("Q")
+        self.trace_id: List[bytes] = []
+        self.span_id: List[bytes] = []
+        self.parent_span_id: List[bytes] = []
+
+    @staticmethod
+    def from_exports(exports: Iterable[ExportTraceServiceRequest]) -> "SpanTable":
+        table: SpanTable = SpanTable()
+        for export in exports:
+            for resource_spans in export.resource_spans:
+                resource: int = table._add_resource(resource_spans.resource.attributes)
+                for scope_spans in resource_spans.scope_spans:
+                    scope: int = table._add_scope(scope_spans.scope)
+                    for span in scope_spans.spans:
+                        table.name.append(sys.intern(span.name))
+                        table.kind.append(span.kind)
+                        table.status_code.append(span.status.code)
+                        table.start_time_unix_nano.append(span.start_time_unix_nano)
+                        table.end_time_unix_nano.append(span.end_time_unix_nano)
+                        table.trace_id.append(span.trace_id)
+                        table.span_id.append(span.span_id)
+                        table.parent_span_id.append(span.parent_span_id)
+                        table._append_common(resource, scope, span.attributes)
+        return table
+
+    def durations_nanos(self, selection: Optional[Selection] = None) -> array:
+        rows: Iterable[int] = range(len(self)) if selection is None else selection.rows
+        return array("Q", (self.end_time_unix_nano[i] - self.start_time_unix_nano[i] for i in rows))
+
+
+class MetricPointRow(_RowView):
+    __slots__ = ()
+
+    name = property(lambda self: self._table.name[self._index])
+    data_type = property(lambda self: self._table.data_type[self._index])
+    value = property(lambda self: self._table.value[self._index])
+    count = property(lambda self: self._table.count[self._index])
+    sum = property(lambda self: self._table.sum[self._index])
+    min = property(lambda self: self._table.min[self._index])
+    max = property(lambda self: self._table.max[self._index])
+    time_unix_nano = property(lambda self: self._table.time_unix_nano[self._index])
+
+
+class MetricTable(_Table[MetricPointRow]):
+    """One row per data point; attribute columns hold the data point attributes.
+
+    `value` is the number of a sum/gauge point, an int for `as_int` points (0.0 for histograms); `count`, `sum`, `min`
+    and `max` are filled for histogram and exponential histogram points (min/max are 0 when the point does not record
+    them).
+    """
+
+    _row_type = MetricPointRow
+    _encoded_columns = ("name", "data_type")
+
+    def __init__(self):
+        super().__init__()
+        self.value: NumberColumn = NumberColumn()
+        self.count: array = array("Q")
+        self.sum: array = array("d")
+        self.min: array = array("d")
+        self.max: array = array("d")
+        self.time_unix_nano: array = array("Q")
+
+    @staticmethod
+    def from_exports(exports: Iterable[ExportMetricsServiceRequest]) -> "MetricTable":
+        table: MetricTable = MetricTable()
+        for export in exports:
+            for resource_metrics in export.resource_metrics:
+                resource: int = table._add_resource(resource_metrics.resource.attributes)
+                for scope_metrics in resource_metrics.scope_metrics:
+                    scope: int = table._add_scope(scope_metrics.scope)
+                    for metric in scope_metrics.metrics:
+                        table._append_metric(metric, resource, scope)
+        return table
+
+    def _append_metric(self, metric: Metric, resource: int, scope: int) -> None:
+        data_type: Optional[str] = metric.WhichOneof("data")
+        if data_type is None:
+            return
+        name: str = sys.intern(metric.name)
+        for point in getattr(metric, data_type).data_points:
+            self.name.append(name)
+            self.data_type.append(data_type)
+            self.time_unix_nano.append(point.time_unix_nano)
+            if data_type in ("sum", "gauge"):
+                self.value.append(point.as_int if point.WhichOneof("value") == "as_int" else point.as_double)
+                self.count.append(0)
+                self.sum.append(0.0)
+                self.min.append(0.0)
+                self.max.append(0.0)
+            else:
+                self.value.append(0.0)
+                self.count.append(point.count)
+                self.sum.append(point.sum if point.HasField("sum") else 0.0)
+                self.min.append(point.min if point.HasField("min") else 0.0)
+                self.max.append(point.max if point.HasField("max") else 0.0)
+            self._append_common(resource, scope, point.attributes)
+
+
+class LogRow(_RowView):
+    __slots__ = ()
+
+    severity_number = property(lambda self: self._table.severity_number[self._index])
+    severity_text = property(lambda self: self._table.severity_text[self._index])
+    time_unix_nano = property(lambda self: self._table.time_unix_nano[self._index])
+    trace_id = property(lambda self: self._table.trace_id[self._index])
+    span_id = property(lambda self: self._table.span_id[self._index])
+    body = property(lambda self: self._table.body[self._index])
+    event_name = property(lambda self: self.attribute("event.name"))
+
+
+class LogTable(_Table[LogRow]):
+    """One row per log record. The body is kept as a converted Python value (see `any_value_to_python`)."""
+
+    _row_type = LogRow
+    _encoded_columns = ("severity_text",)
+    nullable_fields = ("severity_text", "body")
+
+    def __init__(self):
+        super().__init__()
+        self.severity_number: array = array("b")
+        self.time_unix_nano: array = array("Q")
+        self.trace_id: List[bytes] = []
+        self.span_id: List[bytes] = []
+        self.body: List[Any] = []
+
+    @staticmethod
+    def from_exports(exports: Iterable[ExportLogsServiceRequest]) -> "LogTable":
+        table: LogTable = LogTable()
+        for export in exports:
+            for resource_logs in export.resource_logs:
+                resource: int = table._add_resource(resource_logs.resource.attributes)
+                for scope_logs in resource_logs.scope_logs:
+                    scope: int = table._add_scope(scope_logs.scope)
+                    for log_record in scope_logs.log_records:
+                        table.severity_number.append(log_record.severity_number)
+                        table.severity_text.append(log_record.severity_text or None)
+                        table.time_unix_nano.append(log_record.time_unix_nano)
+                        table.trace_id.append(log_record.trace_id)
+                        table.span_id.append(log_record.span_id)
+                        table.body.append(any_value_to_python(log_record.body))
+                        table._append_common(resource, scope, log_record.attributes)
+        return table
+
+    def where_event_name(self, event_name: str) -> Selection:
+        return self.where_attribute("event.name", event_name)
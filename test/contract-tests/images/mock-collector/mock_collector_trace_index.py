@@ -0,0 +1,129 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Parent/child structure of the spans captured by the mock collector.
+
+`TraceIndex` groups spans by trace id and links every span to its parent in one pass, so tests can locate a span by
+where it sits in the trace instead of scanning the flat span list, and can assert on the shape of the tree. Nodes are
+`ResourceScopeSpan`s, so the predicates of `mock_collector_client` (`span_named`, `span_of_kind`, ...) apply to them.
+"""
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from mock_collector_client import ResourceScopeSpan
+
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span, SpanFlags
+
+# Shape of a subtree: (kind, name, child shapes ordered by start time).
+SpanShape = Tuple[str, str, Tuple["SpanShape", ...]]
+
+_REMOTE_PARENT_FLAGS: int = (
+    SpanFlags.SPAN_FLAGS_CONTEXT_HAS_IS_REMOTE_MASK | SpanFlags.SPAN_FLAGS_CONTEXT_IS_REMOTE_MASK
+)
+_OUTGOING_KINDS: Tuple[int, ...] = (Span.SPAN_KIND_CLIENT, Span.SPAN_KIND_PRODUCER)
+_INCOMING_KINDS: Tuple[int, ...] = (Span.SPAN_KIND_SERVER, Span.SPAN_KIND_CONSUMER)
+
+
+class SpanNode(ResourceScopeSpan):
+    """A captured span with links to its captured parent and children."""
+
+    def __init__(self, resource_spans: ResourceSpans, scope_spans: ScopeSpans, span: Span):
+        super().__init__(resource_spans, scope_spans, span)
+        self.parent: Optional["SpanNode"] = None
+        self.children: List["SpanNode"] = []
+
+    @property
+    def is_local_root(self) -> bool:
+        """Whether the span starts the local part of its trace, i.e. has no parent in the same process.
+
+        That is the case when the span has no parent, when its parent was not captured, when the exporter marked the
+        parent context as remote, or when the parent is an outgoing span and this an incoming one (the app calling
+        itself, as the AWS SDK app does for its mocked endpoints).
+        """
+        if not self.span.parent_span_id or self.parent is None:
+            return True
+        if self.span.flags & _REMOTE_PARENT_FLAGS == _REMOTE_PARENT_FLAGS:
+            return True
+        return self.parent.span.kind in _OUTGOING_KINDS and self.span.kind in _INCOMING_KINDS
+
+    @property
+    def local_root(self) -> "SpanNode":
+        node: SpanNode = self
+        while not node.is_local_root:
+            node = node.parent
+        return node
+
+    def ancestors(self) -> Iterator["SpanNode"]:
+        node: Optional[SpanNode] = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def descendants(self, *predicates: Callable[["SpanNode"], bool]) -> List["SpanNode"]:
+        """All spans below this one that satisfy every predicate, depth first in start time order."""
+        found: List[SpanNode] = []
+        stack: List[SpanNode] = list(reversed(self.children))
+        while stack:
+            node: SpanNode = stack.pop()
+            if all(predicate(node) for predicate in predicates):
+                found.append(node)
+            stack.extend(reversed(node.children))
+        return found
+
+    def shape(self) -> SpanShape:
+        """The subtree rooted at this span as nested `(kind, name, children)` tuples, for `assertEqual`."""
+        return (
+            Span.SpanKind.Name(self.span.kind),
+            self.span.name,
+            tuple(child.shape() for child in self.children),
+        )
+
+
+class TraceIndex:
+    """All captured spans grouped by trace, with parent/child links resolved."""
+
+    def __init__(self, spans: Iterable[ResourceScopeSpan]):
+        self._traces: Dict[bytes, Dict[bytes, SpanNode]] = {}
+        nodes: List[SpanNode] = []
+        for record in spans:
+            node: SpanNode = SpanNode(record.resource_spans, record.scope_spans, record.span)
+            self._traces.setdefault(node.span.trace_id, {})[node.span.span_id] = node
+            nodes.append(node)
+
+        self._orphans: List[SpanNode] = []
+        for node in nodes:
+            if not node.span.parent_span_id:
+                continue
+            parent: Optional[SpanNode] = self._traces[node.span.trace_id].get(node.span.parent_span_id)
+            if parent is None:
+                self._orphans.append(node)
+            else:
+                node.parent = parent
+                parent.children.append(node)
+        for node in nodes:
+            node.children.sort(key=lambda child: child.span.start_time_unix_nano)
+
+    @property
+    def trace_ids(self) -> List[bytes]:
+        return list(self._traces)
+
+    def trace(self, trace_id: bytes) -> List[SpanNode]:
+        return list(self._traces.get(trace_id, {}).values())
+
+    def node(self, trace_id: bytes, span_id: bytes) -> Optional[SpanNode]:
+        return self._traces.get(trace_id, {}).get(span_id)
+
+    def find(self, *predicates: Callable[[SpanNode], bool]) -> List[SpanNode]:
+        """All spans, across traces, that satisfy every predicate."""
+        return [node for trace in self._traces.values() for node in trace.values() if all(p(node) for p in predicates)]
+
+    def roots(self) -> List[SpanNode]:
+        """Spans without a captured parent: trace roots and orphans."""
+        return self.find(lambda node: node.parent is None)
+
+    def local_roots(self) -> List[SpanNode]:
+        return self.find(lambda node: node.is_local_root)
+
+    @property
+    def orphans(self) -> List[SpanNode]:
+        """Spans whose parent id points at a span that was not captured."""
+        return list(self._orphans)
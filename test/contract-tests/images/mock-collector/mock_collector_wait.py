@@ -0,0 +1,195 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Polling strategies for tests that wait on exported telemetry.
+
+A `WaitStrategy` repeatedly calls `poll()` until `done(result)` holds or its timeout expires. Strategies differ only in
+the sleep between polls:
+  * `FixedIntervalWait` sleeps the same interval every time (what `MockCollectorClient` always did).
+  * `AdaptiveBackoffWait` starts with short sleeps, so telemetry that is already there is seen almost immediately, and
+    grows them geometrically up to a maximum, typically a fraction of the exporter's flush interval.
+
+`stable_for(window)` builds a `done` condition that holds once the result is non-empty and its size has not changed for
+`window` seconds, i.e. the exporter has gone quiet.
+
+Every wait is recorded as a `WaitTiming` in `strategy.timings`. A wait that times out raises `WaitTimeoutError`, whose
+message carries the label, polls, elapsed time, result size history and the last poll error.
+"""
+import asyncio
+import time
+from logging import Logger, getLogger
+from typing import Any, Awaitable, Callable, Iterator, List, Optional, Sized, TypeVar
+
+_logger: Logger = getLogger(__name__)
+T = TypeVar("T")
+
+_HISTORY_LENGTH: int = 10
+
+
+class WaitTiming:
+    """How one wait went: number of polls, elapsed seconds, result sizes seen and whether it succeeded."""
+
+    def __init__(self, label: str):
+        self.label: str = label
+        self.polls: int = 0
+        self.elapsed: float = 0.0
+        self.succeeded: bool = False
+        self.sizes: List[int] = []
+        self.errors: int = 0
+        self.last_error: Optional[BaseException] = None
+
+    def describe(self) -> str:
+        history: List[int] = self.sizes[-_HISTORY_LENGTH:]
+        description: str = (
+            f"{self.label}: {'done' if self.succeeded else 'timed out'} after {self.elapsed:.2f}s and {self.polls} "
+            f"poll(s); last result sizes {history}"
+        )
+        if self.errors:
+            description += f"; {self.errors} poll(s) failed, last with {self.last_error!r}"
+        return description
+
+
+class WaitTimeoutError(RuntimeError):
+    """Raised when a wait does not complete in time; `timing` holds the diagnostics."""
+
+    def __init__(self, timing: WaitTiming):
+        super().__init__(f"Timeout waiting for {timing.describe()}")
+        self.timing: WaitTiming = timing
+
+
+class WaitStrategy:
+    """Base class; subclasses provide the sleep intervals."""
+
+    def __init__(self, timeout: float):
+        self.timeout: float = timeout
+        self.timings: List[WaitTiming] = []
+
+    def intervals(self) -> Iterator[float]:
+        raise NotImplementedError
+
+    def until(self, poll: Callable[[], T], done: Callable[[T], bool], label: str = "content") -> T:
+        """Poll until `done(result)`; return that result or raise `WaitTimeoutError`."""
+        timing: WaitTiming = WaitTiming(label)
+        start: float = time.monotonic()
+        intervals: Iterator[float] = self.intervals()
+        while True:
+            result: Any = _attempt(poll, timing)
+            timing.elapsed = time.monotonic() - start
+            if result is not _FAILED and done(result):
+                return self._finish(timing, True, result)
+            remaining: float = self.timeout - timing.elapsed
+            if remaining <= 0:
+                self._finish(timing, False, None)
+                raise WaitTimeoutError(timing)
+            time.sleep(min(next(intervals), remaining))
+
+    async def until_async(
+        self,
+        poll: Callable[[], Awaitable[T]],
+        done: Callable[[T], bool],
+        label: str = "content",
+        deadline: Optional[float] = None,
+    ) -> T:
+        """`until` for coroutines. `deadline` (event loop time) overrides the timeout so waits can share one."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        timing: WaitTiming = WaitTiming(label)
+        start: float = loop.time()
+        if deadline is None:
+            deadline = start + self.timeout
+        intervals: Iterator[float] = self.intervals()
+        while True:
+            try:
+                result: Any = await poll()
+            # pylint: disable=broad-exception-caught
+            except Exception as error:
+                result = _record_error(timing, error)
+            else:
+                _record_result(timing, result)
+            timing.elapsed = loop.time() - start
+            if result is not _FAILED and done(result):
+                return self._finish(timing, True, result)
+            remaining: float = deadline - loop.time()
+            if remaining <= 0:
+                self._finish(timing, False, None)
+                raise WaitTimeoutError(timing)
+            await asyncio.sleep(min(next(intervals), remaining))
+
+    def _finish(self, timing: WaitTiming, succeeded: bool, result: Any) -> Any:
+        timing.succeeded = succeeded
+        self.timings.append(timing)
+        _logger.debug("%s", timing.describe())
+        return result
+
+
+class FixedIntervalWait(WaitStrategy):
+    def __init__(self, interval: float, timeout: float):
+        super().__init__(timeout)
+        self.interval: float = interval
+
+    def intervals(self) -> Iterator[float]:
+        while True:
+            yield self.interval
+
+
+class AdaptiveBackoffWait(WaitStrategy):
+    """Sleeps `initial_interval`, then `factor` times longer after every poll, never more than `max_interval`."""
+
+    def __init__(self, initial_interval: float, max_interval: float, timeout: float, factor: float = 2.0):
+        super().__init__(timeout)
+        self.initial_interval: float = initial_interval
+        self.max_interval: float = max_interval
+        self.factor: float = factor
+
+    def intervals(self) -> Iterator[float]:
+        interval: float = self.initial_interval
+        while True:
+            yield interval
+            interval = min(interval * self.factor, self.max_interval)
+
+
+def stable_for(window: float, ready: Callable[[Any], bool] = bool) -> Callable[[Sized], bool]:
+    """Condition that holds once `ready(result)` and the size of the result has not changed for `window` seconds."""
+    last_size: List[Optional[int]] = [None]
+    changed_at: List[float] = [0.0]
+
+    def done(result: Sized) -> bool:
+        now: float = time.monotonic()
+        if len(result) != last_size[0]:
+            last_size[0], changed_at[0] = len(result), now
+            return False
+        return ready(result) and now - changed_at[0] >= window
+
+    return done
+
+
+_FAILED: object = object()
+
+
+def _attempt(poll: Callable[[], Any], timing: WaitTiming) -> Any:
+    try:
+        result: Any = poll()
+    # pylint: disable=broad-exception-caught
+    except Exception as error:
+        return _record_error(timing, error)
+    _record_result(timing, result)
+    return result
+
+
+def _record_result(timing: WaitTiming, result: Any) -> None:
+    timing.polls += 1
+    timing.sizes.append(_size_of(result))
+
+
+def _record_error(timing: WaitTiming, error: Exception) -> object:
+    timing.polls += 1
+    timing.errors += 1
+    timing.last_error = error
+    _logger.exception("Error while reading content")
+    return _FAILED
+
+
+def _size_of(result: Any) -> int:
+    try:
+        return len(result)
+    except TypeError:
+        return 1 if result else 0
@@ -0,0 +1,241 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Cold-start benchmark of SimpleLambdaFunction with and without the distro's `otel-instrument` wrapper.
+
+Each cold start is a fresh function container whose runtime polls a `LambdaRuntimeApiEmulator` on the host. The
+emulator records init duration and per-invocation duration; the first invocation of a container is the cold one, the
+rest are warm. Instrumented runs export spans to the mock collector over OTLP/gRPC, and the benchmark checks they
+arrive. Init duration includes container creation, which is the same for both modes and cancels out in the deltas.
+
+Not collected by default; build the function image with `BUILD_LAMBDA_BENCHMARK_IMAGE=true ./set-up-contract-tests.sh`
+and run with `pytest contract-tests/tests/test/amazon/awslambda/lambda_cold_start_benchmark.py`.
+Sample sizes: LAMBDA_BENCHMARK_COLD_STARTS (default 5), LAMBDA_BENCHMARK_WARM_INVOCATIONS (default 10).
+
+A second benchmark measures the cost of the Lambda console log exporter (`OTEL_LOGS_EXPORTER=console`, which the
+distro serves with CompactConsoleLogRecordExporter). The function's stdout is streamed through a
+`ConsoleLogForwarder`, so the compact JSON logs reach the mock collector and are asserted like any OTLP log.
+"""
+import time
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, List, Optional
+
+from mock_collector_client import MockCollectorClient
+from mock_collector_console_log_adapter import ConsoleLogForwarder, ConsoleLogStats
+from mock_collector_tables import LogRow, Selection
+from testcontainers.core.container import DockerContainer
+from typing_extensions import override
+
+from amazon.awslambda.lambda_runtime_api_emulator import LambdaInvocation, LambdaRuntimeApiEmulator
+from amazon.base.application_launcher import LAUNCHER_ENV, is_native_launch_enabled
+from amazon.base.contract_test_base import NETWORK_NAME, ContractTestBase
+from amazon.base.shared_mock_collector import MOCK_COLLECTOR_ALIAS
+from amazon.utils.benchmark_utils import delta, get_int_env, summarize, write_benchmark_report
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+_LAMBDA_IMAGE_NAME: str = "aws-application-signals-tests-simplelambdafunction-app"
+_FUNCTION_NAME: str = "SimpleLambdaFunction"
+_FUNCTION_HANDLER: str = "SimpleLambdaFunction::SimpleLambdaFunction.Function::FunctionHandler"
+_HOST_ALIAS: str = "host.docker.internal"
+_RUNTIME_BOOTSTRAP: str = "/var/runtime/bootstrap"
+_OTEL_INSTRUMENT_WRAPPER: str = "/opt/otel-instrument"
+_INIT_TIMEOUT_SEC: float = 120
+_INVOCATION_TIMEOUT_SEC: float = 60
+_SPAN_WAIT_TIMEOUT_SEC: float = 30
+_CONSOLE_STREAM_DRAIN_TIMEOUT_SEC: float = 10
+# Logged at Information level by every SimpleLambdaFunction invocation.
+_FUNCTION_INFO_LOG_BODY: str = "info-level-test-message"
+_API_GATEWAY_EVENT: Dict[str, Any] = {
+    "resource": "/benchmark",
+    "path": "/benchmark",
+    "httpMethod": "GET",
+    "headers": {"Host": "benchmark.execute-api.us-east-1.amazonaws.com"},
+    "requestContext": {"resourcePath": "/benchmark", "httpMethod": "GET", "stage": "test"},
+    "isBase64Encoded": False,
+}
+
+
+class LambdaColdStartBenchmark(ContractTestBase):
+    """Reuses the network and mock collector of ContractTestBase; the function containers are managed per run."""
+
+    @override
+    def setUp(self) -> None:
+        if is_native_launch_enabled():
+            self.skipTest(f"The functions run in Lambda runtime containers; unset {LAUNCHER_ENV}")
+        self.addCleanup(self.tear_down)
+        self.mock_collector_client: MockCollectorClient = self.mock_collector_handle.create_client()
+        self.mock_collector_client.clear_signals()
+
+    @override
+    def tear_down(self) -> None:
+        self.mock_collector_client.clear_signals()
+
+    def test_cold_start_instrumentation_overhead(self) -> None:
+        cold_starts: int = get_int_env("LAMBDA_BENCHMARK_COLD_STARTS", 5)
+        warm_invocations: int = get_int_env("LAMBDA_BENCHMARK_WARM_INVOCATIONS", 10)
+
+        baseline: Dict[str, List[float]] = self._run_cold_starts(False, cold_starts, warm_invocations)
+        instrumented: Dict[str, List[float]] = self._run_cold_starts(True, cold_starts, warm_invocations)
+
+        report: Dict[str, Any] = {
+            "cold_starts": cold_starts,
+            "warm_invocations_per_cold_start": warm_invocations,
+            "instrumentation_off": {key: summarize(samples) for key, samples in baseline.items()},
+            "instrumentation_on": {key: summarize(samples) for key, samples in instrumented.items()},
+        }
+        report["overhead_ms"] = {
+            key: delta(report["instrumentation_on"][key], report["instrumentation_off"][key])
+            for key in ("init_ms", "cold_invocation_ms", "warm_invocation_ms")
+        }
+        write_benchmark_report("lambda_cold_start", report)
+
+        self.assertEqual(cold_starts, len(instrumented["init_ms"]))
+        self.assertEqual(cold_starts, len(baseline["init_ms"]))
+        # After the report is written, so the timings of a run with failed invocations can still be inspected.
+        self.assertEqual([0.0] * cold_starts, instrumented["failed_invocations"], "failed invocations, instrumented")
+        self.assertEqual([0.0] * cold_starts, baseline["failed_invocations"], "failed invocations, not instrumented")
+
+    def test_console_log_export_overhead(self) -> None:
+        cold_starts: int = get_int_env("LAMBDA_BENCHMARK_COLD_STARTS", 5)
+        warm_invocations: int = get_int_env("LAMBDA_BENCHMARK_WARM_INVOCATIONS", 10)
+
+        without_logs: Dict[str, List[float]] = self._run_cold_starts(True, cold_starts, warm_invocations)
+        with_logs: Dict[str, List[float]] = self._run_cold_starts(True, cold_starts, warm_invocations, True)
+
+        report: Dict[str, Any] = {
+            "cold_starts": cold_starts,
+            "warm_invocations_per_cold_start": warm_invocations,
+            "logs_exporter_none": {key: summarize(samples) for key, samples in without_logs.items()},
+            "logs_exporter_console": {key: summarize(samples) for key, samples in with_logs.items()},
+        }
+        report["overhead_ms"] = {
+            key: delta(report["logs_exporter_console"][key], report["logs_exporter_none"][key])
+            for key in ("init_ms", "cold_invocation_ms", "warm_invocation_ms")
+        }
+        write_benchmark_report("lambda_console_logs", report)
+
+        self.assertEqual(cold_starts, len(with_logs["console_log_records"]))
+        self.assertEqual([0.0] * cold_starts, with_logs["failed_invocations"], "failed invocations, console logs")
+        self.assertEqual([0.0] * cold_starts, without_logs["failed_invocations"], "failed invocations, no logs")
+
+    def _run_cold_starts(
+        self, instrumented: bool, cold_starts: int, warm_invocations: int, console_logs: bool = False
+    ) -> Dict[str, List[float]]:
+        samples: Dict[str, List[float]] = {
+            "init_ms": [],
+            "cold_invocation_ms": [],
+            "warm_invocation_ms": [],
+            "failed_invocations": [],
+        }
+        if console_logs:
+            samples["console_log_records"] = []
+            samples["console_log_bytes_per_invocation"] = []
+        for _ in range(cold_starts):
+            emulator: LambdaRuntimeApiEmulator = LambdaRuntimeApiEmulator(function_name=_FUNCTION_NAME)
+            emulator.start()
+            container: DockerContainer = self._create_function_container(emulator, instrumented, console_logs)
+            forwarder: Optional[ConsoleLogForwarder] = None
+            try:
+                emulator.mark_started()
+                container.start()
+                if console_logs:
+                    forwarder = ConsoleLogForwarder(
+                        container.get_wrapped_container().logs(stdout=True, stderr=False, stream=True, follow=True),
+                        self.mock_collector_handle.host,
+                        self.mock_collector_handle.grpc_port,
+                    )
+                    forwarder.start()
+                samples["init_ms"].append(emulator.wait_for_init(_INIT_TIMEOUT_SEC))
+
+                invocations: List[LambdaInvocation] = [
+                    emulator.invoke(_API_GATEWAY_EVENT, _INVOCATION_TIMEOUT_SEC) for _ in range(1 + warm_invocations)
+                ]
+                samples["cold_invocation_ms"].append(invocations[0].duration_ms)
+                samples["warm_invocation_ms"].extend(invocation.duration_ms for invocation in invocations[1:])
+                samples["failed_invocations"].append(float(sum(1 for inv in invocations if not inv.succeeded)))
+
+                if instrumented:
+                    self._assert_invocation_spans_exported(len(invocations))
+                if forwarder is not None:
+                    # Stop (not remove) the container so its stdout stream ends and the forwarder drains it.
+                    container.get_wrapped_container().stop()
+                    forwarder.join(_CONSOLE_STREAM_DRAIN_TIMEOUT_SEC)
+                    stats: ConsoleLogStats = forwarder.stats
+                    self._assert_invocation_console_logs_ingested(len(invocations))
+                    samples["console_log_records"].append(float(stats.forwarded))
+                    samples["console_log_bytes_per_invocation"].append(stats.compact_log_bytes / len(invocations))
+            finally:
+                self._stop_function_container(container)
+                emulator.stop()
+                self.mock_collector_client.clear_signals()
+        return samples
+
+    def _create_function_container(
+        self, emulator: LambdaRuntimeApiEmulator, instrumented: bool, console_logs: bool
+    ) -> DockerContainer:
+        # The image's own entrypoint starts the Runtime Interface Emulator when AWS_LAMBDA_RUNTIME_API is unset, so
+        # the bootstrap is launched directly. The wrapper is prepended explicitly rather than through
+        # AWS_LAMBDA_EXEC_WRAPPER so that the "off" runs are guaranteed to load no profiler at all.
+        entrypoint: List[str] = [_OTEL_INSTRUMENT_WRAPPER, _RUNTIME_BOOTSTRAP] if instrumented else [_RUNTIME_BOOTSTRAP]
+        container: DockerContainer = (
+            DockerContainer(_LAMBDA_IMAGE_NAME)
+            .with_command(_FUNCTION_HANDLER)
+            .with_env("_HANDLER", _FUNCTION_HANDLER)
+            .with_env("AWS_LAMBDA_RUNTIME_API", emulator.runtime_api_address(_HOST_ALIAS))
+            .with_env("AWS_LAMBDA_FUNCTION_NAME", _FUNCTION_NAME)
+            .with_env("AWS_LAMBDA_FUNCTION_VERSION", "$LATEST")
+            .with_env("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", "512")
+            .with_env("AWS_LAMBDA_LOG_GROUP_NAME", f"/aws/lambda/{_FUNCTION_NAME}")
+            .with_env("AWS_LAMBDA_LOG_STREAM_NAME", "benchmark")
+            .with_env("AWS_REGION", "us-east-1")
+            .with_env("AWS_DEFAULT_REGION", "us-east-1")
+            .with_env("AWS_ACCESS_KEY_ID", "testcontainers-localstack")
+            .with_env("AWS_SECRET_ACCESS_KEY", "testcontainers-localstack")
+            .with_env("AWS_ENDPOINT_URL_S3", f"http://{emulator.runtime_api_address(_HOST_ALIAS)}")
+            .with_env("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc")
+            .with_env("OTEL_EXPORTER_OTLP_HEADERS", "te=trailers")
+            .with_env(
+                "OTEL_EXPORTER_OTLP_TRACES_ENDPOINT",
+                f"http://{MOCK_COLLECTOR_ALIAS}:{self.mock_collector_handle.endpoint_grpc_port}",
+            )
+            .with_env("OTEL_TRACES_SAMPLER", "always_on")
+            .with_env("OTEL_LOGS_EXPORTER", "console" if console_logs else "none")
+            .with_kwargs(
+                network=NETWORK_NAME,
+                entrypoint=entrypoint,
+                extra_hosts={_HOST_ALIAS: "host-gateway", **self.mock_collector_handle.extra_hosts},
+                mem_limit="512m",
+            )
+        )
+        return container
+
+    def _stop_function_container(self, container: DockerContainer) -> None:
+        try:
+            _logger.info("Function stdout")
+            _logger.info(container.get_logs()[0].decode())
+            _logger.info("Function stderr")
+            _logger.info(container.get_logs()[1].decode())
+            container.stop()
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Failed to tear down function container")
+
+    def _assert_invocation_spans_exported(self, invocation_count: int) -> None:
+        # LambdaWrapper force-flushes after every invocation, but export is still asynchronous to the response.
+        deadline: float = time.monotonic() + _SPAN_WAIT_TIMEOUT_SEC
+        server_spans: Optional[Selection] = None
+        while time.monotonic() < deadline:
+            server_spans = self.mock_collector_client.get_span_table().where(kind=Span.SPAN_KIND_SERVER)
+            if len(server_spans) >= invocation_count:
+                break
+            time.sleep(1)
+        self.assertEqual(invocation_count, len(server_spans))
+
+    def _assert_invocation_console_logs_ingested(self, invocation_count: int) -> None:
+        info_logs: Selection = self.mock_collector_client.get_log_table().where(body=_FUNCTION_INFO_LOG_BODY)
+        self.assertEqual(invocation_count, len(info_logs))
+        first_log: LogRow = info_logs.first()
+        self.assertEqual("INFO", first_log.severity_text)
+        self.assertEqual(_FUNCTION_NAME, first_log.resource_attributes.get("faas.name"))
@@ -0,0 +1,273 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Minimal in-process implementation of the AWS Lambda Runtime API (2018-06-01).
+
+The Lambda base images run `/var/runtime/bootstrap`, which polls `AWS_LAMBDA_RUNTIME_API` for invocations. Pointing
+that variable at this emulator lets a test drive a real function container (with or without the distro's
+`otel-instrument` wrapper) and time the phases Lambda itself reports: init duration (process start until the runtime
+first asks for work) and per-invocation duration (event handed out until the response is posted).
+
+Every path outside the Runtime API answers S3 `ListBuckets` with an empty result, so the sample function's S3 call can
+be served by the same listener via `AWS_ENDPOINT_URL_S3`.
+"""
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import INFO, Logger, getLogger
+from queue import Empty, Queue
+from typing import Dict, List, Optional, Tuple
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+_RUNTIME_PATH_PREFIX: str = "/2018-06-01/runtime"
+_NEXT_POLL_INTERVAL_SEC: float = 0.5
+_EMPTY_LIST_BUCKETS_RESULT: bytes = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<ListAllMyBucketsResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+    b"<Owner><ID>emulator</ID><DisplayName>emulator</DisplayName></Owner><Buckets></Buckets>"
+    b"</ListAllMyBucketsResult>"
+)
+
+
+class LambdaInvocation:
+    """One event handed to the runtime, and what the runtime answered."""
+
+    request_id: str
+    event: bytes
+    trace_header: str
+    enqueued_at: float
+    delivered_at: Optional[float]
+    completed_at: Optional[float]
+    succeeded: Optional[bool]
+    response: bytes
+
+    def __init__(self, event: bytes, trace_header: str):
+        self.request_id = str(uuid.uuid4())
+        self.event = event
+        self.trace_header = trace_header
+        self.enqueued_at = time.perf_counter()
+        self.delivered_at = None
+        self.completed_at = None
+        self.succeeded = None
+        self.response = b""
+        self._done: threading.Event = threading.Event()
+
+    @property
+    def duration_ms(self) -> float:
+        """Time between the runtime receiving the event and posting its result, like Lambda's `Duration`."""
+        if self.delivered_at is None or self.completed_at is None:
+            return 0.0
+        return (self.completed_at - self.delivered_at) * 1000
+
+    @property
+    def round_trip_ms(self) -> float:
+        """Time between the event being queued and the result being posted, including any wait for `next`."""
+        if self.completed_at is None:
+            return 0.0
+        return (self.completed_at - self.enqueued_at) * 1000
+
+    def complete(self, succeeded: bool, response: bytes) -> None:
+        self.completed_at = time.perf_counter()
+        self.succeeded = succeeded
+        self.response = response
+        self._done.set()
+
+    def wait(self, timeout: float) -> bool:
+        return self._done.wait(timeout)
+
+
+class LambdaRuntimeApiEmulator:
+    """Serves the Lambda Runtime API on an ephemeral port of all interfaces.
+
+    Usage: `start()`, launch the function with `AWS_LAMBDA_RUNTIME_API` set to `runtime_api_address(host)`, call
+    `wait_for_init()`, then `invoke()` as many times as needed and `stop()`. An emulator serves one runtime process;
+    create a new one for each cold start.
+    """
+
+    function_arn: str
+    deadline_ms: int
+    started_at: float
+    first_next_at: Optional[float]
+    init_error: Optional[bytes]
+
+    def __init__(
+        self,
+        function_name: str = "SimpleLambdaFunction",
+        region: str = "us-east-1",
+        deadline_ms: int = 30000,
+    ):
+        self.function_arn = f"arn:aws:lambda:{region}:000000000000:function:{function_name}"
+        self.deadline_ms = deadline_ms
+        self.started_at = time.perf_counter()
+        self.first_next_at = None
+        self.init_error = None
+        self._pending: Queue = Queue()
+        self._in_flight: Dict[str, LambdaInvocation] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._ready: threading.Event = threading.Event()
+        self._stopped: threading.Event = threading.Event()
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(("0.0.0.0", 0), _create_handler(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def runtime_api_address(self, host: str) -> str:
+        """Value for `AWS_LAMBDA_RUNTIME_API`, as seen from wherever the runtime runs."""
+        return f"{host}:{self.port}"
+
+    def start(self) -> None:
+        self.started_at = time.perf_counter()
+        self._thread.start()
+        _logger.info("Lambda Runtime API emulator listening on port %s", self.port)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def mark_started(self) -> None:
+        """Reset the init clock, e.g. right before the function container is started."""
+        self.started_at = time.perf_counter()
+
+    def wait_for_init(self, timeout: float) -> float:
+        """Wait until the runtime asks for its first event and return the init duration in milliseconds.
+
+        Raises TimeoutError if the runtime never polls, and RuntimeError if it reported an init error instead.
+        """
+        if not self._ready.wait(timeout):
+            raise TimeoutError(f"Lambda runtime did not request an invocation within {timeout} seconds")
+        if self.init_error is not None:
+            raise RuntimeError(f"Lambda runtime reported an init error: {self.init_error.decode(errors='replace')}")
+        return (self.first_next_at - self.started_at) * 1000
+
+    def invoke(self, event: Dict, timeout: float) -> LambdaInvocation:
+        """Queue `event` for the runtime and block until it posts a response or an error."""
+        invocation: LambdaInvocation = LambdaInvocation(json.dumps(event).encode(), _new_trace_header())
+        self._pending.put(invocation)
+        if not invocation.wait(timeout):
+            raise TimeoutError(f"Lambda invocation {invocation.request_id} did not complete within {timeout} seconds")
+        return invocation
+
+    def _next_invocation(self) -> Optional[LambdaInvocation]:
+        with self._lock:
+            if self.first_next_at is None:
+                self.first_next_at = time.perf_counter()
+                self._ready.set()
+        while not self._stopped.is_set():
+            try:
+                invocation: LambdaInvocation = self._pending.get(timeout=_NEXT_POLL_INTERVAL_SEC)
+            except Empty:
+                continue
+            invocation.delivered_at = time.perf_counter()
+            with self._lock:
+                self._in_flight[invocation.request_id] = invocation
+            return invocation
+        return None
+
+    def _complete_invocation(self, request_id: str, succeeded: bool, response: bytes) -> bool:
+        with self._lock:
+            invocation: Optional[LambdaInvocation] = self._in_flight.pop(request_id, None)
+        if invocation is None:
+            return False
+        invocation.complete(succeeded, response)
+        return True
+
+    def _report_init_error(self, error: bytes) -> None:
+        with self._lock:
+            self.init_error = error
+            if self.first_next_at is None:
+                self.first_next_at = time.perf_counter()
+            self._ready.set()
+
+
+def _new_trace_header() -> str:
+    trace_id: str = uuid.uuid4().hex[:24]
+    parent_id: str = uuid.uuid4().hex[:16]
+    return f"Root=1-{int(time.time()):08x}-{trace_id};Parent={parent_id};Sampled=1"
+
+
+def _create_handler(emulator: LambdaRuntimeApiEmulator):
+    class LambdaRuntimeApiHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        # pylint: disable=invalid-name
+        def do_GET(self) -> None:
+            if self.path == f"{_RUNTIME_PATH_PREFIX}/invocation/next":
+                self._handle_next()
+            else:
+                self._send(200, _EMPTY_LIST_BUCKETS_RESULT, "application/xml")
+
+        # pylint: disable=invalid-name
+        def do_POST(self) -> None:
+            body: bytes = self._read_body()
+            if self.path == f"{_RUNTIME_PATH_PREFIX}/init/error":
+                emulator._report_init_error(body)
+                self._send(202, b'{"status":"OK"}')
+                return
+
+            request_id, action = _parse_invocation_path(self.path)
+            if request_id is None or action not in ("response", "error"):
+                self._send(404, b'{"errorMessage":"Unknown path","errorType":"InvalidRequest"}')
+            elif emulator._complete_invocation(request_id, action == "response", body):
+                self._send(202, b'{"status":"OK"}')
+            else:
+                self._send(400, b'{"errorMessage":"Unknown request id","errorType":"InvalidRequestID"}')
+
+        def _handle_next(self) -> None:
+            invocation: Optional[LambdaInvocation] = emulator._next_invocation()
+            if invocation is None:
+                self._send(410, b'{"errorMessage":"Emulator stopped","errorType":"Gone"}')
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(invocation.event)))
+            self.send_header("Lambda-Runtime-Aws-Request-Id", invocation.request_id)
+            self.send_header("Lambda-Runtime-Deadline-Ms", str(int(time.time() * 1000) + emulator.deadline_ms))
+            self.send_header("Lambda-Runtime-Invoked-Function-Arn", emulator.function_arn)
+            self.send_header("Lambda-Runtime-Trace-Id", invocation.trace_header)
+            self.end_headers()
+            self.wfile.write(invocation.event)
+
+        def _read_body(self) -> bytes:
+            # The .NET runtime client streams responses, so both chunked and fixed-length bodies show up here.
+            if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                chunks: List[bytes] = []
+                while True:
+                    chunk_size: int = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                    if chunk_size == 0:
+                        self.rfile.readline()
+                        return b"".join(chunks)
+                    chunks.append(self.rfile.read(chunk_size))
+                    self.rfile.readline()
+            content_length: int = int(self.headers.get("Content-Length", 0))
+            return self.rfile.read(content_length) if content_length > 0 else b""
+
+        def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        # pylint: disable=redefined-builtin
+        def log_message(self, format: str, *args) -> None:
+            _logger.debug(format, *args)
+
+    return LambdaRuntimeApiHandler
+
+
+def _parse_invocation_path(path: str) -> Tuple[Optional[str], Optional[str]]:
+    prefix: str = f"{_RUNTIME_PATH_PREFIX}/invocation/"
+    if not path.startswith(prefix):
+        return None, None
+    parts = path[len(prefix) :].split("/")
+    if len(parts) != 2:
+        return None, None
+    return parts[0], parts[1]
@@ -2,12 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 from logging import INFO, Logger, getLogger
 from typing import Dict, List
-from docker.types import EndpointConfig
-from mock_collector_client import ResourceScopeMetric, ResourceScopeSpan
-from testcontainers.localstack import LocalStackContainer
+from mock_collector_client import ResourceScopeMetric, ResourceScopeSpan, span_of_kind
+from mock_collector_trace_index import SpanNode, TraceIndex
 from typing_extensions import override
 
 from amazon.base.contract_test_base import NETWORK_NAME, ContractTestBase
+from amazon.base.dependency_pool import LocalStackDependency, dependency_pool
 from amazon.utils.application_signals_constants import (
     AWS_LOCAL_SERVICE,
     AWS_REMOTE_CLOUDFORMATION_PRIMARY_IDENTIFIER,
@@ -59,7 +59,7 @@ _DB_SYSTEM: str = "db.system"
 
 # pylint: disable=too-many-public-methods
 class AWSSdkTest(ContractTestBase):
-    _local_stack: LocalStackContainer
+    _local_stack: LocalStackDependency
 
     def get_application_extra_environment_variables(self) -> Dict[str, str]:
         return {
@@ -87,33 +87,17 @@ class AWSSdkTest(ContractTestBase):
     @classmethod
     @override
     def set_up_dependency_container(cls):
-        local_stack_networking_config: Dict[str, EndpointConfig] = {
-            NETWORK_NAME: EndpointConfig(
-                version="1.22",
-                aliases=[
-                    "localstack",
-                    "s3.localstack",
-                ],
+        cls._local_stack = dependency_pool().acquire(
+            LocalStackDependency(
+                NETWORK_NAME,
+                aliases=["localstack", "s3.localstack"],
+                services=["s3", "secretsmanager", "sns", "sqs", "stepfunctions", "dynamodb", "kinesis"],
+                region="us-west-2",
             )
-        }
-        cls._local_stack: LocalStackContainer = (
-            LocalStackContainer(image="localstack/localstack:4.0.0")
-            .with_name("localstack")
-            .with_services("s3", "secretsmanager", "sns", "sqs", "stepfunctions", "dynamodb", "kinesis")
-            .with_env("DEFAULT_REGION", "us-west-2")
-            .with_kwargs(network=NETWORK_NAME, networking_config=local_stack_networking_config)
         )
-        cls._local_stack.start()
-
-
-    @classmethod
-    @override
-    def tear_down_dependency_container(cls):
-        _logger.info("LocalStack stdout")
-        _logger.info(cls._local_stack.get_logs()[0].decode())
-        _logger.info("LocalStack stderr")
-        _logger.info(cls._local_stack.get_logs()[1].decode())
-        cls._local_stack.stop()
+        # Reset once per class rather than per test: the tests build on each other's resources (the object tests use
+        # the bucket test_s3_create_bucket creates, and so on), so only what earlier classes left behind is removed.
+        cls._local_stack.reset()
 
     def test_s3_create_bucket(self):
         self.do_test_requests(
@@ -914,15 +898,17 @@ class AWSSdkTest(ContractTestBase):
 
     @override
     def _assert_aws_span_attributes(self, resource_scope_spans: List[ResourceScopeSpan], path: str, **kwargs) -> None:
-        target_spans: List[Span] = []
-        for resource_scope_span in resource_scope_spans:
-            # pylint: disable=no-member
-            if resource_scope_span.span.kind == Span.SPAN_KIND_CLIENT:
-                target_spans.append(resource_scope_span.span)
+        # pylint: disable=no-member
+        target_spans: List[SpanNode] = TraceIndex(resource_scope_spans).find(span_of_kind(Span.SPAN_KIND_CLIENT))
 
         self.assertEqual(len(target_spans), 1)
+        # The SDK call is made while serving the test request, so its local root is that request's server span.
+        local_root: SpanNode = target_spans[0].local_root
+        self.assertIsNot(local_root, target_spans[0])
+        self.assertEqual(Span.SPAN_KIND_SERVER, local_root.span.kind)
+        self._assert_str_attribute(self._get_attributes_dict(local_root.span.attributes), AWS_SPAN_KIND, "LOCAL_ROOT")
         self._assert_aws_attributes(
-            target_spans[0].attributes,
+            target_spans[0].span.attributes,
             kwargs.get("remote_service"),
             kwargs.get("remote_operation"),
             "CLIENT",
@@ -0,0 +1,166 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+How `ContractTestBase` starts the application under test: in its Docker image (the default) or as a local process.
+
+Set `CONTRACT_TESTS_LAUNCHER=native` to run the published application with the local `dotnet` instead
+(`NativeLauncher`). It gets the environment its image sets for the distribution (profiler, startup hook, additional
+deps and store) plus the one the test configures, so the instrumentation runs as it does in the container, without the
+container lifecycle that dominates short tests. That makes micro-benchmarks of the instrumentation overhead fast and
+repeatable on a development machine. Native mode needs:
+
+- `CONTRACT_TESTS_NATIVE_APPLICATIONS_DIR`: one `dotnet publish` output per application, in a directory named like
+  the application's directory under `images/applications` (e.g. `AppSignals.NetCore`);
+- `CONTRACT_TESTS_OTEL_DOTNET_AUTO_HOME`: the distribution built by `build-and-install-distro.sh`
+  (`test/dist/OpenTelemetryDistribution`).
+
+A native application listens on a free loopback port and exports over loopback to the mock collector, which then runs
+in the test process (native mode implies `CONTRACT_TESTS_IN_PROCESS_COLLECTOR`, see `shared_mock_collector`). There is
+no Docker network, so tests that need dependency containers are skipped (see `dependency_pool`). Wait patterns that
+name the working directory of the images (`/app`) are matched against the publish directory instead.
+
+Either way the started application is pooled between tests unless `CONTRACT_TESTS_REUSE_APPLICATION=false` (see
+`application_pool`).
+"""
+import os
+import platform
+import re
+import sys
+from typing import Dict, List
+
+from docker.types import EndpointConfig
+from testcontainers.core.container import DockerContainer
+
+from amazon.base.application_pool import Application, application_pool, stop_application, wait_until_ready
+from amazon.base.native_application import NativeApplication
+from amazon.base.parallel_execution import worker_scoped_name
+
+LAUNCHER_ENV: str = "CONTRACT_TESTS_LAUNCHER"
+NATIVE_APPLICATIONS_DIR_ENV: str = "CONTRACT_TESTS_NATIVE_APPLICATIONS_DIR"
+NATIVE_DISTRO_HOME_ENV: str = "CONTRACT_TESTS_OTEL_DOTNET_AUTO_HOME"
+
+# `set-up-contract-tests.sh` tags the image of images/applications/<Name> as aws-application-signals-tests-<name>-app.
+_IMAGE_PREFIX: str = "aws-application-signals-tests-"
+_IMAGE_SUFFIX: str = "-app"
+_IMAGE_WORKING_DIRECTORY_PATTERN: str = r"(?<![\w/])/app(?![\w.-])"
+
+
+class ApplicationSpec:
+    """What a test configures for its application, independent of how it is started."""
+
+    def __init__(
+        self,
+        image_name: str,
+        port: int,
+        environment: Dict[str, str],
+        wait_pattern: str,
+        network_name: str,
+        network_aliases: List[str],
+        extra_hosts: Dict[str, str],
+    ):
+        self.image_name: str = image_name
+        self.port: int = port
+        self.environment: Dict[str, str] = environment
+        self.wait_pattern: str = wait_pattern
+        self.network_name: str = network_name
+        self.network_aliases: List[str] = network_aliases
+        self.extra_hosts: Dict[str, str] = extra_hosts
+
+    @property
+    def name(self) -> str:
+        return worker_scoped_name(self.image_name)
+
+
+class ApplicationLauncher:
+    """Starts the application of a spec and waits until it is ready."""
+
+    def launch(self, spec: ApplicationSpec, reuse: bool, timeout: float) -> Application:
+        raise NotImplementedError
+
+
+class DockerLauncher(ApplicationLauncher):
+    def launch(self, spec: ApplicationSpec, reuse: bool, timeout: float) -> Application:
+        container: DockerContainer = DockerContainer(spec.image_name).with_exposed_ports(spec.port)
+        for key, value in spec.environment.items():
+            container.with_env(key, value)
+        container.with_kwargs(
+            network=spec.network_name,
+            networking_config={spec.network_name: EndpointConfig(version="1.22", aliases=spec.network_aliases)},
+            extra_hosts=spec.extra_hosts,
+        ).with_name(spec.name)
+        return _start(container, spec.wait_pattern, reuse, timeout)
+
+
+class NativeLauncher(ApplicationLauncher):
+    def __init__(self):
+        self.applications_directory: str = _required_directory(NATIVE_APPLICATIONS_DIR_ENV)
+        self.distro_home: str = _required_directory(NATIVE_DISTRO_HOME_ENV)
+
+    def launch(self, spec: ApplicationSpec, reuse: bool, timeout: float) -> Application:
+        directory: str = self.application_directory(spec.image_name)
+        environment: Dict[str, str] = {**self.distribution_environment(), **spec.environment}
+        application: NativeApplication = NativeApplication(spec.name, directory, environment)
+        # The content root of an application is its working directory: /app in the images, the publish output here.
+        wait_pattern: str = re.sub(_IMAGE_WORKING_DIRECTORY_PATTERN, lambda _: re.escape(directory), spec.wait_pattern)
+        return _start(application, wait_pattern, reuse, timeout)
+
+    def application_directory(self, image_name: str) -> str:
+        """The publish output of the application that `image_name` is built from."""
+        name: str = image_name
+        if name.startswith(_IMAGE_PREFIX) and name.endswith(_IMAGE_SUFFIX):
+            name = name[len(_IMAGE_PREFIX) : -len(_IMAGE_SUFFIX)]
+        for entry in os.listdir(self.applications_directory):
+            if entry.lower() == name.lower():
+                return os.path.join(self.applications_directory, entry)
+        raise RuntimeError(f"No published application for {image_name} in {self.applications_directory}")
+
+    def distribution_environment(self) -> Dict[str, str]:
+        """The environment the application Dockerfiles set for the distribution installed in the image."""
+        home: str = self.distro_home
+        return {
+            "OTEL_DOTNET_AUTO_HOME": home,
+            "CORECLR_PROFILER_PATH": _profiler_path(home),
+            "DOTNET_ADDITIONAL_DEPS": os.path.join(home, "AdditionalDeps"),
+            "DOTNET_SHARED_STORE": os.path.join(home, "store"),
+            "DOTNET_STARTUP_HOOKS": os.path.join(home, "net", "OpenTelemetry.AutoInstrumentation.StartupHook.dll"),
+            "RESOURCE_DETECTORS_ENABLED": "false",
+            "OTEL_EXPORTER_OTLP_HEADERS": "te=trailers",
+        }
+
+
+def _start(application: Application, wait_pattern: str, reuse: bool, timeout: float) -> Application:
+    if reuse:
+        return application_pool().acquire(application, wait_pattern, timeout=timeout)
+    # A pooled application from an earlier test may hold the name (and resources) this one needs.
+    application_pool().release()
+    application.start()
+    try:
+        wait_until_ready(application, wait_pattern, timeout)
+    except Exception:
+        stop_application(application)
+        raise
+    return application
+
+
+def _profiler_path(home: str) -> str:
+    # Same runtime identifiers as instrument.sh: the distribution only ships x64 for macOS.
+    if sys.platform == "darwin":
+        return os.path.join(home, "osx-x64", "OpenTelemetry.AutoInstrumentation.Native.dylib")
+    architecture: str = "arm64" if platform.machine().lower() in ("aarch64", "arm64") else "x64"
+    return os.path.join(home, f"linux-{architecture}", "OpenTelemetry.AutoInstrumentation.Native.so")
+
+
+def _required_directory(variable: str) -> str:
+    directory: str = os.environ.get(variable, "").strip()
+    if not directory or not os.path.isdir(directory):
+        raise RuntimeError(f"{LAUNCHER_ENV}=native needs {variable} to be set to a directory")
+    return os.path.abspath(directory)
+
+
+def is_native_launch_enabled() -> bool:
+    return os.environ.get(LAUNCHER_ENV, "docker").strip().lower() == "native"
+
+
+def application_launcher() -> ApplicationLauncher:
+    """The launcher selected by `CONTRACT_TESTS_LAUNCHER`."""
+    return NativeLauncher() if is_native_launch_enabled() else DockerLauncher()
@@ -0,0 +1,162 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Reuse of application containers between tests that start them with the same configuration.
+
+Starting the instrumented .NET application and waiting for its ready pattern is the largest fixed cost of a
+contract test, and most test classes start the very same container for every test method. `ApplicationPool.acquire`
+takes the `DockerContainer` a test has configured but not started, and returns the already running container if it
+was started from an identical specification (image, environment, ports, volumes, name and network settings, see
+`container_fingerprint`) and is still running. Otherwise it stops the pooled container, starts the new one and waits
+for it to be ready.
+
+The pool keeps a single container: an idle application of an earlier test class would keep exporting (runtime
+metrics, for one) into the collector the current test asserts on. Between tests that share the container, the test
+clears the collector. `ContractTestBase` releases the pool when a class tears down, since the container counts against
+the class's container slots (see `parallel_execution`); the session's pool is also stopped at the end of the pytest
+session (see `conftest.py`), or at interpreter exit under plain unittest. Set `CONTRACT_TESTS_REUSE_APPLICATION=false`
+to start a fresh container for every test.
+
+Applications run as local processes (`NativeApplication`, see `application_launcher`) are pooled the same way, by the
+fingerprint of their directory and environment.
+"""
+import atexit
+import hashlib
+import json
+import os
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, Optional, Union
+
+from testcontainers.core.container import DockerContainer
+from testcontainers.core.waiting_utils import wait_for_logs
+
+from amazon.base.native_application import NativeApplication
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+REUSE_APPLICATION_ENV: str = "CONTRACT_TESTS_REUSE_APPLICATION"
+
+# What a launcher starts; tests only use the methods both have in common.
+Application = Union[DockerContainer, NativeApplication]
+
+
+def container_fingerprint(container: DockerContainer) -> str:
+    """Hash of everything that goes into `docker run` for a configured, not yet started, container."""
+    # pylint: disable=protected-access
+    specification: Dict[str, Any] = {
+        "image": container.image,
+        "env": container.env,
+        "ports": container.ports,
+        "volumes": container.volumes,
+        "name": container._name,
+        "command": container._command,
+        "kwargs": container._kwargs,
+    }
+    return hashlib.sha256(json.dumps(specification, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def application_fingerprint(application: Application) -> str:
+    if isinstance(application, NativeApplication):
+        return application.fingerprint()
+    return container_fingerprint(application)
+
+
+def wait_until_ready(application: Application, wait_pattern: str, timeout: float) -> None:
+    if isinstance(application, NativeApplication):
+        application.wait_until_ready(wait_pattern, timeout)
+    else:
+        wait_for_logs(application, wait_pattern, timeout=timeout)
+
+
+def is_application_reuse_enabled() -> bool:
+    return os.environ.get(REUSE_APPLICATION_ENV, "true").strip().lower() != "false"
+
+
+class _PooledApplication:
+    def __init__(self, fingerprint: str, container: Application):
+        self.fingerprint: str = fingerprint
+        self.container: Application = container
+        self.label: str = container.name if isinstance(container, NativeApplication) else container.image
+        self.uses: int = 1
+
+
+class ApplicationPool:
+    """Holds the running application container and the fingerprint it was started from."""
+
+    def __init__(self):
+        self._current: Optional[_PooledApplication] = None
+
+    def acquire(self, container: Application, wait_pattern: str, timeout: float) -> Application:
+        """A running container for the specification of `container`: the pooled one if possible, else `container`."""
+        fingerprint: str = application_fingerprint(container)
+        current: Optional[_PooledApplication] = self._current
+        if current is not None and current.fingerprint == fingerprint and _is_running(current.container):
+            current.uses += 1
+            _logger.info("Reusing application %s (use %d)", current.label, current.uses)
+            return current.container
+        if current is not None:
+            _logger.info("Replacing application %s", current.label)
+            self.release()
+
+        container.start()
+        self._current = _PooledApplication(fingerprint, container)
+        try:
+            wait_until_ready(container, wait_pattern, timeout)
+        except Exception:
+            self.release()
+            raise
+        return container
+
+    def release(self) -> None:
+        """Log the output of the pooled container and stop it, if there is one."""
+        current: Optional[_PooledApplication] = self._current
+        self._current = None
+        if current is not None:
+            stop_application(current.container)
+
+
+def _is_running(container: Application) -> bool:
+    if isinstance(container, NativeApplication):
+        return container.is_running()
+    # pylint: disable=broad-exception-caught
+    try:
+        wrapped = container.get_wrapped_container()
+        wrapped.reload()
+        return wrapped.status == "running"
+    except Exception:
+        return False
+
+
+def stop_application(container: Application) -> None:
+    """Log the output of `container` and stop it."""
+    # pylint: disable=broad-exception-caught
+    try:
+        _logger.info("Application stdout")
+        _logger.info(container.get_logs()[0].decode())
+        _logger.info("Application stderr")
+        _logger.info(container.get_logs()[1].decode())
+        container.stop()
+    except Exception:
+        _logger.exception("Failed to tear down application")
+
+
+_pool: Optional[ApplicationPool] = None
+
+
+def application_pool() -> ApplicationPool:
+    """The session's pool, created on first call."""
+    global _pool  # pylint: disable=global-statement
+    if _pool is None:
+        _pool = ApplicationPool()
+        atexit.register(stop_application_pool)
+    return _pool
+
+
+def stop_application_pool() -> None:
+    """Stop every pooled application container. Idempotent."""
+    global _pool  # pylint: disable=global-statement
+    if _pool is not None:
+        pool: ApplicationPool = _pool
+        _pool = None
+        pool.release()
@@ -0,0 +1,55 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Base of the benchmarks that launch their own applications instead of the one `ContractTestBase` starts for every test.
+
+A benchmark measures one application per configuration (a mode, a setting of a sweep, a load level): it launches a
+fresh application with `launched`, which stops it and clears the mock collector when the block exits, samples its
+resources with `resource_sampler.sample_resources`, and drives it through `_url` and `_flush`.
+"""
+from contextlib import contextmanager
+from typing import Iterator
+
+from mock_collector_client import MockCollectorClient
+from requests import Response, request
+from typing_extensions import override
+
+from amazon.base.application_pool import Application, stop_application
+from amazon.base.contract_test_base import ContractTestBase
+
+_LAUNCH_TIMEOUT_SEC: float = 1200
+
+
+class BenchmarkBase(ContractTestBase):
+    """Reuses the launcher and mock collector of ContractTestBase; the application is launched per measurement."""
+
+    @override
+    def setUp(self) -> None:
+        self.addCleanup(self.tear_down)
+        self.mock_collector_client: MockCollectorClient = self.mock_collector_handle.create_client()
+        self.mock_collector_client.clear_signals()
+
+    @override
+    def tear_down(self) -> None:
+        self.mock_collector_client.clear_signals()
+
+    @contextmanager
+    def launched(self, timeout: float = _LAUNCH_TIMEOUT_SEC) -> Iterator[Application]:
+        """Launch a fresh application from `get_application_spec()` as `self.application` for the `with` block. It is
+        stopped when the block exits, and the telemetry it left at the mock collector is cleared."""
+        self.application = self.application_launcher.launch(self.get_application_spec(), False, timeout=timeout)
+        try:
+            yield self.application
+        finally:
+            stop_application(self.application)
+            self.mock_collector_client.clear_signals()
+
+    def _url(self, route: str) -> str:
+        address: str = self.application.get_container_host_ip()
+        port: str = self.application.get_exposed_port(self.get_application_port())
+        return f"http://{address}:{port}{route}"
+
+    def _flush(self) -> None:
+        """Flush the distro's pending telemetry through the application's `/test/flush` endpoint."""
+        response: Response = request("POST", self._url("/test/flush"), timeout=30)
+        self.assertEqual(200, response.status_code, "the distro did not flush")
@@ -3,28 +3,40 @@
 import time
 import re
 from logging import INFO, Logger, getLogger
-from typing import Dict, List
+from typing import Dict, List, Optional
 from unittest import TestCase
 
-from docker import DockerClient
-from docker.models.networks import Network, NetworkCollection
-from docker.types import EndpointConfig
+from docker.models.networks import Network
 from mock_collector_client import MockCollectorClient, ResourceScopeMetric, ResourceScopeSpan
 from requests import Response, request
 from testcontainers.core.container import DockerContainer
-from testcontainers.core.waiting_utils import wait_for_logs
 from typing_extensions import override
 
+from amazon.base.application_launcher import ApplicationLauncher, ApplicationSpec, application_launcher
+from amazon.base.application_pool import (
+    Application,
+    application_pool,
+    is_application_reuse_enabled,
+    stop_application,
+)
+from amazon.base.dependency_pool import dependency_pool
+from amazon.base.parallel_execution import ContainerLease, container_slots, worker_scoped_name
+from amazon.base.resource_sampler import ResourceSampler, ResourceSeries, start_resource_sampler
+from amazon.base.shared_mock_collector import (
+    SHARED_NETWORK_NAME,
+    MockCollectorHandle,
+    is_shared_collector_enabled,
+    shared_mock_collector,
+    start_mock_collector,
+)
 from amazon.utils.application_signals_constants import ERROR_METRIC, FAULT_METRIC, LATENCY_METRIC
 from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
 
-NETWORK_NAME: str = "aws-application-signals-network"
+NETWORK_NAME: str = SHARED_NETWORK_NAME
 
 _logger: Logger = getLogger(__name__)
 _logger.setLevel(INFO)
-_MOCK_COLLECTOR_ALIAS: str = "collector"
-_MOCK_COLLECTOR_NAME: str = "aws-application-signals-mock-collector"
-_MOCK_COLLECTOR_PORT: int = 4315
+_MOCK_COLLECTOR_NAME: str = worker_scoped_name("aws-application-signals-mock-collector")
 
 
 # pylint: disable=broad-exception-caught
@@ -35,30 +47,53 @@ class ContractTestBase(TestCase):
     container that receives telemetry data of the application being tested. 2. Create an application container which
     will be used to exercise the library under test.
 
+    The mock collector and network are shared by every class of the session (see `shared_mock_collector`) unless
+    CONTRACT_TESTS_SHARED_COLLECTOR=false, in which case each class starts and stops its own. The application container
+    is reused by consecutive tests that configure it identically (see `application_pool`) unless
+    CONTRACT_TESTS_REUSE_APPLICATION=false.
+
+    Dependency containers are started once per session by `dependency_pool` and reset before every test (see
+    `reset_dependency_state`).
+
+    Container and network names are unique per pytest-xdist worker, and every class leases a container slot for its
+    application, so classes can run in parallel (see `parallel_execution`).
+
+    The application is started by `application_launcher`, in its image or, with CONTRACT_TESTS_LAUNCHER=native, as a
+    local process; either way `application` has the container methods the tests use.
+
+    The resource usage of the application and mock collector is sampled while each test runs (see `resource_sampler`)
+    and kept in `resource_usage`, by target.
+
     Several methods are provided that can be overridden to customize the test scenario.
     """
 
-    application: DockerContainer
-    mock_collector: DockerContainer
+    application: Application
+    application_launcher: ApplicationLauncher
+    # None when the collector runs in the test process (CONTRACT_TESTS_IN_PROCESS_COLLECTOR=true).
+    mock_collector: Optional[DockerContainer]
     mock_collector_client: MockCollectorClient
-    network: Network
+    # None when the applications run as local processes (CONTRACT_TESTS_LAUNCHER=native).
+    network: Optional[Network]
+    mock_collector_handle: MockCollectorHandle
+    owns_mock_collector: bool
+    container_lease: ContainerLease
+    resource_sampler: Optional[ResourceSampler] = None
+    resource_usage: Dict[str, ResourceSeries] = {}
 
     @classmethod
     @override
     def setUpClass(cls) -> None:
         cls.addClassCleanup(cls.class_tear_down)
-        cls.network = NetworkCollection(client=DockerClient()).create(NETWORK_NAME)
-        mock_collector_networking_config: Dict[str, EndpointConfig] = {
-            NETWORK_NAME: EndpointConfig(version="1.22", aliases=[_MOCK_COLLECTOR_ALIAS])
-        }
-        cls.mock_collector: DockerContainer = (
-            DockerContainer(_MOCK_COLLECTOR_NAME)
-            .with_exposed_ports(_MOCK_COLLECTOR_PORT)
-            .with_name(_MOCK_COLLECTOR_NAME)
-            .with_kwargs(network=NETWORK_NAME, networking_config=mock_collector_networking_config)
+        cls.application_launcher = application_launcher()
+        cls.container_lease = container_slots().acquire(1)
+        cls.owns_mock_collector = not is_shared_collector_enabled()
+        cls.mock_collector_handle = (
+            start_mock_collector(NETWORK_NAME, _MOCK_COLLECTOR_NAME)
+            if cls.owns_mock_collector
+            else shared_mock_collector()
         )
-        cls.mock_collector.start()
-        wait_for_logs(cls.mock_collector, "Ready", timeout=20)
+        cls.network = cls.mock_collector_handle.network
+        cls.mock_collector = cls.mock_collector_handle.container
         cls.set_up_dependency_container()
 
     @classmethod
@@ -68,83 +103,93 @@ class ContractTestBase(TestCase):
         except Exception:
             _logger.exception("Failed to tear down dependency container")
 
-        try:
-            _logger.info("MockCollector stdout")
-            _logger.info(cls.mock_collector.get_logs()[0].decode())
-            _logger.info("MockCollector stderr")
-            _logger.info(cls.mock_collector.get_logs()[1].decode())
-            cls.mock_collector.stop()
-        except Exception:
-            _logger.exception("Failed to tear down mock collector")
+        # The pooled application counts against the class's container slots, so it does not outlive the class.
+        application_pool().release()
+        cls.container_lease.release()
 
-        cls.network.remove()
+        # The shared collector and pooled dependencies outlive the class; they are stopped at the end of the session.
+        if cls.owns_mock_collector:
+            if cls.network is not None:
+                dependency_pool().release_network(NETWORK_NAME)
+            cls.mock_collector_handle.stop()
 
     @override
     def setUp(self) -> None:
         self.addCleanup(self.tear_down)
-        application_networking_config: Dict[str, EndpointConfig] = {
-            NETWORK_NAME: EndpointConfig(version="1.22", aliases=self.get_application_network_aliases())
-        }
-        self.application: DockerContainer = (
-            DockerContainer(self.get_application_image_name())
-            .with_exposed_ports(self.get_application_port())
-            .with_env("OTEL_METRIC_EXPORT_INTERVAL", "50")
-            .with_env("OTEL_AWS_APPLICATION_SIGNALS_ENABLED", "true")
-            .with_env("OTEL_AWS_APPLICATION_SIGNALS_RUNTIME_ENABLED", self.is_runtime_enabled())
-            .with_env("OTEL_METRICS_EXPORTER", "none")
-            .with_env("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc")
-            .with_env("OTEL_BSP_SCHEDULE_DELAY", "1")
-            .with_env("OTEL_AWS_APPLICATION_SIGNALS_EXPORTER_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
-            .with_env("OTEL_EXPORTER_OTLP_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
-            .with_env("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
-            .with_env("OTEL_EXPORTER_OTLP_METRICS_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
-            .with_env("OTEL_RESOURCE_ATTRIBUTES", self.get_application_otel_resource_attributes())
-            .with_env("OTEL_TRACES_SAMPLER", "always_on")
-            .with_env("OTEL_DOTNET_AUTO_PLUGINS", "AWS.Distro.OpenTelemetry.AutoInstrumentation.Plugin, AWS.Distro.OpenTelemetry.AutoInstrumentation")
-            .with_env("CORECLR_ENABLE_PROFILING", "1")
-            .with_env("CORECLR_PROFILER", "{918728DD-259F-4A6A-AC2B-B85E1B658318}")
-            .with_env("RESOURCE_DETECTORS_ENABLED", "false")
-            .with_kwargs(network=NETWORK_NAME, networking_config=application_networking_config)
-            .with_name(self.get_application_image_name())
+        self.application = self.application_launcher.launch(
+            self.get_application_spec(), self.reuse_application(), timeout=1200
         )
-
-        extra_env: Dict[str, str] = self.get_application_extra_environment_variables()
-        for key in extra_env:
-            self.application.with_env(key, extra_env.get(key))
-        self.application.start()
-        wait_for_logs(self.application, self.get_application_wait_pattern(), timeout=1200)
-        self.mock_collector_client: MockCollectorClient = MockCollectorClient(
-            self.mock_collector.get_container_host_ip(), self.mock_collector.get_exposed_port(_MOCK_COLLECTOR_PORT)
-        )
-        # Sleep for 100ms to ensure any startup metrics have been exported
+        # After the application is up: a database schema is created by the application on its first start.
+        self.reset_dependency_state()
+        self.mock_collector_client: MockCollectorClient = self.mock_collector_handle.create_client()
+        # Sleep for 100ms to ensure any startup metrics (or, for a reused application, the last metrics of the
+        # previous test) have been exported
         time.sleep(0.1)
         # Clear all start up metrics, so tests are only testing telemetry generated by their invocations.
         self.mock_collector_client.clear_signals()
+        self.resource_sampler = start_resource_sampler(
+            {"application": self.application, "mock_collector": self.mock_collector}
+        )
 
     def tear_down(self) -> None:
-        try:
-            _logger.info("Application stdout")
-            _logger.info(self.application.get_logs()[0].decode())
-            _logger.info("Application stderr")
-            _logger.info(self.application.get_logs()[1].decode())
-            self.application.stop()
-        except Exception:
-            _logger.exception("Failed to tear down application")
+        if self.resource_sampler is not None:
+            self.resource_usage = self.resource_sampler.stop()
+            self.resource_sampler = None
+        # A pooled application keeps running for the next test; its output is logged when the pool stops it.
+        if self.reuse_application():
+            self.mock_collector_client.clear_signals()
+            return
+        stop_application(self.application)
 
         self.mock_collector_client.clear_signals()
 
+    def get_application_spec(self) -> ApplicationSpec:
+        """The application of the test: its image, environment, wait pattern and network settings."""
+        handle: MockCollectorHandle = self.mock_collector_handle
+        collector_endpoint: str = f"http://{handle.endpoint_host}:{handle.endpoint_grpc_port}"
+        environment: Dict[str, str] = {
+            "OTEL_METRIC_EXPORT_INTERVAL": "50",
+            "OTEL_AWS_APPLICATION_SIGNALS_ENABLED": "true",
+            "OTEL_AWS_APPLICATION_SIGNALS_RUNTIME_ENABLED": self.is_runtime_enabled(),
+            "OTEL_METRICS_EXPORTER": "none",
+            "OTEL_EXPORTER_OTLP_PROTOCOL": "grpc",
+            "OTEL_BSP_SCHEDULE_DELAY": "1",
+            "OTEL_AWS_APPLICATION_SIGNALS_EXPORTER_ENDPOINT": collector_endpoint,
+            "OTEL_EXPORTER_OTLP_ENDPOINT": collector_endpoint,
+            "OTEL_EXPORTER_OTLP_TRACES_ENDPOINT": collector_endpoint,
+            "OTEL_EXPORTER_OTLP_METRICS_ENDPOINT": collector_endpoint,
+            "OTEL_RESOURCE_ATTRIBUTES": self.get_application_otel_resource_attributes(),
+            "OTEL_TRACES_SAMPLER": "always_on",
+            "OTEL_DOTNET_AUTO_PLUGINS": "AWS.Distro.OpenTelemetry.AutoInstrumentation.Plugin, AWS.Distro.OpenTelemetry.AutoInstrumentation",
+            "CORECLR_ENABLE_PROFILING": "1",
+            "CORECLR_PROFILER": "{918728DD-259F-4A6A-AC2B-B85E1B658318}",
+            "RESOURCE_DETECTORS_ENABLED": "false",
+        }
+        environment.update(self.get_application_extra_environment_variables())
+        return ApplicationSpec(
+            self.get_application_image_name(),
+            self.get_application_port(),
+            environment,
+            self.get_application_wait_pattern(),
+            NETWORK_NAME,
+            self.get_application_network_aliases(),
+            handle.extra_hosts,
+        )
+
     def do_test_requests(
         self, path: str, method: str, status_code: int, expected_error: int, expected_fault: int, **kwargs
     ) -> None:
         self.do_send_request(path, method, status_code)
 
-        resource_scope_spans: List[ResourceScopeSpan] = self.mock_collector_client.get_traces()
+        # Traces and metrics are exported independently, so wait for both at once rather than one after the other.
+        resource_scope_spans: List[ResourceScopeSpan]
+        metrics: List[ResourceScopeMetric]
+        resource_scope_spans, metrics = self.mock_collector_client.get_traces_and_metrics(
+            {LATENCY_METRIC, ERROR_METRIC, FAULT_METRIC}
+        )
         self._assert_aws_span_attributes(resource_scope_spans, path, **kwargs)
         self._assert_semantic_conventions_span_attributes(resource_scope_spans, method, path, status_code, **kwargs)
 
-        metrics: List[ResourceScopeMetric] = self.mock_collector_client.get_metrics(
-            {LATENCY_METRIC, ERROR_METRIC, FAULT_METRIC}
-        )
         self._assert_metric_attributes(metrics, LATENCY_METRIC, 12000, **kwargs)
         self._assert_metric_attributes(metrics, ERROR_METRIC, expected_error, **kwargs)
         self._assert_metric_attributes(metrics, FAULT_METRIC, expected_fault, **kwargs)
@@ -220,9 +265,15 @@ class ContractTestBase(TestCase):
     def tear_down_dependency_container(cls):
         return
 
+    def reset_dependency_state(self) -> None:
+        return
+
     def get_application_port(self) -> int:
         return 8080
 
+    def reuse_application(self) -> bool:
+        return is_application_reuse_enabled()
+
     def get_application_extra_environment_variables(self) -> Dict[str, str]:
         return {}
 
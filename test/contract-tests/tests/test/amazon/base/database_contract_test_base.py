@@ -5,6 +5,7 @@ from typing import Dict
 from typing_extensions import override
 
 from amazon.base.contract_test_base import ContractTestBase
+from amazon.base.dependency_pool import PooledDatabase
 
 AWS_REMOTE_DB_USER: str = "aws.remote.db.user"
 DATABASE_HOST: str = "mydb"
@@ -16,6 +17,9 @@ SPAN_KIND_LOCAL_ROOT: str = "LOCAL_ROOT"
 
 
 class DatabaseContractTestBase(ContractTestBase):
+    # Set by set_up_dependency_container; pooled for the session and reset to an empty schema before every test.
+    database: PooledDatabase
+
     @staticmethod
     def get_remote_service() -> str:
         return None
@@ -27,6 +31,10 @@ class DatabaseContractTestBase(ContractTestBase):
     def get_remote_resource_identifier(self) -> str:
         return f"{DATABASE_NAME}|{DATABASE_HOST}"
 
+    @override
+    def reset_dependency_state(self) -> None:
+        self.database.reset()
+
     @override
     def get_application_extra_environment_variables(self) -> Dict[str, str]:
         return {
@@ -0,0 +1,282 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Backing services (databases, LocalStack) started once per session instead of once per test class.
+
+`DependencyPool.acquire` takes a configured, not yet started, `PooledDependency` and returns the running one that was
+configured identically (see `application_pool.container_fingerprint`), starting it on first use. Startup waits on a
+readiness probe of the service itself (`is_ready`) with backoff rather than on a log line or a fixed delay, and
+`reset` puts the service back into the state it had when it became ready, so tests do not see what earlier tests left
+behind:
+
+- Databases snapshot their schema on the first `reset`, once the application has created it, and restore that
+  snapshot on every later one. Restoring drops and recreates the tables, which is cheap for a test schema and also
+  brings back tables a test dropped.
+- LocalStack resets its state through its internal state endpoint.
+
+Dependencies live on the worker's shared network; the pool drops the ones of a network before that network is removed
+(`release_network`), and stops all of them at the end of the pytest session (see `conftest.py`), or at interpreter
+exit under plain unittest. Two dependencies on one network never share an alias: acquiring one stops a pooled
+dependency that answers to the same name (MySQL and PostgreSQL are both `mydb`).
+
+Applications launched as local processes (`CONTRACT_TESTS_LAUNCHER=native`) cannot reach a network alias, so asking
+for the pool then skips the test class, before its dependencies are even configured.
+"""
+import atexit
+from logging import INFO, Logger, getLogger
+from typing import Dict, List, Optional, TypeVar
+from unittest import SkipTest
+
+from docker.models.containers import ExecResult
+from docker.types import EndpointConfig
+from mock_collector_wait import AdaptiveBackoffWait
+from requests import Response, get, post
+from testcontainers.core.container import DockerContainer
+
+from amazon.base.application_launcher import LAUNCHER_ENV, is_native_launch_enabled
+from amazon.base.application_pool import container_fingerprint
+from amazon.base.parallel_execution import worker_scoped_name
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+_READINESS_INITIAL_INTERVAL: float = 0.1
+_READINESS_MAX_INTERVAL: float = 2.0
+_SCHEMA_SNAPSHOT_PATH: str = "/tmp/contract-tests-schema.sql"
+
+D = TypeVar("D", bound="PooledDependency")
+
+
+class PooledDependency:
+    """A backing service container, how to tell that it is ready, and how to reset its state."""
+
+    def __init__(self, name: str, container: DockerContainer, network_name: str, aliases: List[str]):
+        self.name: str = name
+        self.network_name: str = network_name
+        self.aliases: List[str] = aliases
+        self.container: DockerContainer = container.with_kwargs(
+            network=network_name,
+            networking_config={network_name: EndpointConfig(version="1.22", aliases=aliases)},
+        ).with_name(worker_scoped_name(name))
+
+    def start_timeout(self) -> float:
+        return 120
+
+    def start(self) -> None:
+        self.container.start()
+        AdaptiveBackoffWait(_READINESS_INITIAL_INTERVAL, _READINESS_MAX_INTERVAL, self.start_timeout()).until(
+            self.is_ready, bool, f"{self.name} readiness"
+        )
+
+    def is_ready(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        return
+
+    def stop(self) -> None:
+        # pylint: disable=broad-exception-caught
+        try:
+            _logger.info("%s stdout", self.name)
+            _logger.info(self.container.get_logs()[0].decode())
+            _logger.info("%s stderr", self.name)
+            _logger.info(self.container.get_logs()[1].decode())
+            self.container.stop()
+        except Exception:
+            _logger.exception("Failed to tear down %s", self.name)
+
+    def exec(self, command: List[str], environment: Optional[Dict[str, str]] = None) -> ExecResult:
+        return self.container.get_wrapped_container().exec_run(command, environment=environment, demux=True)
+
+    def exec_checked(self, command: List[str], environment: Optional[Dict[str, str]] = None) -> None:
+        result: ExecResult = self.exec(command, environment)
+        if result.exit_code != 0:
+            stderr: bytes = result.output[1] or b""
+            raise RuntimeError(f"{self.name}: {command[-1]} exited with {result.exit_code}: {stderr.decode()}")
+
+
+class PooledDatabase(PooledDependency):
+    """A database whose schema is snapshotted by the first `reset` and restored by every later one."""
+
+    def __init__(self, name: str, container: DockerContainer, network_name: str, alias: str, database: str):
+        super().__init__(name, container, network_name, [alias])
+        self.database: str = database
+        self._has_snapshot: bool = False
+
+    def reset(self) -> None:
+        if self._has_snapshot:
+            self.restore_schema()
+        else:
+            self.snapshot_schema()
+            self._has_snapshot = True
+
+    def snapshot_schema(self) -> None:
+        raise NotImplementedError
+
+    def restore_schema(self) -> None:
+        raise NotImplementedError
+
+
+class MySqlDependency(PooledDatabase):
+    def __init__(self, network_name: str, alias: str, user: str, password: str, database: str):
+        container: DockerContainer = (
+            DockerContainer("mysql:latest")
+            .with_exposed_ports(3306)
+            .with_env("MYSQL_ROOT_PASSWORD", password)
+            .with_env("MYSQL_DATABASE", database)
+        )
+        if user != "root":
+            container.with_env("MYSQL_USER", user).with_env("MYSQL_PASSWORD", password)
+        super().__init__(alias, container, network_name, alias, database)
+        self._environment: Dict[str, str] = {"MYSQL_PWD": password}
+        self._user: str = user
+
+    def is_ready(self) -> bool:
+        # Over TCP: the temporary server the image runs while initializing only listens on the socket.
+        return self.exec(["mysqladmin", "ping", "-h", "127.0.0.1", "-u", self._user], self._environment).exit_code == 0
+
+    def snapshot_schema(self) -> None:
+        # mysqldump adds a DROP TABLE IF EXISTS before every CREATE TABLE, which is what makes the restore a reset.
+        self.exec_checked(
+            ["sh", "-c", f"mysqldump -u {self._user} --no-data {self.database} > {_SCHEMA_SNAPSHOT_PATH}"],
+            self._environment,
+        )
+
+    def restore_schema(self) -> None:
+        self.exec_checked(
+            ["sh", "-c", f"mysql -u {self._user} {self.database} < {_SCHEMA_SNAPSHOT_PATH}"], self._environment
+        )
+
+
+class PostgresDependency(PooledDatabase):
+    def __init__(self, network_name: str, alias: str, user: str, password: str, database: str):
+        container: DockerContainer = (
+            DockerContainer("postgres:latest")
+            .with_exposed_ports(5432)
+            .with_env("POSTGRES_USER", user)
+            .with_env("POSTGRES_PASSWORD", password)
+            .with_env("POSTGRES_DB", database)
+        )
+        super().__init__(alias, container, network_name, alias, database)
+        self._user: str = user
+
+    def is_ready(self) -> bool:
+        # Over TCP for the same reason as MySQL.
+        return self.exec(["pg_isready", "-h", "127.0.0.1", "-U", self._user, "-d", self.database]).exit_code == 0
+
+    def snapshot_schema(self) -> None:
+        self.exec_checked(
+            [
+                "pg_dump",
+                "-U",
+                self._user,
+                "--schema-only",
+                "--clean",
+                "--if-exists",
+                "-f",
+                _SCHEMA_SNAPSHOT_PATH,
+                self.database,
+            ]
+        )
+
+    def restore_schema(self) -> None:
+        self.exec_checked(
+            ["psql", "-U", self._user, "-d", self.database, "-q", "-v", "ON_ERROR_STOP=1", "-f", _SCHEMA_SNAPSHOT_PATH]
+        )
+
+
+class LocalStackDependency(PooledDependency):
+    _PORT: int = 4566
+
+    def __init__(self, network_name: str, aliases: List[str], services: List[str], region: str):
+        container: DockerContainer = (
+            DockerContainer("localstack/localstack:4.0.0")
+            .with_exposed_ports(self._PORT)
+            .with_env("SERVICES", ",".join(services))
+            .with_env("DEFAULT_REGION", region)
+        )
+        super().__init__("localstack", container, network_name, aliases)
+        self.services: List[str] = services
+
+    def _url(self, path: str) -> str:
+        host: str = self.container.get_container_host_ip()
+        port: str = self.container.get_exposed_port(self._PORT)
+        return f"http://{host}:{port}/_localstack/{path}"
+
+    def is_ready(self) -> bool:
+        # pylint: disable=broad-exception-caught
+        try:
+            response: Response = get(self._url("health"), timeout=5)
+            states: Dict[str, str] = response.json().get("services", {})
+        except Exception:
+            return False
+        return all(states.get(service) in ("available", "running") for service in self.services)
+
+    def reset(self) -> None:
+        response: Response = post(self._url("state/reset"), timeout=30)
+        if response.status_code != 200:
+            _logger.warning("LocalStack state reset returned %d; state is kept", response.status_code)
+
+
+class DependencyPool:
+    """The running dependencies of the session, by fingerprint of their container configuration."""
+
+    def __init__(self):
+        self._running: Dict[str, PooledDependency] = {}
+
+    def acquire(self, dependency: D) -> D:
+        """The running dependency configured like `dependency`, starting `dependency` if there is none."""
+        fingerprint: str = container_fingerprint(dependency.container)
+        running: Optional[PooledDependency] = self._running.get(fingerprint)
+        if running is not None:
+            return running  # type: ignore[return-value]
+
+        for key, other in list(self._running.items()):
+            if other.network_name == dependency.network_name and set(other.aliases) & set(dependency.aliases):
+                _logger.info("Stopping %s, which answers to the same name as %s", other.name, dependency.name)
+                del self._running[key]
+                other.stop()
+
+        try:
+            dependency.start()
+        except Exception:
+            dependency.stop()
+            raise
+        self._running[fingerprint] = dependency
+        return dependency
+
+    def release_network(self, network_name: str) -> None:
+        """Stop the dependencies attached to `network_name`, so the network can be removed."""
+        for key, dependency in list(self._running.items()):
+            if dependency.network_name == network_name:
+                del self._running[key]
+                dependency.stop()
+
+    def release(self) -> None:
+        running: List[PooledDependency] = list(self._running.values())
+        self._running = {}
+        for dependency in running:
+            dependency.stop()
+
+
+_pool: Optional[DependencyPool] = None
+
+
+def dependency_pool() -> DependencyPool:
+    """The session's pool, created on first call."""
+    global _pool  # pylint: disable=global-statement
+    if is_native_launch_enabled():
+        raise SkipTest(f"Dependency containers are not reachable from applications run with {LAUNCHER_ENV}=native")
+    if _pool is None:
+        _pool = DependencyPool()
+        atexit.register(stop_dependency_pool)
+    return _pool
+
+
+def stop_dependency_pool() -> None:
+    """Stop every pooled dependency. Idempotent."""
+    global _pool  # pylint: disable=global-statement
+    if _pool is not None:
+        pool: DependencyPool = _pool
+        _pool = None
+        pool.release()
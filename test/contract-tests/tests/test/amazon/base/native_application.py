@@ -0,0 +1,133 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+A published .NET application run by the local `dotnet` as a child process of the tests (see `application_launcher`).
+
+`NativeApplication` offers the part of the `DockerContainer` interface the tests use (`get_container_host_ip`,
+`get_exposed_port`, `get_logs`, `stop`), so a test does not need to know how its application was started. Output is
+captured to files, which `get_logs` returns like the logs of a container. The application is asked to listen on a free
+loopback port of Kestrel's choosing and `get_exposed_port` returns the port Kestrel reports, so applications never
+compete for ports, whatever port the test configured for the container.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from logging import INFO, Logger, getLogger
+from typing import Dict, Optional, Pattern, Tuple
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+LOOPBACK_URL: str = "http://127.0.0.1:0"
+_LISTENING_PATTERN: Pattern[str] = re.compile(r"Now listening on: http://127\.0\.0\.1:(\d+)")
+_READY_POLL_INTERVAL_SECONDS: float = 0.05
+_STOP_TIMEOUT_SECONDS: float = 10
+
+
+class NativeApplication:
+    """`dotnet <directory>/<directory name>.dll` with `environment` added to the environment of the tests."""
+
+    def __init__(self, name: str, directory: str, environment: Dict[str, str]):
+        self.name: str = name
+        self.directory: str = directory
+        self.environment: Dict[str, str] = environment
+        self._process: Optional[subprocess.Popen] = None
+        self._output_directory: Optional[str] = None
+
+    @property
+    def entry_assembly(self) -> str:
+        # The images run `dotnet <project>.dll` from the publish output, and every project is named like its directory.
+        return os.path.join(self.directory, f"{os.path.basename(os.path.normpath(self.directory))}.dll")
+
+    def fingerprint(self) -> str:
+        """Hash of what the process is started from, the counterpart of `application_pool.container_fingerprint`."""
+        specification: Dict[str, object] = {"directory": self.directory, "environment": self.environment}
+        return hashlib.sha256(json.dumps(specification, sort_keys=True).encode()).hexdigest()
+
+    def start(self) -> "NativeApplication":
+        self._output_directory = tempfile.mkdtemp(prefix=f"{self.name}-")
+        environment: Dict[str, str] = {
+            **os.environ,
+            **self.environment,
+            # The images create /var/log/opentelemetry/dotnet for the instrumentation's own logs; keep them with ours.
+            "OTEL_DOTNET_AUTO_LOG_DIRECTORY": self._output_directory,
+            "ASPNETCORE_URLS": LOOPBACK_URL,
+        }
+        with open(self._stdout_path, "wb") as stdout, open(self._stderr_path, "wb") as stderr:
+            self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+                ["dotnet", self.entry_assembly],
+                cwd=self.directory,
+                env=environment,
+                stdout=stdout,
+                stderr=stderr,
+                start_new_session=True,
+            )
+        _logger.info("Started %s as process %d", self.name, self._process.pid)
+        return self
+
+    def wait_until_ready(self, wait_pattern: str, timeout: float) -> None:
+        """Wait for `wait_pattern` in the output, like `wait_for_logs`, but fail as soon as the process exits."""
+        search = re.compile(wait_pattern, re.MULTILINE).search
+        deadline: float = time.monotonic() + timeout
+        while True:
+            stdout, stderr = (log.decode(errors="replace") for log in self.get_logs())
+            if search(stdout) or search(stderr):
+                return
+            if not self.is_running():
+                raise RuntimeError(f"{self.name} exited before it was ready:\n{stdout}\n{stderr}")
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{self.name} did not emit logs matching {wait_pattern!r} in {timeout}s")
+            time.sleep(_READY_POLL_INTERVAL_SECONDS)
+
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    def get_container_host_ip(self) -> str:
+        return "localhost"
+
+    def get_exposed_port(self, port: int) -> str:  # pylint: disable=unused-argument
+        match = _LISTENING_PATTERN.search(self.get_logs()[0].decode(errors="replace"))
+        if match is None:
+            raise RuntimeError(f"{self.name} has not reported the port it listens on")
+        return match.group(1)
+
+    def get_logs(self) -> Tuple[bytes, bytes]:
+        if self._output_directory is None:
+            raise RuntimeError(f"{self.name} should be started before")
+        return _read(self._stdout_path), _read(self._stderr_path)
+
+    def stop(self) -> None:
+        process: Optional[subprocess.Popen] = self._process
+        self._process = None
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=_STOP_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        if self._output_directory is not None:
+            shutil.rmtree(self._output_directory, ignore_errors=True)
+            self._output_directory = None
+
+    @property
+    def _stdout_path(self) -> str:
+        return os.path.join(self._output_directory, "stdout.log")
+
+    @property
+    def _stderr_path(self) -> str:
+        return os.path.join(self._output_directory, "stderr.log")
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
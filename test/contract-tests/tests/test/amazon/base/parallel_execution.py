@@ -0,0 +1,135 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Support for running the contract tests with several pytest-xdist workers on one machine.
+
+Each worker is a separate process with its own mock collector, so everything Docker resolves by name (container names
+and networks) has to be unique per worker; `worker_scoped_name` derives those names from the fixed names the tests
+used so far. Aliases need no change: they only resolve inside a network, and every worker has its own. Host ports are
+already assigned by Docker for every exposed port.
+
+Application containers are the expensive part of a test class, so their number is capped across all workers (and all
+concurrent runs) on the machine by `ContainerSlots`: a class leases a slot for its application for the duration of the
+class. Slots are `flock`ed files, so a worker that dies releases its slots with it. `CONTRACT_TESTS_MAX_CONTAINERS`
+sets the cap, which defaults to the number of CPUs. The per-worker mock collector and pooled dependencies (see
+`dependency_pool`) run for the whole session and are bounded by the number of workers, so they are not counted; a
+worker holding them while waiting for a slot could otherwise starve the others.
+"""
+import fcntl
+import os
+import tempfile
+import time
+from logging import INFO, Logger, getLogger
+from typing import IO, List, Optional
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+MAX_CONTAINERS_ENV: str = "CONTRACT_TESTS_MAX_CONTAINERS"
+_SLOTS_DIRECTORY: str = os.path.join(tempfile.gettempdir(), "contract-tests-container-slots")
+_RETRY_INTERVAL_SECONDS: float = 0.5
+
+
+def worker_id() -> Optional[str]:
+    """The pytest-xdist worker this process is (`gw0`, `gw1`, ...), or None when not running under xdist."""
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def worker_scoped_name(name: str) -> str:
+    """`name` made unique to this worker and run; unchanged when not running under xdist."""
+    worker: Optional[str] = worker_id()
+    if worker is None:
+        return name
+    run: str = os.environ.get("PYTEST_XDIST_TESTRUNUID", "")[:8]
+    return f"{name}-{run}-{worker}" if run else f"{name}-{worker}"
+
+
+def max_containers() -> int:
+    configured: str = os.environ.get(MAX_CONTAINERS_ENV, "").strip()
+    return max(1, int(configured)) if configured else os.cpu_count() or 1
+
+
+class ContainerLease:
+    """Slots held by one test class (or test); `release` is idempotent."""
+
+    def __init__(self, files: List[IO[bytes]]):
+        self._files: List[IO[bytes]] = files
+
+    @property
+    def size(self) -> int:
+        return len(self._files)
+
+    def release(self) -> None:
+        files: List[IO[bytes]] = self._files
+        self._files = []
+        _unlock_all(files)
+
+
+class ContainerSlots:
+    """A counting semaphore over `capacity` lock files, shared by every process that uses the same directory."""
+
+    def __init__(self, capacity: int, directory: str = _SLOTS_DIRECTORY):
+        self.capacity: int = capacity
+        self.directory: str = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def acquire(self, count: int, timeout: Optional[float] = None) -> ContainerLease:
+        """Wait until `count` slots (at most `capacity`) are free and take them all at once.
+
+        The slots are taken under a guard lock and only all together, so two classes that each hold part of what they
+        need can never wait on each other. Raises TimeoutError if `timeout` seconds pass first.
+        """
+        count = min(max(count, 0), self.capacity)
+        if count == 0:
+            return ContainerLease([])
+        deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        waited: bool = False
+        while True:
+            files: List[IO[bytes]] = self._try_acquire(count)
+            if files:
+                if waited:
+                    _logger.info("Acquired %d of %d container slots", count, self.capacity)
+                return ContainerLease(files)
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"{count} of {self.capacity} container slots did not become free in {timeout}s")
+            if not waited:
+                _logger.info("Waiting for %d of %d container slots", count, self.capacity)
+                waited = True
+            time.sleep(_RETRY_INTERVAL_SECONDS)
+
+    def _try_acquire(self, count: int) -> List[IO[bytes]]:
+        with open(os.path.join(self.directory, "guard.lock"), "ab") as guard:
+            fcntl.flock(guard, fcntl.LOCK_EX)
+            taken: List[IO[bytes]] = []
+            for index in range(self.capacity):
+                slot: IO[bytes] = open(os.path.join(self.directory, f"slot-{index}.lock"), "ab")
+                try:
+                    fcntl.flock(slot, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    slot.close()
+                    continue
+                taken.append(slot)
+                if len(taken) == count:
+                    return taken
+            # Not enough free slots: give back the ones taken rather than hold them while waiting.
+            _unlock_all(taken)
+            return []
+
+
+def _unlock_all(files: List[IO[bytes]]) -> None:
+    for file in files:
+        try:
+            fcntl.flock(file, fcntl.LOCK_UN)
+        finally:
+            file.close()
+
+
+_slots: Optional[ContainerSlots] = None
+
+
+def container_slots() -> ContainerSlots:
+    """The machine-wide slots, sized by `CONTRACT_TESTS_MAX_CONTAINERS` on first call."""
+    global _slots  # pylint: disable=global-statement
+    if _slots is None:
+        _slots = ContainerSlots(max_containers())
+    return _slots
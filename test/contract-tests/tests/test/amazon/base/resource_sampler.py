@@ -0,0 +1,208 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+CPU, memory and network usage of the application and mock collector while a test or benchmark runs.
+
+`ResourceSampler` reads the usage of every target at a fixed interval in a background thread, from the first reading
+when it starts to a last one when it stops, so even a test shorter than the interval gets a CPU figure. Containers are
+read from the Docker stats API (`one_shot`, so a reading does not block for the daemon's own one-second sample); an
+application run as a local process (`NativeApplication`) is read from `/proc`, which has no per-process network
+counters, so its network fields stay empty. A collector running in the test process is not sampled.
+
+- `cpu_percent`: CPU time used since the previous reading over the wall time in between, 100 being one full core;
+- `rss_bytes`: for a container, what `docker stats` shows as its memory usage (the cgroup's usage without the page
+  cache it can reclaim); for a process, its resident set size;
+- `network_rx_bytes`/`network_tx_bytes`: totals of the container's interfaces since it started.
+
+`ContractTestBase` samples every test (from after the application is ready until its tear down) and keeps the result
+in `resource_usage`; `conftest.py` attaches it to the test's report as the `resource_usage` user property, so it ends
+up in the JUnit XML (`--junitxml`). Benchmarks sample their own windows with `sample_resources` and check the result
+against the thresholds of `benchmark_utils.resource_threshold_violations`. Set
+`CONTRACT_TESTS_RESOURCE_SAMPLING_INTERVAL_SEC` to change the interval (default 1), or to 0 to disable sampling.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from amazon.base.application_pool import Application
+from amazon.base.native_application import NativeApplication
+from amazon.utils.benchmark_utils import summarize
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+RESOURCE_SAMPLING_INTERVAL_ENV: str = "CONTRACT_TESTS_RESOURCE_SAMPLING_INTERVAL_SEC"
+_DEFAULT_SAMPLING_INTERVAL_SEC: str = "1"
+_MEGABYTE: int = 1024 * 1024
+
+# (CPU seconds used so far, resident bytes, received bytes, sent bytes)
+_Reading = Tuple[float, int, Optional[int], Optional[int]]
+
+
+class ResourceSample:
+    """Usage of one target at `elapsed_seconds` after the sampler started."""
+
+    def __init__(
+        self,
+        elapsed_seconds: float,
+        cpu_percent: Optional[float],
+        rss_bytes: int,
+        network_rx_bytes: Optional[int],
+        network_tx_bytes: Optional[int],
+    ):
+        self.elapsed_seconds: float = elapsed_seconds
+        # None for the first reading, which has no previous one to measure against.
+        self.cpu_percent: Optional[float] = cpu_percent
+        self.rss_bytes: int = rss_bytes
+        self.network_rx_bytes: Optional[int] = network_rx_bytes
+        self.network_tx_bytes: Optional[int] = network_tx_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "elapsed_seconds": self.elapsed_seconds,
+            "cpu_percent": self.cpu_percent,
+            "rss_bytes": self.rss_bytes,
+            "network_rx_bytes": self.network_rx_bytes,
+            "network_tx_bytes": self.network_tx_bytes,
+        }
+
+
+class ResourceSeries:
+    """The samples of one target, in the order they were taken."""
+
+    def __init__(self):
+        self.samples: List[ResourceSample] = []
+
+    def summary(self) -> Dict[str, Any]:
+        """CPU and memory statistics of the series, and how much memory and traffic grew from its first sample."""
+        if not self.samples:
+            return {"samples": 0}
+        first: ResourceSample = self.samples[0]
+        last: ResourceSample = self.samples[-1]
+        return {
+            "samples": len(self.samples),
+            "duration_seconds": last.elapsed_seconds - first.elapsed_seconds,
+            "cpu_percent": summarize([s.cpu_percent for s in self.samples if s.cpu_percent is not None]),
+            "rss_mb": summarize([s.rss_bytes / _MEGABYTE for s in self.samples]),
+            "rss_growth_mb": (last.rss_bytes - first.rss_bytes) / _MEGABYTE,
+            "network_rx_bytes": _growth(first.network_rx_bytes, last.network_rx_bytes),
+            "network_tx_bytes": _growth(first.network_tx_bytes, last.network_tx_bytes),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"summary": self.summary(), "samples": [sample.to_dict() for sample in self.samples]}
+
+
+class ResourceSampler:
+    """Samples `targets` by name every `interval_seconds` between `start` and `stop`."""
+
+    def __init__(self, targets: Dict[str, Application], interval_seconds: float):
+        self._targets: Dict[str, Application] = dict(targets)
+        self._interval_seconds: float = interval_seconds
+        self._series: Dict[str, ResourceSeries] = {name: ResourceSeries() for name in targets}
+        self._previous: Dict[str, Tuple[float, float]] = {}
+        self._started_at: float = 0.0
+        self._stopped: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+
+    def start(self) -> "ResourceSampler":
+        self._started_at = time.monotonic()
+        self._sample()
+        self._thread.start()
+        return self
+
+    def stop(self) -> Dict[str, ResourceSeries]:
+        self._stopped.set()
+        self._thread.join()
+        self._sample()
+        return self._series
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval_seconds):
+            self._sample()
+
+    def _sample(self) -> None:
+        for name, target in list(self._targets.items()):
+            try:
+                cpu_seconds, rss_bytes, rx_bytes, tx_bytes = _read(target)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                # Stopped, or not readable on this platform; its series ends here.
+                _logger.info("Stopped sampling the resource usage of %s: %s", name, exception)
+                del self._targets[name]
+                continue
+            now: float = time.monotonic()
+            cpu_percent: Optional[float] = None
+            if name in self._previous:
+                previous_time, previous_cpu_seconds = self._previous[name]
+                if now > previous_time:
+                    cpu_percent = (cpu_seconds - previous_cpu_seconds) / (now - previous_time) * 100
+            self._previous[name] = (now, cpu_seconds)
+            self._series[name].samples.append(
+                ResourceSample(now - self._started_at, cpu_percent, rss_bytes, rx_bytes, tx_bytes)
+            )
+
+
+def resource_sampling_interval() -> float:
+    """Seconds between two samples; 0 when sampling is disabled."""
+    return max(0.0, float(os.environ.get(RESOURCE_SAMPLING_INTERVAL_ENV, _DEFAULT_SAMPLING_INTERVAL_SEC).strip()))
+
+
+def start_resource_sampler(targets: Dict[str, Optional[Application]]) -> Optional[ResourceSampler]:
+    """Start sampling the targets that are not None, or return None when sampling is disabled."""
+    interval: float = resource_sampling_interval()
+    if interval <= 0:
+        return None
+    return ResourceSampler({name: target for name, target in targets.items() if target is not None}, interval).start()
+
+
+@contextmanager
+def sample_resources(targets: Dict[str, Optional[Application]]) -> Iterator[Dict[str, ResourceSeries]]:
+    """Sample the targets for the duration of the `with` block. The dictionary it yields is filled with the series of
+    every target when the block exits, and stays empty when sampling is disabled."""
+    usage: Dict[str, ResourceSeries] = {}
+    sampler: Optional[ResourceSampler] = start_resource_sampler(targets)
+    try:
+        yield usage
+    finally:
+        if sampler is not None:
+            usage.update(sampler.stop())
+
+
+def _read(target: Application) -> _Reading:
+    if isinstance(target, NativeApplication):
+        return _read_process(target)
+    return _read_container(target)
+
+
+def _read_container(container: Application) -> _Reading:
+    stats: Dict[str, Any] = container.get_wrapped_container().stats(stream=False, one_shot=True)
+    cpu_seconds: float = stats["cpu_stats"]["cpu_usage"]["total_usage"] / 1e9
+    memory: Dict[str, Any] = stats.get("memory_stats", {})
+    details: Dict[str, int] = memory.get("stats", {})
+    # cgroup v2 reports `inactive_file`, cgroup v1 `total_inactive_file`.
+    cache: int = details.get("inactive_file", details.get("total_inactive_file", 0))
+    rss_bytes: int = max(0, memory.get("usage", 0) - cache)
+    networks: Optional[Dict[str, Dict[str, int]]] = stats.get("networks")
+    if not networks:
+        return cpu_seconds, rss_bytes, None, None
+    rx_bytes: int = sum(interface["rx_bytes"] for interface in networks.values())
+    tx_bytes: int = sum(interface["tx_bytes"] for interface in networks.values())
+    return cpu_seconds, rss_bytes, rx_bytes, tx_bytes
+
+
+def _read_process(application: NativeApplication) -> _Reading:
+    if application.pid is None:
+        raise RuntimeError(f"{application.name} is not running")
+    with open(f"/proc/{application.pid}/stat", encoding="utf-8") as stat_file:
+        # The command name in parentheses may contain spaces; the fields after it start with the state (field 3).
+        fields: List[str] = stat_file.read().rsplit(")", 1)[1].split()
+    cpu_ticks: int = int(fields[14 - 3]) + int(fields[15 - 3])  # utime + stime
+    rss_pages: int = int(fields[24 - 3])
+    return cpu_ticks / os.sysconf("SC_CLK_TCK"), rss_pages * os.sysconf("SC_PAGE_SIZE"), None, None
+
+
+def _growth(first: Optional[int], last: Optional[int]) -> Optional[int]:
+    return last - first if first is not None and last is not None else None
@@ -0,0 +1,209 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+One mock collector container and Docker network for the whole test session.
+
+Starting the collector and waiting for "Ready" is a fixed cost that used to be paid once per test class
+(`ContractTestBase`) or once per test (`ServiceEventsTestInfrastructure`). `shared_mock_collector()` starts the
+collector on first use and returns the same instance to every later caller in the process; it is stopped, and the
+network removed, at the end of the pytest session (see `conftest.py`), or at interpreter exit under plain unittest.
+Tests stay isolated by clearing the collector around every test, which is sufficient because the tests of one process
+run one at a time. Under pytest-xdist every worker process has its own collector and network (see
+`parallel_execution`).
+
+Set `CONTRACT_TESTS_SHARED_COLLECTOR=false` to go back to a collector per class (or per test for ServiceEvents),
+e.g. to look at the collector logs of a single class.
+
+Set `CONTRACT_TESTS_IN_PROCESS_COLLECTOR=true` to run the collector inside the test process instead of in a container
+(`InProcessMockCollectorHandle`): no image to build and no "Ready" to wait for, and the client reads the collector's
+store directly. The collector listens on free ports of the host, which the applications reach through the Docker host
+gateway, so the endpoints and extra hosts of an application container come from the handle.
+
+Applications launched as local processes (`CONTRACT_TESTS_LAUNCHER=native`, see `application_launcher`) always use an
+in-process collector; it then listens on loopback only, and no Docker network is created.
+"""
+import atexit
+import os
+from logging import INFO, Logger, getLogger
+from typing import Dict, Optional
+
+from mock_collector_client import MockCollectorClient
+from mock_collector_server import MockCollectorServer, start_server
+
+from docker import DockerClient
+from docker.models.networks import Network, NetworkCollection
+from docker.types import EndpointConfig
+from testcontainers.core.container import DockerContainer
+from testcontainers.core.waiting_utils import wait_for_logs
+
+from amazon.base.application_launcher import is_native_launch_enabled
+from amazon.base.parallel_execution import worker_scoped_name
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+SHARED_COLLECTOR_ENV: str = "CONTRACT_TESTS_SHARED_COLLECTOR"
+IN_PROCESS_COLLECTOR_ENV: str = "CONTRACT_TESTS_IN_PROCESS_COLLECTOR"
+
+MOCK_COLLECTOR_IMAGE: str = "aws-application-signals-mock-collector"
+MOCK_COLLECTOR_ALIAS: str = "collector"
+MOCK_COLLECTOR_GRPC_PORT: int = 4315
+MOCK_COLLECTOR_HTTP_PORT: int = 4316
+SHARED_NETWORK_NAME: str = worker_scoped_name("aws-application-signals-network")
+
+
+class MockCollectorHandle:
+    """A started mock collector container and the network it is attached to."""
+
+    def __init__(self, network: Optional[Network], container: Optional[DockerContainer]):
+        self.network: Optional[Network] = network
+        self.container: Optional[DockerContainer] = container
+
+    @property
+    def host(self) -> str:
+        return self.container.get_container_host_ip()
+
+    @property
+    def grpc_port(self) -> str:
+        return self.container.get_exposed_port(MOCK_COLLECTOR_GRPC_PORT)
+
+    @property
+    def endpoint_host(self) -> str:
+        """The collector's host name as seen by the applications."""
+        return MOCK_COLLECTOR_ALIAS
+
+    @property
+    def endpoint_grpc_port(self) -> int:
+        """The gRPC port as seen by containers on the network, at `MOCK_COLLECTOR_ALIAS`."""
+        return MOCK_COLLECTOR_GRPC_PORT
+
+    @property
+    def endpoint_http_port(self) -> int:
+        """The OTLP/HTTP port as seen by containers on the network, at `MOCK_COLLECTOR_ALIAS`."""
+        return MOCK_COLLECTOR_HTTP_PORT
+
+    @property
+    def extra_hosts(self) -> Dict[str, str]:
+        """The `extra_hosts` a container needs to resolve `MOCK_COLLECTOR_ALIAS`; none, the network alias does."""
+        return {}
+
+    def create_client(self) -> MockCollectorClient:
+        return MockCollectorClient(self.host, self.grpc_port)
+
+    def stop(self) -> None:
+        # pylint: disable=broad-exception-caught
+        try:
+            _logger.info("MockCollector stdout")
+            _logger.info(self.container.get_logs()[0].decode())
+            _logger.info("MockCollector stderr")
+            _logger.info(self.container.get_logs()[1].decode())
+            self.container.stop()
+        except Exception:
+            _logger.exception("Failed to tear down mock collector")
+        try:
+            self.network.remove()
+        except Exception:
+            _logger.exception("Failed to remove Docker network")
+
+
+class InProcessMockCollectorHandle(MockCollectorHandle):
+    """A mock collector running in this process, reachable from the containers on `network` through the host, or
+    only from local processes over loopback when there is no network."""
+
+    def __init__(self, network: Optional[Network], server: MockCollectorServer):
+        super().__init__(network, None)
+        self.server: MockCollectorServer = server
+
+    @property
+    def host(self) -> str:
+        return "localhost"
+
+    @property
+    def grpc_port(self) -> str:
+        return str(self.server.grpc_port)
+
+    @property
+    def endpoint_host(self) -> str:
+        return MOCK_COLLECTOR_ALIAS if self.network is not None else "127.0.0.1"
+
+    @property
+    def endpoint_grpc_port(self) -> int:
+        return self.server.grpc_port
+
+    @property
+    def endpoint_http_port(self) -> int:
+        return self.server.http_port
+
+    @property
+    def extra_hosts(self) -> Dict[str, str]:
+        return {MOCK_COLLECTOR_ALIAS: "host-gateway"} if self.network is not None else {}
+
+    def create_client(self) -> MockCollectorClient:
+        return MockCollectorClient.in_process(self.server.service)
+
+    def stop(self) -> None:
+        # pylint: disable=broad-exception-caught
+        try:
+            self.server.stop()
+        except Exception:
+            _logger.exception("Failed to stop the in-process mock collector")
+        if self.network is None:
+            return
+        try:
+            self.network.remove()
+        except Exception:
+            _logger.exception("Failed to remove Docker network")
+
+
+def start_mock_collector(network_name: str, container_name: Optional[str] = None) -> MockCollectorHandle:
+    """Create `network_name` and start a mock collector on it, reachable from the other containers as `collector`."""
+    if is_native_launch_enabled():
+        return InProcessMockCollectorHandle(None, start_server(grpc_port=0, http_port=0, host="127.0.0.1"))
+    network: Network = NetworkCollection(client=DockerClient()).create(network_name)
+    if is_in_process_collector_enabled():
+        # All interfaces, since the containers connect through the host gateway rather than loopback.
+        return InProcessMockCollectorHandle(network, start_server(grpc_port=0, http_port=0))
+    networking_config: Dict[str, EndpointConfig] = {
+        network_name: EndpointConfig(version="1.22", aliases=[MOCK_COLLECTOR_ALIAS])
+    }
+    container: DockerContainer = (
+        DockerContainer(MOCK_COLLECTOR_IMAGE)
+        .with_exposed_ports(MOCK_COLLECTOR_GRPC_PORT, MOCK_COLLECTOR_HTTP_PORT)
+        .with_kwargs(network=network_name, networking_config=networking_config)
+    )
+    if container_name is not None:
+        container.with_name(container_name)
+    container.start()
+    wait_for_logs(container, "Ready", timeout=20)
+    return MockCollectorHandle(network, container)
+
+
+def is_shared_collector_enabled() -> bool:
+    return os.environ.get(SHARED_COLLECTOR_ENV, "true").strip().lower() != "false"
+
+
+def is_in_process_collector_enabled() -> bool:
+    if is_native_launch_enabled():
+        return True
+    return os.environ.get(IN_PROCESS_COLLECTOR_ENV, "false").strip().lower() == "true"
+
+
+_shared: Optional[MockCollectorHandle] = None
+
+
+def shared_mock_collector() -> MockCollectorHandle:
+    """The session's mock collector on `SHARED_NETWORK_NAME`, started on first call."""
+    global _shared  # pylint: disable=global-statement
+    if _shared is None:
+        _shared = start_mock_collector(SHARED_NETWORK_NAME, worker_scoped_name(MOCK_COLLECTOR_IMAGE))
+        atexit.register(stop_shared_mock_collector)
+    return _shared
+
+
+def stop_shared_mock_collector() -> None:
+    """Stop the session's mock collector if it was started. Idempotent."""
+    global _shared  # pylint: disable=global-statement
+    if _shared is not None:
+        handle: MockCollectorHandle = _shared
+        _shared = None
+        handle.stop()
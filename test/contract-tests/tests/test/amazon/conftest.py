@@ -0,0 +1,33 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+import json
+from typing import Dict, Iterator
+
+import pytest
+
+from amazon.base.application_pool import stop_application_pool
+from amazon.base.dependency_pool import stop_dependency_pool
+from amazon.base.resource_sampler import ResourceSeries
+from amazon.base.shared_mock_collector import stop_shared_mock_collector
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_mock_collector_session() -> Iterator[None]:
+    """Stops the pooled application, the pooled dependencies and the shared mock collector once every test has run."""
+    yield
+    # Collector last: the others are attached to its network.
+    stop_application_pool()
+    stop_dependency_pool()
+    stop_shared_mock_collector()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo) -> None:
+    """Attaches the resource usage a contract test sampled (see `resource_sampler`) to its reports."""
+    if call.when != "call":
+        return
+    resource_usage: Dict[str, ResourceSeries] = getattr(item.instance, "resource_usage", None) or {}
+    if resource_usage:
+        # The reports of the call and tear down copy the item's properties; JUnit XML writes those of the latter.
+        usage: Dict[str, object] = {name: series.to_dict() for name, series in resource_usage.items()}
+        item.user_properties.append(("resource_usage", json.dumps(usage, sort_keys=True)))
@@ -0,0 +1,81 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""`ContractTestBase.do_test_requests` against an in-process mock collector, as used with
+CONTRACT_TESTS_IN_PROCESS_COLLECTOR=true and the native launcher. The application is stood in for by OTLP exports over
+gRPC to the collector's endpoint, so no container is needed."""
+import threading
+from typing import List, Set
+
+import grpc
+from mock_collector_client import ResourceScopeMetric, ResourceScopeSpan
+from mock_collector_server import start_server
+from typing_extensions import override
+
+from amazon.base.contract_test_base import ContractTestBase
+from amazon.base.shared_mock_collector import InProcessMockCollectorHandle
+from amazon.mockcollector.otlp_builders import metric_export, span, span_export
+from amazon.utils.application_signals_constants import ERROR_METRIC, FAULT_METRIC, LATENCY_METRIC
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2_grpc import MetricsServiceStub
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import TraceServiceStub
+from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric
+
+# After the request is answered, as an application exports, so the waits start before the telemetry arrives.
+_EXPORT_DELAY_SEC: float = 0.2
+# OTEL_METRIC_EXPORT_INTERVAL of the contract-test applications: the metrics wait expects exports to keep arriving.
+_METRIC_EXPORT_INTERVAL_SEC: float = 0.05
+
+
+class InProcessCollectorContractTest(ContractTestBase):
+
+    @classmethod
+    @override
+    def setUpClass(cls) -> None:
+        cls.mock_collector_handle = InProcessMockCollectorHandle(
+            None, start_server(grpc_port=0, http_port=0, host="127.0.0.1")
+        )
+        cls.addClassCleanup(cls.mock_collector_handle.stop)
+
+    @override
+    def setUp(self) -> None:
+        self.mock_collector_client = self.mock_collector_handle.create_client()
+        self.mock_collector_client.clear_signals()
+
+    def test_do_test_requests(self) -> None:
+        self.do_test_requests("success", "GET", 200, 0, 0)
+
+    @override
+    def do_send_request(self, path: str, method: str, status_code: int) -> None:
+        handle: InProcessMockCollectorHandle = self.mock_collector_handle
+        channel: grpc.Channel = grpc.insecure_channel(f"{handle.endpoint_host}:{handle.endpoint_grpc_port}")
+        self.addCleanup(channel.close)
+        stopped: threading.Event = threading.Event()
+
+        def export() -> None:
+            stopped.wait(_EXPORT_DELAY_SEC)
+            TraceServiceStub(channel).Export(span_export(span(f"{method} /{path}")))
+            metrics: List[Metric] = [Metric(name=name) for name in (LATENCY_METRIC, ERROR_METRIC, FAULT_METRIC)]
+            while not stopped.is_set():
+                MetricsServiceStub(channel).Export(metric_export(*metrics))
+                stopped.wait(_METRIC_EXPORT_INTERVAL_SEC)
+
+        exporter: threading.Thread = threading.Thread(target=export, daemon=True)
+        exporter.start()
+        self.addCleanup(exporter.join)
+        self.addCleanup(stopped.set)
+
+    @override
+    def _assert_aws_span_attributes(self, resource_scope_spans: List[ResourceScopeSpan], path: str, **kwargs) -> None:
+        self.assertEqual([f"GET /{path}"], [record.span.name for record in resource_scope_spans])
+
+    @override
+    def _assert_semantic_conventions_span_attributes(
+        self, resource_scope_spans: List[ResourceScopeSpan], method: str, path: str, status_code: int, **kwargs
+    ) -> None:
+        self.assertEqual(1, len(resource_scope_spans))
+
+    @override
+    def _assert_metric_attributes(
+        self, resource_scope_metrics: List[ResourceScopeMetric], metric_name: str, expected_sum: int, **kwargs
+    ) -> None:
+        names: Set[str] = {record.metric.name for record in resource_scope_metrics}
+        self.assertIn(metric_name, names)
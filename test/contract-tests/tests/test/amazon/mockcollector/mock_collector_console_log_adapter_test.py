@@ -0,0 +1,112 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests of the conversion of compact console log lines, and of a forwarder reading them from a stream."""
+import json
+from typing import Any, Dict, List, Optional
+from unittest import TestCase
+
+from mock_collector_console_log_adapter import ConsoleLogForwarder, ConsoleLogStats, parse_compact_log_line
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord
+
+
+def _compact(**overrides: Any) -> Dict[str, Any]:
+    document: Dict[str, Any] = {
+        "resource": {"attributes": {"service.name": "lambda"}, "schemaUrl": ""},
+        "scope": {"name": "scope", "version": "1.0"},
+        "body": "handled",
+        "severityNumber": 9,
+        "severityText": "Information",
+        "attributes": {"count": 2, "ratio": 0.5, "ok": True, "tags": ["a"]},
+        "droppedAttributes": 0,
+        "timeUnixNano": "1700000000000000001",
+        "observedTimeUnixNano": "1700000000000000002",
+        "traceId": "01" * 16,
+        "spanId": "0a" * 8,
+        "flags": 1,
+    }
+    document.update(overrides)
+    return document
+
+
+def _line(document: Dict[str, Any]) -> bytes:
+    return json.dumps(document).encode()
+
+
+def _record(request: ExportLogsServiceRequest) -> LogRecord:
+    return request.resource_logs[0].scope_logs[0].log_records[0]
+
+
+class ParseCompactLogLineTest(TestCase):
+
+    def test_converts_a_compact_log_line(self) -> None:
+        request: Optional[ExportLogsServiceRequest] = parse_compact_log_line(b"  " + _line(_compact()) + b"  ")
+
+        self.assertIsNotNone(request)
+        resource_logs = request.resource_logs[0]
+        self.assertEqual("lambda", resource_logs.resource.attributes[0].value.string_value)
+        scope = resource_logs.scope_logs[0].scope
+        self.assertEqual(("scope", "1.0"), (scope.name, scope.version))
+        record: LogRecord = _record(request)
+        self.assertEqual("handled", record.body.string_value)
+        self.assertEqual((9, "Information"), (record.severity_number, record.severity_text))
+        self.assertEqual(1700000000000000001, record.time_unix_nano)
+        self.assertEqual(1700000000000000002, record.observed_time_unix_nano)
+        self.assertEqual((b"\x01" * 16, b"\x0a" * 8, 1), (record.trace_id, record.span_id, record.flags))
+        values = {kv.key: kv.value for kv in record.attributes}
+        self.assertEqual(2, values["count"].int_value)
+        self.assertEqual(0.5, values["ratio"].double_value)
+        self.assertTrue(values["ok"].bool_value)
+        self.assertEqual("a", values["tags"].array_value.values[0].string_value)
+
+    def test_empty_trace_context_is_accepted(self) -> None:
+        request: Optional[ExportLogsServiceRequest] = parse_compact_log_line(_line(_compact(traceId="", spanId=None)))
+
+        self.assertIsNotNone(request)
+        self.assertEqual((b"", b""), (_record(request).trace_id, _record(request).span_id))
+
+    def test_other_output_is_not_a_compact_log_line(self) -> None:
+        for line in (b"", b"Application started.", b"{not json", b"[1, 2]", json.dumps({"body": "x"}).encode()):
+            with self.subTest(line=line):
+                self.assertIsNone(parse_compact_log_line(line))
+
+    def test_malformed_values_are_not_a_compact_log_line(self) -> None:
+        for overrides in (
+            {"traceId": "not-hex"},
+            {"spanId": "0a0"},
+            {"timeUnixNano": "yesterday"},
+            {"severityNumber": [9]},
+            {"traceId": 1},
+        ):
+            with self.subTest(overrides=overrides):
+                self.assertIsNone(parse_compact_log_line(_line(_compact(**overrides))))
+
+
+class _RecordingLogsClient:
+    def __init__(self):
+        self.requests: List[ExportLogsServiceRequest] = []
+
+    # pylint: disable=invalid-name
+    def Export(self, request: ExportLogsServiceRequest) -> None:
+        self.requests.append(request)
+
+
+class ConsoleLogForwarderTest(TestCase):
+
+    def test_malformed_line_does_not_stop_forwarding(self) -> None:
+        good: bytes = _line(_compact())
+        bad: bytes = _line(_compact(traceId="not-hex"))
+        # Chunks split mid-line, as a container log stream delivers them.
+        output: bytes = b"starting\n" + bad + b"\n" + good + b"\r\n" + good
+        chunks: List[bytes] = [output[i : i + 50] for i in range(0, len(output), 50)]
+        forwarder: ConsoleLogForwarder = ConsoleLogForwarder(chunks, "127.0.0.1", "1")
+        client: _RecordingLogsClient = _RecordingLogsClient()
+        forwarder._client = client  # pylint: disable=protected-access
+
+        forwarder.start()
+        forwarder.join(10)
+
+        stats: ConsoleLogStats = forwarder.stats
+        self.assertEqual((4, 2, 2, 0), (stats.lines, stats.compact_log_lines, stats.forwarded, stats.failed))
+        self.assertEqual(2, len(client.requests))
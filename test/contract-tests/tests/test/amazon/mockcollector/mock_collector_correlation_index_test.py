@@ -0,0 +1,144 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests of the joins of `CorrelationIndex` between spans, log records and metric exemplars."""
+from typing import List
+from unittest import TestCase
+
+from mock_collector_client import ResourceScopeLogRecord, ResourceScopeMetric, ResourceScopeSpan
+from mock_collector_correlation_index import CorrelationIndex
+
+from amazon.mockcollector.otlp_builders import any_value, attributes, log_export, metric_export, span, span_export
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord
+from opentelemetry.proto.metrics.v1.metrics_pb2 import (
+    Exemplar,
+    Histogram,
+    HistogramDataPoint,
+    Metric,
+    Summary,
+    SummaryDataPoint,
+)
+
+_TRACE: bytes = b"\x01" * 16
+_CAPTURED: bytes = b"\x0a" * 8
+_OTHER: bytes = b"\x0b" * 8
+_LOST: bytes = b"\x0c" * 8
+
+
+def _spans(*span_ids: bytes) -> List[ResourceScopeSpan]:
+    export = span_export(*(span(f"span-{i}", span_id=span_id, trace_id=_TRACE) for i, span_id in enumerate(span_ids)))
+    return [
+        ResourceScopeSpan(resource_spans, scope_spans, record)
+        for resource_spans in export.resource_spans
+        for scope_spans in resource_spans.scope_spans
+        for record in scope_spans.spans
+    ]
+
+
+def _log(event_name: str, span_id: bytes = b"") -> LogRecord:
+    return LogRecord(
+        trace_id=_TRACE if span_id else b"",
+        span_id=span_id,
+        body=any_value(event_name),
+        attributes=attributes(("event.name", event_name)),
+    )
+
+
+def _logs(*records: LogRecord) -> List[ResourceScopeLogRecord]:
+    export = log_export(*records)
+    return [
+        ResourceScopeLogRecord(resource_logs, scope_logs, record)
+        for resource_logs in export.resource_logs
+        for scope_logs in resource_logs.scope_logs
+        for record in scope_logs.log_records
+    ]
+
+
+def _metrics(*metrics: Metric) -> List[ResourceScopeMetric]:
+    export = metric_export(*metrics)
+    return [
+        ResourceScopeMetric(resource_metrics, scope_metrics, metric)
+        for resource_metrics in export.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    ]
+
+
+def _exemplar(span_id: bytes = b"") -> Exemplar:
+    return Exemplar(as_double=1.0, trace_id=_TRACE if span_id else b"", span_id=span_id)
+
+
+def _event_is(event_name: str):
+    return lambda record: record.log_record.body.string_value == event_name
+
+
+class CorrelationIndexTest(TestCase):
+
+    def setUp(self) -> None:
+        latency: Metric = Metric(
+            name="latency",
+            histogram=Histogram(
+                data_points=[
+                    HistogramDataPoint(exemplars=[_exemplar(_CAPTURED), _exemplar(_LOST)]),
+                    HistogramDataPoint(exemplars=[_exemplar(_CAPTURED), _exemplar()]),
+                ]
+            ),
+        )
+        # Summary points have no exemplars; the index must skip them rather than fail.
+        summary: Metric = Metric(name="summary", summary=Summary(data_points=[SummaryDataPoint(count=1)]))
+        self.index: CorrelationIndex = CorrelationIndex(
+            _spans(_CAPTURED, _OTHER),
+            _logs(
+                _log("incident", _CAPTURED),
+                _log("summary", _CAPTURED),
+                _log("incident", _LOST),
+                _log("summary"),
+            ),
+            _metrics(latency, summary, Metric(name="empty")),
+        )
+
+    def test_joins_by_span(self) -> None:
+        key = (_TRACE, _CAPTURED)
+        self.assertEqual("span-0", self.index.span(key).span.name)
+        self.assertIsNone(self.index.span((_TRACE, _LOST)))
+        self.assertEqual(["incident", "summary"], [r.log_record.body.string_value for r in self.index.logs_for(key)])
+        self.assertEqual(2, len(self.index.exemplars_for(key)))
+        self.assertEqual("latency", self.index.exemplars_for(key)[0].resource_scope_metric.metric.name)
+        self.assertEqual([], self.index.logs_for((_TRACE, _OTHER)))
+
+    def test_spans_referenced_by_logs(self) -> None:
+        self.assertEqual(["span-0"], [r.span.name for r in self.index.spans_referenced_by_logs()])
+        self.assertEqual(["span-0"], [r.span.name for r in self.index.spans_referenced_by_logs(_event_is("incident"))])
+        self.assertEqual([], self.index.spans_referenced_by_logs(_event_is("unknown")))
+
+    def test_logs_without_span(self) -> None:
+        # The log without trace context is not counted as lacking a span.
+        lost: List[ResourceScopeLogRecord] = self.index.logs_without_span()
+        self.assertEqual([_LOST], [record.log_record.span_id for record in lost])
+        self.assertEqual([], self.index.logs_without_span(_event_is("summary")))
+
+    def test_exemplars(self) -> None:
+        self.assertEqual(["span-0"], [r.span.name for r in self.index.spans_referenced_by_exemplars()])
+        self.assertEqual([_LOST], [e.exemplar.span_id for e in self.index.exemplars_without_span()])
+
+    def test_completeness(self) -> None:
+        report = self.index.completeness().to_report()
+
+        self.assertEqual(
+            {
+                "spans": 2,
+                "logs": 4,
+                "logs_with_context": 3,
+                "logs_joined": 2,
+                "exemplars": 3,
+                "exemplars_joined": 2,
+                "log_ratio": 2 / 3,
+                "exemplar_ratio": 2 / 3,
+            },
+            report,
+        )
+
+    def test_nothing_to_join_is_complete(self) -> None:
+        completeness = CorrelationIndex(_spans(_CAPTURED), _logs(_log("summary"))).completeness()
+
+        self.assertEqual((1.0, 1.0), (completeness.log_ratio, completeness.exemplar_ratio))
+        self.assertEqual(0, completeness.logs_with_context)
@@ -0,0 +1,152 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests of partial decoding with `Projection` and of log records resolved lazily from their export request."""
+from typing import List
+from unittest import TestCase
+
+from mock_collector_client import ResourceScopeLogRecord, _filter_by_event_name
+from mock_collector_projection import LazyExport, Projection, decode_all
+
+from amazon.mockcollector.otlp_builders import (
+    any_value,
+    attributes,
+    log_export,
+    metric_export,
+    resource,
+    span,
+    span_export,
+)
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import InstrumentationScope
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord, ResourceLogs, ScopeLogs
+from opentelemetry.proto.metrics.v1.metrics_pb2 import Gauge, Metric, NumberDataPoint
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+_METRIC_NAMES: str = "resource_metrics.scope_metrics.metrics.name"
+_LOG_ATTRIBUTES: str = "resource_logs.scope_logs.log_records.attributes"
+
+
+def _log(event_name: str, body: str) -> LogRecord:
+    return LogRecord(body=any_value(body), attributes=attributes(("event.name", event_name), ("n", len(body))))
+
+
+def _names(records: List[ResourceScopeLogRecord]) -> List[str]:
+    return [record.log_record.body.string_value for record in records]
+
+
+class ProjectionTest(TestCase):
+
+    def test_matches_a_full_decode_of_the_selected_fields(self) -> None:
+        gauge: Gauge = Gauge(data_points=[NumberDataPoint(as_int=3, attributes=attributes(("k", "v")))])
+        metrics: List[Metric] = [Metric(name="latency", unit="ms", gauge=gauge), Metric(name="error")]
+        data: bytes = metric_export(*metrics).SerializeToString()
+        full: ExportMetricsServiceRequest = ExportMetricsServiceRequest.FromString(data)
+        projection: Projection = Projection(ExportMetricsServiceRequest, [_METRIC_NAMES])
+
+        projected = projection.decode(data)
+
+        self.assertEqual(
+            [metric.name for metric in full.resource_metrics[0].scope_metrics[0].metrics],
+            [metric.name for metric in projected.resource_metrics[0].scope_metrics[0].metrics],
+        )
+        # Nothing else is materialized; the rest of the bytes are kept as unknown fields.
+        metric = projected.resource_metrics[0].scope_metrics[0].metrics[0]
+        self.assertEqual(["name"], [field.name for field, _ in metric.ListFields()])
+        self.assertEqual(["scope_metrics"], [field.name for field, _ in projected.resource_metrics[0].ListFields()])
+
+    def test_a_path_ending_at_a_message_keeps_its_full_type(self) -> None:
+        data: bytes = log_export(_log("a", "first"), _log("b", "second")).SerializeToString()
+        full: ExportLogsServiceRequest = ExportLogsServiceRequest.FromString(data)
+        projection: Projection = Projection(ExportLogsServiceRequest, [_LOG_ATTRIBUTES])
+
+        projected = projection.decode(data)
+
+        for full_record, projected_record in zip(
+            full.resource_logs[0].scope_logs[0].log_records, projected.resource_logs[0].scope_logs[0].log_records
+        ):
+            self.assertEqual(
+                [attribute.SerializeToString() for attribute in full_record.attributes],
+                [attribute.SerializeToString() for attribute in projected_record.attributes],
+            )
+        self.assertNotIn("body", projected.resource_logs[0].scope_logs[0].log_records[0].DESCRIPTOR.fields_by_name)
+
+    def test_sibling_paths_and_enums(self) -> None:
+        data: bytes = span_export(span("GET /", kind=Span.SPAN_KIND_CLIENT), span("work")).SerializeToString()
+        full: ExportTraceServiceRequest = ExportTraceServiceRequest.FromString(data)
+
+        projection: Projection = Projection(
+            ExportTraceServiceRequest,
+            [
+                "resource_spans.scope_spans.spans.name",
+                "resource_spans.scope_spans.spans.kind",
+                "resource_spans.resource",
+            ],
+        )
+        projected = projection.decode(data)
+
+        self.assertEqual(
+            [(record.name, record.kind) for record in full.resource_spans[0].scope_spans[0].spans],
+            [(record.name, record.kind) for record in projected.resource_spans[0].scope_spans[0].spans],
+        )
+        self.assertEqual(
+            full.resource_spans[0].resource.SerializeToString(),
+            projected.resource_spans[0].resource.SerializeToString(),
+        )
+        # Another projection of the same type gets a descriptor pool of its own rather than a clash in a shared one.
+        names: Projection = Projection(ExportTraceServiceRequest, ["resource_spans.scope_spans.spans.name"])
+        self.assertEqual(2, len(names.decode(data).resource_spans[0].scope_spans[0].spans))
+
+
+class LazyExportTest(TestCase):
+
+    def test_decodes_once_on_first_access(self) -> None:
+        request: ExportLogsServiceRequest = log_export(_log("a", "first"))
+        export: LazyExport[ExportLogsServiceRequest] = LazyExport(request.SerializeToString(), ExportLogsServiceRequest)
+
+        message: ExportLogsServiceRequest = export.message
+
+        self.assertEqual(request, message)
+        self.assertIs(message, export.message)
+
+    def test_decode_all(self) -> None:
+        requests: List[ExportLogsServiceRequest] = [log_export(_log("a", "first")), log_export()]
+
+        self.assertEqual(
+            requests, decode_all([request.SerializeToString() for request in requests], ExportLogsServiceRequest)
+        )
+
+
+class LazyResourceScopeLogRecordTest(TestCase):
+
+    def test_resolves_the_record_at_its_position(self) -> None:
+        # Two resources, the second with two scopes, so every index of the position is exercised.
+        request: ExportLogsServiceRequest = log_export(_log("match", "r0-s0-l0"), _log("other", "r0-s0-l1"))
+        request.resource_logs.append(
+            ResourceLogs(
+                resource=resource("second"),
+                scope_logs=[
+                    ScopeLogs(scope=InstrumentationScope(name="s0"), log_records=[_log("other", "r1-s0-l0")]),
+                    ScopeLogs(
+                        scope=InstrumentationScope(name="s1"),
+                        log_records=[_log("match", "r1-s1-l0"), _log("other", "r1-s1-l1"), _log("match", "r1-s1-l2")],
+                    ),
+                ],
+            )
+        )
+        second: ExportLogsServiceRequest = log_export(_log("match", "e1-r0-s0-l0"))
+
+        # pylint: disable=protected-access
+        records: List[ResourceScopeLogRecord] = _filter_by_event_name(
+            [request.SerializeToString(), second.SerializeToString()], "match"
+        )
+
+        self.assertEqual(["r0-s0-l0", "r1-s1-l0", "r1-s1-l2", "e1-r0-s0-l0"], _names(records))
+        self.assertEqual(["s1", "s1"], [record.scope_logs.scope.name for record in records[1:3]])
+        self.assertEqual("second", records[1].resource_logs.resource.attributes[0].value.string_value)
+        self.assertEqual(request.resource_logs[1].scope_logs[1].log_records[2], records[2].log_record)
+
+    def test_no_match(self) -> None:
+        # pylint: disable=protected-access
+        self.assertEqual([], _filter_by_event_name([log_export(_log("other", "x")).SerializeToString()], "match"))
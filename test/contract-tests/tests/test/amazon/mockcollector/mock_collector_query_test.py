@@ -0,0 +1,144 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests of the mock collector's query language and of its query RPC, served by a collector in this process."""
+from typing import Any, Dict
+from unittest import TestCase
+
+import grpc
+from mock_collector_client import MockCollectorClient
+from mock_collector_query import TelemetryQuery, attr, evaluate, field, logs, metrics, result_from_proto, spans
+from mock_collector_server import MockCollectorServer, start_server
+from mock_collector_service_pb2 import Query
+from mock_collector_tables import LogTable, SpanTable
+
+from amazon.mockcollector.otlp_builders import any_value, log_export, span, span_export
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+
+def _spans() -> SpanTable:
+    return SpanTable.from_exports(
+        [
+            span_export(
+                span("a", ("k", "x"), ("n", 2)),
+                span("b", ("k", "y"), ("n", 3), kind=Span.SPAN_KIND_CLIENT),
+                span("c", kind=Span.SPAN_KIND_CLIENT),
+            )
+        ]
+    )
+
+
+class TelemetryQueryTest(TestCase):
+
+    def setUp(self) -> None:
+        self.table: SpanTable = _spans()
+
+    def test_eq_on_encoded_and_plain_columns(self) -> None:
+        self.assertEqual(1, spans().where(field("name") == "a").count(self.table))
+        self.assertEqual(2, spans().where(field("kind") == Span.SPAN_KIND_CLIENT).count(self.table))
+        self.assertEqual(1, spans().where(attr("k") == "y").count(self.table))
+        self.assertEqual(0, spans().where(attr("k") == "unknown").count(self.table))
+
+    def test_ne_keeps_rows_without_the_attribute(self) -> None:
+        # Whether or not the compared value was ever stored, the row without `k` is kept, as for plain columns.
+        self.assertEqual(["b", "c"], [row.name for row in spans().where(attr("k") != "x").select(self.table)])
+        self.assertEqual(3, spans().where(attr("k") != "unknown").count(self.table))
+        self.assertEqual(2, spans().where(field("name") != "a").count(self.table))
+        self.assertEqual(1, spans().where(field("kind") != Span.SPAN_KIND_CLIENT).count(self.table))
+
+    def test_isin_and_matches(self) -> None:
+        self.assertEqual(2, spans().where(field("name").isin(["a", "c", "z"])).count(self.table))
+        self.assertEqual(2, spans().where(attr("k").matches("[xy]")).count(self.table))
+        self.assertEqual(1, spans().where(attr("n").matches("3")).count(self.table))
+        self.assertEqual(0, spans().where(attr("k").matches("x.+")).count(self.table))
+
+    def test_exists(self) -> None:
+        self.assertEqual(2, spans().where(attr("k").exists()).count(self.table))
+        self.assertEqual(0, spans().where(attr("unknown").exists()).count(self.table))
+        log_table: LogTable = LogTable.from_exports([log_export(LogRecord(body=any_value("b")), LogRecord())])
+        self.assertEqual(1, logs().where(field("body").exists()).count(log_table))
+        self.assertEqual(0, logs().where(field("severity_text").exists()).count(log_table))
+
+    def test_exists_rejects_fields_that_always_have_a_value(self) -> None:
+        with self.assertRaises(ValueError):
+            spans().where(field("name").exists()).count(self.table)
+        with self.assertRaises(ValueError):
+            spans().where(field("kind").exists()).count(self.table)
+
+    def test_conditions_are_combined(self) -> None:
+        query: TelemetryQuery = spans().where(field("kind") == Span.SPAN_KIND_CLIENT, attr("k").exists())
+        self.assertEqual(["b"], [row.name for row in query.select(self.table)])
+
+    def test_group_by_and_sum(self) -> None:
+        self.assertEqual({("x",): 1, ("y",): 1, (None,): 1}, spans().group_by(attr("k")).count(self.table))
+        self.assertEqual(5, spans().sum(self.table, attr("n")))
+        self.assertEqual(
+            {(Span.SPAN_KIND_SERVER,): 2, (Span.SPAN_KIND_CLIENT,): 3},
+            spans().group_by(field("kind")).sum(self.table, attr("n")),
+        )
+
+    def test_query_runs_on_the_table_of_its_signal(self) -> None:
+        with self.assertRaises(TypeError):
+            metrics().count(self.table)
+        with self.assertRaises(ValueError):
+            TelemetryQuery("events")
+
+    def test_proto_round_trip(self) -> None:
+        query: TelemetryQuery = spans().where(
+            field("kind") == Span.SPAN_KIND_CLIENT, attr("k").isin(["y", None]), attr("flag") != "z"
+        )
+        message: Query = Query.FromString(query.group_by(attr("k")).to_proto("sum", attr("n")).SerializeToString())
+
+        self.assertEqual("sum", message.aggregate)
+        decoded: TelemetryQuery = TelemetryQuery.from_proto(message)
+        self.assertEqual([repr(predicate) for predicate in query.predicates], [repr(p) for p in decoded.predicates])
+        self.assertEqual({("y",): 3.0}, result_from_proto(evaluate(message, self.table), grouped=True, is_count=False))
+        self.assertEqual(1, result_from_proto(evaluate(query.to_proto(), self.table), grouped=False, is_count=True))
+
+
+class MockCollectorQueryServiceTest(TestCase):
+    """The query RPC through gRPC, against a collector started in this process."""
+
+    def setUp(self) -> None:
+        self.server: MockCollectorServer = start_server(0, 0, "127.0.0.1")
+        self.addCleanup(self.server.stop)
+        self.client: MockCollectorClient = MockCollectorClient("127.0.0.1", str(self.server.grpc_port))
+
+    def _export(self, *names: str) -> None:
+        self.server.service.trace_collector.Export(span_export(*(span(name, ("k", name)) for name in names)), None)
+
+    def test_query(self) -> None:
+        self._export("a", "b", "b")
+
+        self.assertEqual(2, self.client.query(spans().where(field("name") == "b")))
+        grouped: Dict[Any, int] = self.client.query(spans().group_by(attr("k")))
+        self.assertEqual({("a",): 1, ("b",): 2}, grouped)
+        self.assertEqual(0, self.client.query(logs()))
+
+    def test_table_follows_exports_and_clears(self) -> None:
+        self._export("a")
+        self.assertEqual(1, self.client.query(spans()))
+        self.assertEqual(1, self.client.query(spans()))
+        self._export("b")
+        self.assertEqual(2, self.client.query(spans()))
+        self.client.clear_signals()
+        self.assertEqual(0, self.client.query(spans()))
+        self._export("c")
+        self.assertEqual({("c",): 1}, self.client.query(spans().group_by(attr("k"))))
+
+    def test_table_is_reused_until_the_next_export(self) -> None:
+        self._export("a")
+        self.client.query(spans())
+        first: Any = self.server.service._tables["spans"][1]  # pylint: disable=protected-access
+        self.client.query(spans().where(attr("k") == "a"))
+        self.assertIs(first, self.server.service._tables["spans"][1])  # pylint: disable=protected-access
+        self._export("b")
+        self.client.query(spans())
+        self.assertIsNot(first, self.server.service._tables["spans"][1])  # pylint: disable=protected-access
+
+    def test_invalid_query_is_rejected(self) -> None:
+        with self.assertRaises(grpc.RpcError) as raised:
+            self.client.query(spans().where(field("unknown") == 1))
+        self.assertEqual(grpc.StatusCode.INVALID_ARGUMENT, raised.exception.code())
+        with self.assertRaises(grpc.RpcError):
+            self.client.query(spans().where(field("name").exists()))
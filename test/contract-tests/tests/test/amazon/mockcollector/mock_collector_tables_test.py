@@ -0,0 +1,161 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests of the mock collector's columnar tables; they build OTLP exports in memory and need no containers."""
+from typing import Dict
+from unittest import TestCase
+
+from mock_collector_query import field, metrics
+from mock_collector_tables import LogTable, MetricTable, Selection, SpanTable
+
+from amazon.mockcollector.otlp_builders import any_value, attributes, log_export, metric_export, span, span_export
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord
+from opentelemetry.proto.metrics.v1.metrics_pb2 import Gauge, Histogram, HistogramDataPoint, Metric, NumberDataPoint
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+
+class SpanTableTest(TestCase):
+
+    def test_columns_and_shared_resources(self) -> None:
+        table: SpanTable = SpanTable.from_exports(
+            [
+                span_export(span("a", ("k", "1"), span_id=b"\x01"), span("b", kind=Span.SPAN_KIND_CLIENT)),
+                span_export(span("c"), service="other"),
+            ]
+        )
+
+        self.assertEqual(3, len(table))
+        self.assertEqual(["a", "b", "c"], [row.name for row in table])
+        self.assertEqual([Span.SPAN_KIND_SERVER, Span.SPAN_KIND_CLIENT], [row.kind for row in list(table)[:2]])
+        self.assertEqual(b"\x01", table.row(0).span_id)
+        self.assertEqual(500, table.row(0).duration_nanos)
+        self.assertEqual([500, 500, 500], list(table.durations_nanos()))
+        self.assertEqual(("scope", "1.0"), (table.row(1).scope_name, table.row(1).scope_version))
+        self.assertEqual(2, len(table.resources))
+        self.assertEqual({"service.name": "other"}, table.row(2).resource_attributes)
+
+    def test_sparse_attributes(self) -> None:
+        table: SpanTable = SpanTable.from_exports([span_export(span("a"), span("b", ("k", "v")), span("c"))])
+
+        self.assertIsNone(table.row(0).attribute("k"))
+        self.assertEqual("v", table.row(1).attribute("k"))
+        self.assertEqual("default", table.row(2).attribute("k", "default"))
+        self.assertEqual({"k": "v"}, table.row(1).attributes)
+        self.assertEqual({}, table.row(2).attributes)
+
+    def test_repeated_attribute_key_keeps_last_value(self) -> None:
+        table: SpanTable = SpanTable.from_exports(
+            [span_export(span("a", ("k", "1"), ("k", "2")), span("b", ("k", "3")), span("c"), span("d", ("k", 4)))]
+        )
+
+        self.assertEqual(["2", "3", None, 4], [row.attribute("k") for row in table])
+        self.assertEqual(len(table), len(table.attribute_column("k")))
+        self.assertEqual(["b"], [row.name for row in table.where_attribute("k", "3")])
+
+    def test_array_attributes_are_tuples(self) -> None:
+        table: SpanTable = SpanTable.from_exports([span_export(span("a", ("k", ["x", "y"])))])
+
+        self.assertEqual(("x", "y"), table.row(0).attribute("k"))
+        self.assertEqual(1, len(table.where_attribute("k", ("x", "y"))))
+
+    def test_encoded_values_keep_their_type(self) -> None:
+        table: SpanTable = SpanTable.from_exports([span_export(span("a", ("k", True)), span("b", ("k", 1)))])
+
+        self.assertEqual(["a"], [row.name for row in table.where_attribute("k", True)])
+        self.assertEqual(["b"], [row.name for row in table.where_attribute("k", 1)])
+
+
+class MetricTableTest(TestCase):
+
+    def test_gauge_and_histogram_points(self) -> None:
+        gauge: Metric = Metric(
+            name="gauge",
+            gauge=Gauge(
+                data_points=[
+                    NumberDataPoint(as_int=3, attributes=attributes(("k", "a"))),
+                    NumberDataPoint(as_double=1.5, attributes=attributes(("k", "b"))),
+                ]
+            ),
+        )
+        histogram: Metric = Metric(
+            name="latency",
+            histogram=Histogram(data_points=[HistogramDataPoint(count=4, sum=10.0, max=7.0)]),
+        )
+        table: MetricTable = MetricTable.from_exports([metric_export(gauge, histogram, Metric(name="empty"))])
+
+        self.assertEqual(3, len(table))
+        self.assertEqual([3.0, 1.5, 0.0], [row.value for row in table])
+        self.assertEqual(["gauge", "gauge", "histogram"], [row.data_type for row in table])
+        latency = table.where(name="latency").first()
+        self.assertEqual((4, 10.0, 0.0, 7.0), (latency.count, latency.sum, latency.min, latency.max))
+        self.assertEqual(["b"], [row.attribute("k") for row in table.where(name="gauge").where_attribute("k", "b")])
+
+    def test_int_points_keep_their_type(self) -> None:
+        large: int = 2**53 + 1
+        gauge: Metric = Metric(
+            name="gauge",
+            gauge=Gauge(data_points=[NumberDataPoint(as_int=large), NumberDataPoint(as_int=-2), NumberDataPoint()]),
+        )
+        table: MetricTable = MetricTable.from_exports([metric_export(gauge)])
+
+        self.assertEqual([large, -2, 0.0], [row.value for row in table])
+        self.assertEqual([int, int, float], [type(row.value) for row in table])
+        self.assertEqual(large - 2, metrics().sum(table, field("value")))
+        self.assertIsInstance(metrics().sum(table, field("value")), int)
+        self.assertEqual(1, len(table.where(value=large)))
+
+
+class LogTableTest(TestCase):
+
+    def test_body_severity_and_event_name(self) -> None:
+        table: LogTable = LogTable.from_exports(
+            [
+                log_export(
+                    LogRecord(
+                        severity_text="INFO",
+                        body=any_value("started"),
+                        attributes=attributes(("event.name", "deployment")),
+                    ),
+                    LogRecord(body=AnyValue(), attributes=attributes(("event.name", "summary"))),
+                )
+            ]
+        )
+
+        self.assertEqual(["started", None], [row.body for row in table])
+        self.assertEqual(["INFO", None], [row.severity_text for row in table])
+        self.assertEqual(["summary"], [row.event_name for row in table.where_event_name("summary")])
+        self.assertEqual(0, len(table.where(severity_text="WARN")))
+
+
+class SelectionTest(TestCase):
+
+    def setUp(self) -> None:
+        self.table: SpanTable = SpanTable.from_exports(
+            [
+                span_export(
+                    span("a", ("k", "1")),
+                    span("a", ("k", "2"), kind=Span.SPAN_KIND_CLIENT),
+                    span("b", ("k", "1")),
+                )
+            ]
+        )
+
+    def test_where_chains_over_selected_rows(self) -> None:
+        selection: Selection = self.table.where(name="a")
+
+        self.assertEqual([0, 1], list(selection.rows))
+        self.assertEqual([1], list(selection.where(kind=Span.SPAN_KIND_CLIENT).rows))
+        self.assertEqual([0], list(selection.where_attribute("k", "1").rows))
+        self.assertEqual(0, len(selection.where_attribute("k", "unknown")))
+
+    def test_filter_and_first(self) -> None:
+        selection: Selection = self.table.all().filter(lambda row: row.attribute("k") == "1")
+
+        self.assertEqual(["a", "b"], [row.name for row in selection])
+        self.assertEqual(0, selection.first().index)
+        self.assertIsNone(self.table.where(name="unknown").first())
+
+    def test_where_on_an_unknown_value_is_empty(self) -> None:
+        names: Dict[str, int] = {name: len(self.table.where(name=name)) for name in ("a", "b", "c")}
+
+        self.assertEqual({"a": 2, "b": 1, "c": 0}, names)
@@ -0,0 +1,175 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests of the parent/child links of `TraceIndex` and the queries over them."""
+from typing import List
+from unittest import TestCase
+
+from mock_collector_client import ResourceScopeSpan, span_named, span_of_kind
+from mock_collector_trace_index import SpanNode, TraceIndex
+
+from amazon.mockcollector.otlp_builders import span, span_export
+from opentelemetry.proto.trace.v1.trace_pb2 import Span, SpanFlags
+
+_TRACE: bytes = b"\x01" * 16
+_OTHER_TRACE: bytes = b"\x02" * 16
+_REMOTE_PARENT: int = SpanFlags.SPAN_FLAGS_CONTEXT_HAS_IS_REMOTE_MASK | SpanFlags.SPAN_FLAGS_CONTEXT_IS_REMOTE_MASK
+
+
+def _id(number: int) -> bytes:
+    return number.to_bytes(8, "big")
+
+
+def _records(*spans: Span) -> List[ResourceScopeSpan]:
+    return [
+        ResourceScopeSpan(resource_spans, scope_spans, record)
+        for resource_spans in span_export(*spans).resource_spans
+        for scope_spans in resource_spans.scope_spans
+        for record in scope_spans.spans
+    ]
+
+
+class TraceIndexTest(TestCase):
+
+    def setUp(self) -> None:
+        # The application calls itself over HTTP, then S3; children are listed out of start order on purpose.
+        self.index: TraceIndex = TraceIndex(
+            _records(
+                span(
+                    "work",
+                    kind=Span.SPAN_KIND_INTERNAL,
+                    span_id=_id(2),
+                    trace_id=_TRACE,
+                    parent_span_id=_id(1),
+                    start_time_unix_nano=1200,
+                ),
+                span("GET /call", span_id=_id(1), trace_id=_TRACE),
+                span(
+                    "GET /self",
+                    kind=Span.SPAN_KIND_CLIENT,
+                    span_id=_id(3),
+                    trace_id=_TRACE,
+                    parent_span_id=_id(1),
+                    start_time_unix_nano=1100,
+                ),
+                span("GET /self", span_id=_id(4), trace_id=_TRACE, parent_span_id=_id(3), start_time_unix_nano=1150),
+                span(
+                    "S3.GetObject",
+                    kind=Span.SPAN_KIND_CLIENT,
+                    span_id=_id(5),
+                    trace_id=_TRACE,
+                    parent_span_id=_id(4),
+                    start_time_unix_nano=1160,
+                ),
+                # A server span under a server span is local, unless the exporter marked its parent as remote.
+                span(
+                    "remote",
+                    span_id=_id(6),
+                    trace_id=_TRACE,
+                    parent_span_id=_id(1),
+                    flags=_REMOTE_PARENT,
+                    start_time_unix_nano=1300,
+                ),
+                span(
+                    "local",
+                    span_id=_id(7),
+                    trace_id=_TRACE,
+                    parent_span_id=_id(1),
+                    start_time_unix_nano=1400,
+                    flags=SpanFlags.SPAN_FLAGS_CONTEXT_HAS_IS_REMOTE_MASK,
+                ),
+                span(
+                    "orphan",
+                    kind=Span.SPAN_KIND_CONSUMER,
+                    span_id=_id(8),
+                    trace_id=_OTHER_TRACE,
+                    parent_span_id=_id(99),
+                ),
+            )
+        )
+
+    def _node(self, span_id: int, trace_id: bytes = _TRACE) -> SpanNode:
+        node = self.index.node(trace_id, _id(span_id))
+        self.assertIsNotNone(node)
+        return node
+
+    def test_links(self) -> None:
+        self.assertEqual([_TRACE, _OTHER_TRACE], self.index.trace_ids)
+        self.assertEqual(7, len(self.index.trace(_TRACE)))
+        self.assertEqual([], self.index.trace(b"\x03" * 16))
+        self.assertIsNone(self.index.node(_TRACE, _id(99)))
+        self.assertIs(self._node(1), self._node(4).parent.parent)
+        self.assertEqual([_id(4), _id(3), _id(1)], [node.span.span_id for node in self._node(5).ancestors()])
+        self.assertEqual(
+            ["GET /self", "work", "remote", "local"], [child.span.name for child in self._node(1).children]
+        )
+
+    def test_is_local_root(self) -> None:
+        local_roots: List[str] = [node.span.name for node in self.index.local_roots()]
+
+        self.assertTrue(self._node(1).is_local_root, "no parent")
+        self.assertTrue(self._node(4).is_local_root, "incoming span under an outgoing one")
+        self.assertTrue(self._node(6).is_local_root, "remote parent")
+        self.assertTrue(self._node(8, _OTHER_TRACE).is_local_root, "parent not captured")
+        self.assertFalse(self._node(5).is_local_root, "outgoing span under an incoming one")
+        self.assertFalse(self._node(7).is_local_root, "parent known to be local")
+        self.assertFalse(self._node(2).is_local_root)
+        self.assertEqual(["GET /call", "GET /self", "remote", "orphan"], local_roots)
+
+    def test_local_root(self) -> None:
+        self.assertIs(self._node(4), self._node(5).local_root)
+        self.assertIs(self._node(1), self._node(3).local_root)
+        self.assertIs(self._node(1), self._node(1).local_root)
+        self.assertIs(self._node(6), self._node(6).local_root)
+
+    def test_roots_and_orphans(self) -> None:
+        self.assertEqual(["GET /call", "orphan"], [node.span.name for node in self.index.roots()])
+        self.assertEqual([self._node(8, _OTHER_TRACE)], self.index.orphans)
+        self.assertIsNone(self._node(8, _OTHER_TRACE).parent)
+
+    def test_descendants(self) -> None:
+        root: SpanNode = self._node(1)
+
+        # Depth first, children in start time order.
+        self.assertEqual(
+            ["GET /self", "GET /self", "S3.GetObject", "work", "remote", "local"],
+            [node.span.name for node in root.descendants()],
+        )
+        self.assertEqual(
+            [_id(3), _id(5)], [node.span.span_id for node in root.descendants(span_of_kind(Span.SPAN_KIND_CLIENT))]
+        )
+        self.assertEqual(
+            [_id(4)],
+            [
+                node.span.span_id
+                for node in root.descendants(span_named("GET /self"), span_of_kind(Span.SPAN_KIND_SERVER))
+            ],
+        )
+        self.assertEqual([], self._node(5).descendants())
+
+    def test_find(self) -> None:
+        self.assertEqual(
+            [_id(3), _id(5)], [node.span.span_id for node in self.index.find(span_of_kind(Span.SPAN_KIND_CLIENT))]
+        )
+        self.assertEqual(
+            ["orphan"], [node.span.name for node in self.index.find(span_of_kind(Span.SPAN_KIND_CONSUMER))]
+        )
+
+    def test_shape(self) -> None:
+        self.assertEqual(
+            (
+                "SPAN_KIND_SERVER",
+                "GET /call",
+                (
+                    (
+                        "SPAN_KIND_CLIENT",
+                        "GET /self",
+                        (("SPAN_KIND_SERVER", "GET /self", (("SPAN_KIND_CLIENT", "S3.GetObject", ()),)),),
+                    ),
+                    ("SPAN_KIND_INTERNAL", "work", ()),
+                    ("SPAN_KIND_SERVER", "remote", ()),
+                    ("SPAN_KIND_SERVER", "local", ()),
+                ),
+            ),
+            self._node(1).shape(),
+        )
+        self.assertEqual(("SPAN_KIND_CONSUMER", "orphan", ()), self._node(8, _OTHER_TRACE).shape())
@@ -0,0 +1,148 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests of the polling strategies, with intervals and timeouts of milliseconds."""
+import asyncio
+import itertools
+from typing import Callable, Iterator, List
+from unittest import TestCase
+
+from mock_collector_wait import (
+    AdaptiveBackoffWait,
+    FixedIntervalWait,
+    WaitStrategy,
+    WaitTimeoutError,
+    WaitTiming,
+    stable_for,
+)
+
+_INTERVAL: float = 0.001
+
+
+def _results(*sizes: int) -> Callable[[], List[int]]:
+    """A poll returning lists of the given sizes, then the last size forever."""
+    remaining: Iterator[int] = itertools.chain(sizes, itertools.repeat(sizes[-1]))
+    return lambda: [0] * next(remaining)
+
+
+def _first(strategy: WaitStrategy, count: int) -> List[float]:
+    return list(itertools.islice(strategy.intervals(), count))
+
+
+class IntervalsTest(TestCase):
+
+    def test_fixed_interval(self) -> None:
+        self.assertEqual([0.5, 0.5, 0.5], _first(FixedIntervalWait(0.5, 10), 3))
+
+    def test_backoff_grows_up_to_the_max_interval(self) -> None:
+        self.assertEqual([0.125, 0.25, 0.5, 0.75, 0.75], _first(AdaptiveBackoffWait(0.125, 0.75, 10), 5))
+        self.assertEqual([0.125, 0.375, 1.0, 1.0], _first(AdaptiveBackoffWait(0.125, 1.0, 10, factor=3.0), 4))
+
+
+class UntilTest(TestCase):
+
+    def test_returns_the_result_that_is_done(self) -> None:
+        strategy: WaitStrategy = FixedIntervalWait(_INTERVAL, 10)
+
+        result: List[int] = strategy.until(_results(0, 1, 2), lambda spans: len(spans) >= 2, "spans")
+
+        self.assertEqual(2, len(result))
+        timing: WaitTiming = strategy.timings[-1]
+        self.assertEqual(("spans", True, 3, [0, 1, 2]), (timing.label, timing.succeeded, timing.polls, timing.sizes))
+        self.assertIn("spans: done", timing.describe())
+
+    def test_poll_errors_are_recorded_and_retried(self) -> None:
+        outcomes: Iterator = iter([ConnectionError("unavailable"), "ready"])
+
+        def poll() -> str:
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        strategy: WaitStrategy = AdaptiveBackoffWait(_INTERVAL, _INTERVAL, 10)
+
+        self.assertEqual("ready", strategy.until(poll, bool))
+        timing: WaitTiming = strategy.timings[-1]
+        self.assertEqual((2, 1, [5]), (timing.polls, timing.errors, timing.sizes))
+        self.assertIsInstance(timing.last_error, ConnectionError)
+
+    def test_timeout(self) -> None:
+        strategy: WaitStrategy = FixedIntervalWait(_INTERVAL, 0.05)
+
+        with self.assertRaises(WaitTimeoutError) as raised:
+            strategy.until(_results(1, 3), lambda metrics: False, "metrics")
+
+        timing: WaitTiming = raised.exception.timing
+        self.assertIs(timing, strategy.timings[-1])
+        self.assertFalse(timing.succeeded)
+        self.assertGreaterEqual(timing.elapsed, 0.05)
+        self.assertGreater(timing.polls, 2)
+        self.assertEqual(timing.polls, len(timing.sizes))
+        self.assertEqual([1, 3], sorted(set(timing.sizes)))
+        self.assertIn("metrics: timed out", str(raised.exception))
+        self.assertIn("last result sizes [3, 3", str(raised.exception))
+
+    def test_timeout_describes_the_last_error(self) -> None:
+        def poll() -> List[int]:
+            raise ConnectionError("unavailable")
+
+        with self.assertRaises(WaitTimeoutError) as raised:
+            FixedIntervalWait(_INTERVAL, 0.01).until(poll, bool, "logs")
+
+        timing: WaitTiming = raised.exception.timing
+        self.assertEqual((timing.polls, []), (timing.errors, timing.sizes))
+        self.assertIn("failed, last with ConnectionError('unavailable')", timing.describe())
+
+    def test_until_async(self) -> None:
+        strategy: WaitStrategy = AdaptiveBackoffWait(_INTERVAL, 0.01, 10)
+        poll: Callable[[], List[int]] = _results(0, 0, 4)
+
+        async def poll_async() -> List[int]:
+            return poll()
+
+        result: List[int] = asyncio.run(strategy.until_async(poll_async, bool, "logs"))
+
+        self.assertEqual(4, len(result))
+        self.assertEqual([0, 0, 4], strategy.timings[-1].sizes)
+
+    def test_until_async_shares_a_deadline(self) -> None:
+        strategy: WaitStrategy = FixedIntervalWait(_INTERVAL, 10)
+
+        async def wait() -> None:
+            async def poll() -> List[int]:
+                return []
+
+            deadline: float = asyncio.get_running_loop().time() + 0.02
+            await strategy.until_async(poll, bool, "spans", deadline=deadline)
+
+        with self.assertRaises(WaitTimeoutError) as raised:
+            asyncio.run(wait())
+        self.assertLess(raised.exception.timing.elapsed, 1)
+
+
+class StableForTest(TestCase):
+
+    def test_waits_until_the_size_stops_changing(self) -> None:
+        strategy: WaitStrategy = FixedIntervalWait(_INTERVAL, 10)
+
+        result: List[int] = strategy.until(_results(0, 1, 1, 2, 3), stable_for(0.02), "spans")
+
+        self.assertEqual(3, len(result))
+        timing: WaitTiming = strategy.timings[-1]
+        self.assertGreaterEqual(timing.elapsed, 0.02)
+        # The window restarts on every change, so the repeated size before the last change does not end the wait.
+        self.assertEqual([0, 1, 1, 2, 3, 3], timing.sizes[:6])
+
+    def test_a_stable_empty_result_is_not_ready(self) -> None:
+        with self.assertRaises(WaitTimeoutError) as raised:
+            FixedIntervalWait(_INTERVAL, 0.03).until(_results(0), stable_for(0.001), "spans")
+
+        self.assertEqual({0}, set(raised.exception.timing.sizes))
+
+    def test_ready_condition(self) -> None:
+        done: Callable[[List[int]], bool] = stable_for(0, ready=lambda result: len(result) >= 2)
+
+        self.assertFalse(done([0]))  # First sight of a size is a change.
+        self.assertFalse(done([0]))
+        self.assertFalse(done([0, 0]))
+        self.assertTrue(done([0, 0]))
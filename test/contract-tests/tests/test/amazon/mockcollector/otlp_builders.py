@@ -0,0 +1,76 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""OTLP export requests built in memory for the unit tests of the mock collector."""
+from typing import Any, List
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, ArrayValue, InstrumentationScope, KeyValue
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord, ResourceLogs, ScopeLogs
+from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric, ResourceMetrics, ScopeMetrics
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span
+
+
+def any_value(value: Any) -> AnyValue:
+    if isinstance(value, bool):
+        return AnyValue(bool_value=value)
+    if isinstance(value, int):
+        return AnyValue(int_value=value)
+    if isinstance(value, float):
+        return AnyValue(double_value=value)
+    if isinstance(value, list):
+        return AnyValue(array_value=ArrayValue(values=[any_value(item) for item in value]))
+    return AnyValue(string_value=value)
+
+
+def attributes(*pairs: Any) -> List[KeyValue]:
+    """Key/value pairs in order, so a key may repeat."""
+    return [KeyValue(key=key, value=any_value(value)) for key, value in pairs]
+
+
+def resource(service: str) -> Resource:
+    return Resource(attributes=attributes(("service.name", service)))
+
+
+def span_export(*spans: Span, service: str = "app") -> ExportTraceServiceRequest:
+    scope_spans: ScopeSpans = ScopeSpans(scope=InstrumentationScope(name="scope", version="1.0"), spans=spans)
+    return ExportTraceServiceRequest(
+        resource_spans=[ResourceSpans(resource=resource(service), scope_spans=[scope_spans])]
+    )
+
+
+def span(
+    name: str,
+    *pairs: Any,
+    kind: int = Span.SPAN_KIND_SERVER,
+    span_id: bytes = b"",
+    trace_id: bytes = b"",
+    parent_span_id: bytes = b"",
+    flags: int = 0,
+    start_time_unix_nano: int = 1000,
+) -> Span:
+    return Span(
+        name=name,
+        kind=kind,
+        span_id=span_id,
+        trace_id=trace_id,
+        parent_span_id=parent_span_id,
+        flags=flags,
+        start_time_unix_nano=start_time_unix_nano,
+        end_time_unix_nano=start_time_unix_nano + 500,
+        attributes=attributes(*pairs),
+    )
+
+
+def metric_export(*metrics: Metric) -> ExportMetricsServiceRequest:
+    scope_metrics: ScopeMetrics = ScopeMetrics(scope=InstrumentationScope(name="meter"), metrics=metrics)
+    return ExportMetricsServiceRequest(
+        resource_metrics=[ResourceMetrics(resource=resource("app"), scope_metrics=[scope_metrics])]
+    )
+
+
+def log_export(*log_records: LogRecord) -> ExportLogsServiceRequest:
+    scope_logs: ScopeLogs = ScopeLogs(scope=InstrumentationScope(name="logger"), log_records=log_records)
+    return ExportLogsServiceRequest(resource_logs=[ResourceLogs(resource=resource("app"), scope_logs=[scope_logs])])
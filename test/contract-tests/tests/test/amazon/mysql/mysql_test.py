@@ -20,7 +20,6 @@ from opentelemetry.proto.metrics.v1.metrics_pb2 import ExponentialHistogramDataP
 from opentelemetry.proto.trace.v1.trace_pb2 import Span
 from opentelemetry.trace import StatusCode
 
-from testcontainers.mysql import MySqlContainer
 from typing_extensions import override
 
 from amazon.base.contract_test_base import NETWORK_NAME
@@ -34,23 +33,16 @@ from amazon.base.database_contract_test_base import (
     SPAN_KIND_LOCAL_ROOT,
     DatabaseContractTestBase,
 )
+from amazon.base.dependency_pool import MySqlDependency, dependency_pool
 
 
 class MySqlTest(DatabaseContractTestBase):
     @override
     @classmethod
     def set_up_dependency_container(cls) -> None:
-        cls.container = (
-            MySqlContainer(MYSQL_USER=DATABASE_USER, MYSQL_PASSWORD=DATABASE_PASSWORD, MYSQL_DATABASE=DATABASE_NAME)
-            .with_kwargs(network=NETWORK_NAME)
-            .with_name(DATABASE_HOST)
+        cls.database = dependency_pool().acquire(
+            MySqlDependency(NETWORK_NAME, DATABASE_HOST, DATABASE_USER, DATABASE_PASSWORD, DATABASE_NAME)
         )
-        cls.container.start()
-
-    @override
-    @classmethod
-    def tear_down_dependency_container(cls) -> None:
-        cls.container.stop()
 
     @override
     @staticmethod
@@ -90,9 +82,8 @@ class MySqlTest(DatabaseContractTestBase):
     def test_create_item_succeeds(self) -> None:
         self.assert_create_item_succeeds()
 
-    # Disabling due to flakiness
-    #def test_drop_database_succeeds(self) -> None:
-    #    self.assert_drop_table_succeeds()
+    def test_drop_table_succeeds(self) -> None:
+        self.assert_drop_table_succeeds()
 
     # Disabling due to flakiness
     #def test_fault(self) -> None:
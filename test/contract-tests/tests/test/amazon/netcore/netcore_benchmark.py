@@ -0,0 +1,180 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Per-request overhead of the distro on the AppSignals.NetCore endpoints that `netcore_test.py` asserts on.
+
+The application is started twice, without the distro and with it, and every endpoint gets the same sustained load at a
+fixed rate (see `load_generator`) after a warm-up. The report has, per mode and endpoint, the latency and service-time
+summaries, the achieved rate and the responses by status; `overhead_ms` is the latency delta between the modes. The
+throughput ceiling of each mode is measured on `/success` with a closed loop (`throughput_ceiling_delta_rps`).
+
+Exporters run at the SDK's default cadence (a 5 s batch delay, metrics every 60 s) rather than the contract tests'
+near-immediate one, so the numbers reflect a production configuration. Dropped spans are counted per endpoint in the
+instrumented run: the application is flushed through its `/test/flush` endpoint after the load, and every response
+without a server span at the mock collector counts as dropped.
+
+The resource usage of the application and the mock collector is sampled for the whole of each mode (see
+`resource_sampler`) and reported as `resource_usage`; the benchmark fails when the instrumented application exceeds a
+threshold of `benchmark_utils.resource_threshold_violations`, e.g. when its memory keeps growing under load.
+
+The report is written as `netcore_request_latency.json`; with `BENCHMARK_BASELINE_DIR` holding the report of an
+earlier run, `vs_baseline_ms` has the latency deltas against it. Tune with NETCORE_BENCHMARK_RPS (default 200),
+NETCORE_BENCHMARK_DURATION_SEC (30), NETCORE_BENCHMARK_WARMUP_SEC (5) and NETCORE_BENCHMARK_CONCURRENCY (32).
+
+Not collected by default; run with `pytest contract-tests/tests/test/amazon/netcore/netcore_benchmark.py`.
+"""
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, List, Optional, Tuple
+
+from mock_collector_query import attr, field, spans
+from typing_extensions import override
+
+from amazon.base.benchmark_base import BenchmarkBase
+from amazon.base.resource_sampler import sample_resources
+from amazon.utils.benchmark_utils import (
+    PRODUCTION_EXPORT_ENVIRONMENT,
+    UNINSTRUMENTED_ENVIRONMENT,
+    delta,
+    get_int_env,
+    load_baseline_report,
+    resource_threshold_violations,
+    summarize,
+    write_benchmark_report,
+)
+from amazon.utils.load_generator import LoadResult, run_closed_loop, run_fixed_rate
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+from opentelemetry.semconv.trace import SpanAttributes
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+_REPORT_NAME: str = "netcore_request_latency"
+# (method, route) of every endpoint of netcore_test.py.
+_ENDPOINTS: List[Tuple[str, str]] = [
+    ("GET", "/success"),
+    ("GET", "/error"),
+    ("GET", "/fault"),
+    ("POST", "/success/postmethod"),
+    ("POST", "/error/postmethod"),
+    ("POST", "/fault/postmethod"),
+]
+_MODES: Dict[str, Dict[str, str]] = {
+    "instrumentation_off": UNINSTRUMENTED_ENVIRONMENT,
+    "instrumentation_on": {},
+}
+
+
+class NetCoreLatencyBenchmark(BenchmarkBase):
+    """The application is launched once per mode."""
+
+    _mode_environment: Dict[str, str] = {}
+
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+        self.resource_usage = {}
+
+    @override
+    def get_application_image_name(self) -> str:
+        return "aws-application-signals-tests-appsignals.netcore-app"
+
+    @override
+    def get_application_wait_pattern(self) -> str:
+        return "Content root path: /app"
+
+    @override
+    def get_application_extra_environment_variables(self) -> Dict[str, str]:
+        return {**PRODUCTION_EXPORT_ENVIRONMENT, **self._mode_environment}
+
+    def test_request_latency_overhead(self) -> None:
+        rps: int = get_int_env("NETCORE_BENCHMARK_RPS", 200)
+        duration: int = get_int_env("NETCORE_BENCHMARK_DURATION_SEC", 30)
+        warmup: int = get_int_env("NETCORE_BENCHMARK_WARMUP_SEC", 5)
+        concurrency: int = get_int_env("NETCORE_BENCHMARK_CONCURRENCY", 32)
+
+        report: Dict[str, Any] = {
+            "rps": rps,
+            "duration_sec": duration,
+            "warmup_sec": warmup,
+            "concurrency": concurrency,
+            "launcher": type(self.application_launcher).__name__,
+        }
+        for mode, environment in _MODES.items():
+            instrumented: bool = mode != "instrumentation_off"
+            report[mode] = self._measure_mode(mode, environment, instrumented, rps, duration, warmup, concurrency)
+
+        on: Dict[str, Any] = report["instrumentation_on"]
+        off: Dict[str, Any] = report["instrumentation_off"]
+        report["overhead_ms"] = {
+            endpoint: delta(on[endpoint]["latency_ms"], off[endpoint]["latency_ms"]) for endpoint in on["endpoints"]
+        }
+        report["throughput_ceiling_delta_rps"] = on["throughput_ceiling_rps"] - off["throughput_ceiling_rps"]
+        baseline: Optional[Dict[str, Any]] = load_baseline_report(_REPORT_NAME)
+        if baseline is not None:
+            report["vs_baseline_ms"] = {
+                mode: {
+                    endpoint: delta(report[mode][endpoint]["latency_ms"], baseline[mode][endpoint]["latency_ms"])
+                    for endpoint in report[mode]["endpoints"]
+                    if endpoint in baseline.get(mode, {})
+                }
+                for mode in _MODES
+            }
+        write_benchmark_report(_REPORT_NAME, report)
+
+        for endpoint in on["endpoints"]:
+            self.assertEqual(0, on[endpoint]["transport_errors"], endpoint)
+        application_usage: Dict[str, Any] = on["resource_usage"].get("application", {})
+        self.assertEqual([], resource_threshold_violations(application_usage), "instrumented application")
+
+    def _measure_mode(
+        self,
+        mode: str,
+        environment: Dict[str, str],
+        instrumented: bool,
+        rps: int,
+        duration: int,
+        warmup: int,
+        concurrency: int,
+    ) -> Dict[str, Any]:
+        self._mode_environment = environment
+        with self.launched():
+            with sample_resources({"application": self.application, "mock_collector": self.mock_collector}) as usage:
+                results: Dict[str, Any] = {"endpoints": []}
+                for method, route in _ENDPOINTS:
+                    endpoint: str = f"{method} {route}"
+                    url: str = self._url(route)
+                    run_fixed_rate(method, url, rps, warmup, concurrency)
+                    if instrumented:
+                        self._flush()
+                    self.mock_collector_client.clear_signals()
+
+                    load: LoadResult = run_fixed_rate(method, url, rps, duration, concurrency)
+                    results["endpoints"].append(endpoint)
+                    results[endpoint] = {
+                        "latency_ms": summarize(load.latency_ms),
+                        "service_time_ms": summarize(load.service_time_ms),
+                        "achieved_rps": load.achieved_rps,
+                        "status_counts": {str(status): count for status, count in load.status_counts.items()},
+                        "transport_errors": load.transport_errors,
+                    }
+                    if instrumented:
+                        self._flush()
+                        results[endpoint]["dropped_spans"] = max(0, load.responses - self._server_spans(method, route))
+
+                ceiling: LoadResult = run_closed_loop("GET", self._url("/success"), duration, concurrency)
+                results["throughput_ceiling_rps"] = ceiling.achieved_rps
+                results["throughput_ceiling_latency_ms"] = summarize(ceiling.service_time_ms)
+            results["resource_usage"] = {target: series.summary() for target, series in usage.items()}
+            self.resource_usage.update({f"{mode}.{target}": series for target, series in usage.items()})
+            return results
+
+    def _server_spans(self, method: str, route: str) -> int:
+        # pylint: disable=no-member
+        count: int = self.mock_collector_client.query(
+            spans().where(
+                field("kind") == Span.SPAN_KIND_SERVER,
+                attr(SpanAttributes.HTTP_REQUEST_METHOD) == method,
+                attr(SpanAttributes.HTTP_ROUTE) == route,
+            )
+        )
+        return count
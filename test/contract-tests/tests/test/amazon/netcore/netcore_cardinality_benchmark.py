@@ -0,0 +1,160 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Cardinality stress of the Application Signals metrics of AppSignals.NetCore.
+
+`AwsSpanMetricsProcessor` records the `latency`, `error` and `fault` histograms per set of metric attributes, so every
+distinct route, remote operation and remote resource is a series of its own. The application has endpoints for each of
+these dimensions (see its `Program.cs`):
+
+- `routes`: `GET /cardinality/route<i>`, one route per value (the application registers `CARDINALITY_ROUTES` of them);
+- `remote_operations`: `GET /cardinality/remote/Operation<i>/bucket`, a client span shaped like an S3 call, one remote
+  operation per value;
+- `remote_resources`: `GET /cardinality/remote/GetObject/bucket-<i>`, the same span with one S3 bucket, and so one
+  remote resource identifier, per value.
+
+For every dimension and every level of CARDINALITY_BENCHMARK_LEVELS (default 10,100,1000,5000 distinct values), a fresh
+application gets CARDINALITY_BENCHMARK_REQUESTS_PER_VALUE (default 2) requests per value, spread evenly over the values
+at CARDINALITY_BENCHMARK_RPS (default 500). Metrics are exported once, when the application is flushed after the load,
+and the report has per dimension and level:
+
+- `latency_series`: the distinct attribute sets of the `latency` metric at the mock collector;
+- `overflow_points`: data points the SDK folded into its overflow series (`otel.metric.overflow`) once a metric
+  reached its cardinality limit, i.e. where attribution is lost;
+- `metric_export_bytes` and `metric_export_requests`: the size and number of the metric exports;
+- `resource_usage`: the application's CPU and memory over the load (see `resource_sampler`), with `rss_growth_mb`.
+
+The benchmark fails when a level exceeds a threshold of `benchmark_utils.resource_threshold_violations`. The report is
+written as `netcore_cardinality.json`.
+
+Not collected by default; run with `pytest contract-tests/tests/test/amazon/netcore/netcore_cardinality_benchmark.py`.
+"""
+from logging import INFO, Logger, getLogger
+from typing import Any, Callable, Dict, List, Optional
+
+from mock_collector_query import attr, field, metrics
+from requests import request
+from typing_extensions import override
+
+from amazon.base.benchmark_base import BenchmarkBase
+from amazon.base.resource_sampler import ResourceSeries, sample_resources
+from amazon.utils.application_signals_constants import (
+    AWS_LOCAL_OPERATION,
+    AWS_REMOTE_OPERATION,
+    AWS_REMOTE_RESOURCE_IDENTIFIER,
+    AWS_REMOTE_SERVICE,
+    AWS_SPAN_KIND,
+    LATENCY_METRIC,
+)
+from amazon.utils.benchmark_utils import (
+    PRODUCTION_EXPORT_ENVIRONMENT,
+    get_int_env,
+    get_int_list_env,
+    resource_threshold_violations,
+    summarize,
+    write_benchmark_report,
+)
+from amazon.utils.load_generator import LoadResult, run_fixed_rate
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+_REPORT_NAME: str = "netcore_cardinality"
+_ACTIVITY_SOURCE: str = "AppSignals.NetCore.Cardinality"
+_OVERFLOW_ATTRIBUTE: str = "otel.metric.overflow"
+# Path of the request for value `i` of each dimension.
+_DIMENSIONS: Dict[str, Callable[[int], str]] = {
+    "routes": lambda i: f"/cardinality/route{i}",
+    "remote_operations": lambda i: f"/cardinality/remote/Operation{i}/bucket",
+    "remote_resources": lambda i: f"/cardinality/remote/GetObject/bucket-{i}",
+}
+
+
+class NetCoreCardinalityBenchmark(BenchmarkBase):
+    """The application is launched once per level."""
+
+    _routes: int = 0
+
+    @override
+    def get_application_image_name(self) -> str:
+        return "aws-application-signals-tests-appsignals.netcore-app"
+
+    @override
+    def get_application_wait_pattern(self) -> str:
+        return "Content root path: /app"
+
+    @override
+    def get_application_extra_environment_variables(self) -> Dict[str, str]:
+        return {
+            **PRODUCTION_EXPORT_ENVIRONMENT,
+            "OTEL_DOTNET_AUTO_TRACES_ADDITIONAL_SOURCES": _ACTIVITY_SOURCE,
+            "CARDINALITY_ROUTES": str(self._routes),
+        }
+
+    def test_metric_cardinality(self) -> None:
+        levels: List[int] = get_int_list_env("CARDINALITY_BENCHMARK_LEVELS", [10, 100, 1000, 5000])
+        requests_per_value: int = get_int_env("CARDINALITY_BENCHMARK_REQUESTS_PER_VALUE", 2)
+        rps: int = get_int_env("CARDINALITY_BENCHMARK_RPS", 500)
+
+        report: Dict[str, Any] = {
+            "levels": levels,
+            "requests_per_value": requests_per_value,
+            "rps": rps,
+            "launcher": type(self.application_launcher).__name__,
+        }
+        violations: List[str] = []
+        for dimension, path in _DIMENSIONS.items():
+            report[dimension] = {}
+            for level in levels:
+                result: Dict[str, Any] = self._measure(dimension, path, level, requests_per_value, rps)
+                report[dimension][str(level)] = result
+                _logger.info("%s at %d: %d latency series", dimension, level, result["latency_series"])
+                violations.extend(
+                    f"{dimension} at {level}: {violation}"
+                    for violation in resource_threshold_violations(result["resource_usage"])
+                )
+        write_benchmark_report(_REPORT_NAME, report)
+
+        self.assertEqual([], violations)
+
+    def _measure(
+        self, dimension: str, path: Callable[[int], str], level: int, requests_per_value: int, rps: int
+    ) -> Dict[str, Any]:
+        self._routes = level if dimension == "routes" else 0
+        with self.launched():
+            base_url: str = self._url("")
+            urls: List[str] = [f"{base_url}{path(value)}" for value in range(level)]
+            # One request to a single value first: the application's first request pays for JIT and first exports.
+            request("GET", urls[0], timeout=30)
+            self._flush()
+            self.mock_collector_client.clear_signals()
+
+            with sample_resources({"application": self.application}) as usage_by_target:
+                load: LoadResult = run_fixed_rate("GET", urls, rps, level * requests_per_value / rps, min(64, level))
+            application_usage: Optional[ResourceSeries] = usage_by_target.get("application")
+            usage: Dict[str, Any] = application_usage.summary() if application_usage is not None else {}
+            self._flush()
+
+            series: Dict[Any, int] = self.mock_collector_client.query(
+                metrics()
+                .where(field("name") == LATENCY_METRIC)
+                .group_by(
+                    attr(AWS_SPAN_KIND),
+                    attr(AWS_LOCAL_OPERATION),
+                    attr(AWS_REMOTE_SERVICE),
+                    attr(AWS_REMOTE_OPERATION),
+                    attr(AWS_REMOTE_RESOURCE_IDENTIFIER),
+                )
+            )
+            overflow_points: int = self.mock_collector_client.query(metrics().where(attr(_OVERFLOW_ATTRIBUTE).exists()))
+            return {
+                "distinct_values": level,
+                "requests": load.responses,
+                "transport_errors": load.transport_errors,
+                "latency_ms": summarize(load.latency_ms),
+                "latency_series": len(series),
+                "overflow_points": overflow_points,
+                "metric_export_bytes": self.mock_collector_client.get_export_sizes()["metrics"],
+                "metric_export_requests": self.mock_collector_client.get_export_counts()["metrics"],
+                "resource_usage": usage,
+            }
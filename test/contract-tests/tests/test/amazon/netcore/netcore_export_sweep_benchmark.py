@@ -0,0 +1,150 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Sweep of the batch span processor and metric export settings of AppSignals.NetCore under one load profile.
+
+The contract tests export almost immediately (`OTEL_BSP_SCHEDULE_DELAY=1`, `OTEL_METRIC_EXPORT_INTERVAL=50`); this
+benchmark measures what the exporter settings cost and lose under load, to pick the settings to recommend for
+production. For every combination of
+
+- `OTEL_BSP_MAX_EXPORT_BATCH_SIZE`: SWEEP_BSP_MAX_EXPORT_BATCH_SIZES (default 128,512),
+- `OTEL_BSP_MAX_QUEUE_SIZE`: SWEEP_BSP_MAX_QUEUE_SIZES (default 2048,8192),
+- `OTEL_BSP_SCHEDULE_DELAY`: SWEEP_BSP_SCHEDULE_DELAYS_MS (default 1,1000,5000),
+- `OTEL_METRIC_EXPORT_INTERVAL`: SWEEP_METRIC_EXPORT_INTERVALS_MS (default 1000,60000),
+
+a fresh application gets a warm-up and then `GET /success` at SWEEP_RPS (default 500) for SWEEP_DURATION_SEC (20) from
+SWEEP_CONCURRENCY (64) threads, every request tagged with an id (see `telemetry_loss`). Combinations with a batch larger
+than the queue are skipped; the SDK rejects them. After the load the application is flushed through `/test/flush`, and
+the row of the combination has the request latency, the CPU and peak memory of the application over the load (see
+`resource_sampler`), the export requests the mock collector received, and the loss of server spans and of `latency`
+histogram counts.
+
+The rows are written as the table `netcore_export_sweep.csv` and, with the load profile, as the report
+`netcore_export_sweep.json`.
+
+Not collected by default; run with `pytest contract-tests/tests/test/amazon/netcore/netcore_export_sweep_benchmark.py`.
+"""
+import itertools
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, List, Optional, Set
+
+from typing_extensions import override
+
+from amazon.base.benchmark_base import BenchmarkBase
+from amazon.base.resource_sampler import ResourceSeries, sample_resources
+from amazon.utils.benchmark_utils import (
+    get_int_env,
+    get_int_list_env,
+    summarize,
+    write_benchmark_report,
+    write_benchmark_table,
+)
+from amazon.utils.load_generator import LoadResult, run_fixed_rate
+from amazon.utils.telemetry_loss import (
+    REQUEST_ID_CAPTURE_ENVIRONMENT,
+    REQUEST_ID_HEADER,
+    latency_metric_count,
+    reconcile_spans,
+    reconcile_total,
+)
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+_REPORT_NAME: str = "netcore_export_sweep"
+_ROUTE: str = "/success"
+_OPERATION: str = "GET /success"
+# Environment variable of each swept setting, and the environment variable and default values of its sweep.
+_GRID: Dict[str, Any] = {
+    "OTEL_BSP_MAX_EXPORT_BATCH_SIZE": ("SWEEP_BSP_MAX_EXPORT_BATCH_SIZES", [128, 512]),
+    "OTEL_BSP_MAX_QUEUE_SIZE": ("SWEEP_BSP_MAX_QUEUE_SIZES", [2048, 8192]),
+    "OTEL_BSP_SCHEDULE_DELAY": ("SWEEP_BSP_SCHEDULE_DELAYS_MS", [1, 1000, 5000]),
+    "OTEL_METRIC_EXPORT_INTERVAL": ("SWEEP_METRIC_EXPORT_INTERVALS_MS", [1000, 60000]),
+}
+
+
+class NetCoreExportSweepBenchmark(BenchmarkBase):
+    """The application is launched once per combination."""
+
+    _settings: Dict[str, str] = {}
+
+    @override
+    def get_application_image_name(self) -> str:
+        return "aws-application-signals-tests-appsignals.netcore-app"
+
+    @override
+    def get_application_wait_pattern(self) -> str:
+        return "Content root path: /app"
+
+    @override
+    def get_application_extra_environment_variables(self) -> Dict[str, str]:
+        return {**REQUEST_ID_CAPTURE_ENVIRONMENT, **self._settings}
+
+    def test_export_settings_sweep(self) -> None:
+        rps: int = get_int_env("SWEEP_RPS", 500)
+        duration: int = get_int_env("SWEEP_DURATION_SEC", 20)
+        warmup: int = get_int_env("SWEEP_WARMUP_SEC", 5)
+        concurrency: int = get_int_env("SWEEP_CONCURRENCY", 64)
+        grid: Dict[str, List[int]] = {
+            setting: get_int_list_env(env, default) for setting, (env, default) in _GRID.items()
+        }
+
+        rows: List[Dict[str, Any]] = []
+        for values in itertools.product(*grid.values()):
+            settings: Dict[str, int] = dict(zip(grid, values))
+            if settings["OTEL_BSP_MAX_EXPORT_BATCH_SIZE"] > settings["OTEL_BSP_MAX_QUEUE_SIZE"]:
+                continue
+            row: Dict[str, Any] = dict(settings)
+            row.update(self._measure(settings, rps, duration, warmup, concurrency))
+            _logger.info("%s", row)
+            rows.append(row)
+
+        write_benchmark_table(_REPORT_NAME, rows)
+        write_benchmark_report(
+            _REPORT_NAME,
+            {
+                "rps": rps,
+                "duration_sec": duration,
+                "warmup_sec": warmup,
+                "concurrency": concurrency,
+                "launcher": type(self.application_launcher).__name__,
+                "grid": grid,
+                "rows": rows,
+            },
+        )
+
+    def _measure(
+        self, settings: Dict[str, int], rps: int, duration: int, warmup: int, concurrency: int
+    ) -> Dict[str, Any]:
+        self._settings = {setting: str(value) for setting, value in settings.items()}
+        with self.launched():
+            url: str = self._url(_ROUTE)
+            run_fixed_rate("GET", url, rps, warmup, concurrency)
+            self._flush()
+            self.mock_collector_client.clear_signals()
+
+            with sample_resources({"application": self.application}) as usage_by_target:
+                load: LoadResult = run_fixed_rate("GET", url, rps, duration, concurrency, id_header=REQUEST_ID_HEADER)
+            application_usage: Optional[ResourceSeries] = usage_by_target.get("application")
+            usage: Dict[str, Any] = application_usage.summary() if application_usage is not None else {}
+            self._flush()
+
+            answered: Set[str] = set(load.answered_request_ids)
+            exports: Dict[str, int] = self.mock_collector_client.get_export_counts()
+            latency_ms: Dict[str, float] = summarize(load.latency_ms)
+            return {
+                "achieved_rps": load.achieved_rps,
+                "latency_p50_ms": latency_ms["p50"],
+                "latency_p99_ms": latency_ms["p99"],
+                "cpu_mean_percent": usage["cpu_percent"]["mean"] if usage.get("samples") else None,
+                "rss_max_mb": usage["rss_mb"]["max"] if usage.get("samples") else None,
+                "trace_export_requests": exports["traces"],
+                "metric_export_requests": exports["metrics"],
+                "span_loss_rate": reconcile_spans(
+                    self.mock_collector_client, answered, settings["OTEL_BSP_SCHEDULE_DELAY"]
+                )["loss_rate"],
+                "latency_metric_loss_rate": reconcile_total(
+                    latency_metric_count(self.mock_collector_client, _OPERATION), len(answered)
+                )["loss_rate"],
+                "transport_errors": load.transport_errors,
+            }
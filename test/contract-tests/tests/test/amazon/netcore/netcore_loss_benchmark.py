@@ -0,0 +1,168 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Telemetry loss of the distro under load: requests answered by AppSignals.NetCore versus what reached the collector.
+
+At every load level of LOSS_BENCHMARK_RPS_LEVELS (default 100,500,1000 requests per second), LOSS_BENCHMARK_REQUESTS
+(default 5000) `GET /success` requests are sent at that fixed rate, each with a unique id in the `X-Load-Request-Id`
+header, which the ASP.NET Core instrumentation records on the server span (see `telemetry_loss`). After the load the
+application is flushed through its `/test/flush` endpoint, and three signals are reconciled with the requests that were
+answered:
+
+- `spans`: the server spans, matched by request id, so `missing`, `duplicates` and `unknown` (ids that were never
+  answered) are exact;
+- `latency_metric`: the total count of the Application Signals `latency` histogram of the operation;
+- `service_events_request_count`: the total `aws.service_events.request.count` of the operation's EndpointSummary
+  records.
+
+The metrics carry no request id, so for them `missing` is the difference of the totals (negative when more was counted
+than answered). `loss_rate` is `missing` over the answered requests. `correlation` is the `CorrelationCompleteness` of
+everything the collector holds after the level: the share of log records and metric exemplars with trace context whose
+span was captured. Exporters run at the SDK's default cadence (see `benchmark_utils.PRODUCTION_EXPORT_ENVIRONMENT`), so
+the batch span processor's queue limits apply as in production.
+Unsampled spans are only exported over UDP to the X-Ray daemon (in Lambda and for adaptive sampling), which the mock
+collector does not receive, so they are not accounted for here.
+
+The report is written as `netcore_telemetry_loss.json`. With LOSS_BENCHMARK_MAX_LOSS_RATE set (e.g. 0.001), the
+benchmark fails when any signal loses more than that at any level. Tune with LOSS_BENCHMARK_WARMUP_SEC (default 5) and
+LOSS_BENCHMARK_CONCURRENCY (64).
+
+Not collected by default; run with `pytest contract-tests/tests/test/amazon/netcore/netcore_loss_benchmark.py`.
+"""
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, List, Optional, Set
+
+from mock_collector_client import MockCollectorClient
+from mock_collector_correlation_index import CorrelationIndex
+from mock_collector_query import attr, logs
+from typing_extensions import override
+
+from amazon.base.benchmark_base import BenchmarkBase
+from amazon.base.shared_mock_collector import MockCollectorHandle
+from amazon.utils.benchmark_utils import (
+    PRODUCTION_EXPORT_ENVIRONMENT,
+    get_float_env,
+    get_int_env,
+    get_int_list_env,
+    summarize,
+    write_benchmark_report,
+)
+from amazon.utils.load_generator import LoadResult, run_fixed_rate
+from amazon.utils.telemetry_loss import (
+    REQUEST_ID_CAPTURE_ENVIRONMENT,
+    REQUEST_ID_HEADER,
+    latency_metric_count,
+    reconcile_spans,
+    reconcile_total,
+)
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+RPS_LEVELS_ENV: str = "LOSS_BENCHMARK_RPS_LEVELS"
+MAX_LOSS_RATE_ENV: str = "LOSS_BENCHMARK_MAX_LOSS_RATE"
+
+_REPORT_NAME: str = "netcore_telemetry_loss"
+_ROUTE: str = "/success"
+_OPERATION: str = "GET /success"
+_ENDPOINT_SUMMARY_EVENT: str = "aws.service_events.endpoint_summary"
+_DEFAULT_RPS_LEVELS: List[int] = [100, 500, 1000]
+
+
+class NetCoreLossBenchmark(BenchmarkBase):
+    """One application serves every load level."""
+
+    @override
+    def get_application_image_name(self) -> str:
+        return "aws-application-signals-tests-appsignals.netcore-app"
+
+    @override
+    def get_application_wait_pattern(self) -> str:
+        return "Content root path: /app"
+
+    @override
+    def get_application_extra_environment_variables(self) -> Dict[str, str]:
+        handle: MockCollectorHandle = self.mock_collector_handle
+        collector_http_endpoint: str = f"http://{handle.endpoint_host}:{handle.endpoint_http_port}"
+        return {
+            **PRODUCTION_EXPORT_ENVIRONMENT,
+            **REQUEST_ID_CAPTURE_ENVIRONMENT,
+            "OTEL_AWS_SERVICE_EVENTS_ENABLED": "true",
+            "OTEL_AWS_OTLP_LOGS_ENDPOINT": f"{collector_http_endpoint}/v1/logs",
+            "OTEL_AWS_OTLP_METRICS_ENDPOINT": f"{collector_http_endpoint}/v1/metrics",
+        }
+
+    def test_telemetry_loss(self) -> None:
+        levels: List[int] = get_int_list_env(RPS_LEVELS_ENV, _DEFAULT_RPS_LEVELS)
+        request_count: int = get_int_env("LOSS_BENCHMARK_REQUESTS", 5000)
+        warmup: int = get_int_env("LOSS_BENCHMARK_WARMUP_SEC", 5)
+        concurrency: int = get_int_env("LOSS_BENCHMARK_CONCURRENCY", 64)
+
+        report: Dict[str, Any] = {
+            "requests_per_level": request_count,
+            "warmup_sec": warmup,
+            "concurrency": concurrency,
+            "launcher": type(self.application_launcher).__name__,
+            "levels": levels,
+        }
+        with self.launched():
+            run_fixed_rate("GET", self._url(_ROUTE), levels[0], warmup, concurrency)
+            self._flush()
+            self.mock_collector_client.clear_signals()
+            for rps in levels:
+                report[str(rps)] = self._measure_level(rps, request_count, concurrency)
+        write_benchmark_report(_REPORT_NAME, report)
+
+        max_loss_rate: Optional[float] = get_float_env(MAX_LOSS_RATE_ENV)
+        if max_loss_rate is not None:
+            for rps in levels:
+                for signal in ("spans", "latency_metric", "service_events_request_count"):
+                    loss_rate: float = report[str(rps)][signal]["loss_rate"]
+                    self.assertLessEqual(loss_rate, max_loss_rate, f"{signal} at {rps} requests per second")
+
+    def _measure_level(self, rps: int, request_count: int, concurrency: int) -> Dict[str, Any]:
+        load: LoadResult = run_fixed_rate(
+            "GET", self._url(_ROUTE), rps, request_count / rps, concurrency, id_header=REQUEST_ID_HEADER
+        )
+        self._flush()
+        answered: Set[str] = set(load.answered_request_ids)
+        latency_count: int = latency_metric_count(self.mock_collector_client, _OPERATION)
+        service_events_count: int = int(
+            self.mock_collector_client.query(
+                logs().where(
+                    attr("event.name") == _ENDPOINT_SUMMARY_EVENT,
+                    attr("aws.service_events.operation") == _OPERATION,
+                ),
+                sum_column=attr("aws.service_events.request.count"),
+            )
+        )
+        result: Dict[str, Any] = {
+            "sent": load.responses + load.transport_errors,
+            "answered": len(answered),
+            "transport_errors": load.transport_errors,
+            "status_counts": {str(status): count for status, count in load.status_counts.items()},
+            "achieved_rps": load.achieved_rps,
+            "latency_ms": summarize(load.latency_ms),
+            "spans": reconcile_spans(
+                self.mock_collector_client, answered, int(PRODUCTION_EXPORT_ENVIRONMENT["OTEL_BSP_SCHEDULE_DELAY"])
+            ),
+            "latency_metric": reconcile_total(latency_count, len(answered)),
+            "service_events_request_count": reconcile_total(service_events_count, len(answered)),
+            # After `reconcile_spans`, which waits for the spans.
+            "correlation": self._correlation_completeness(),
+        }
+        _logger.info(
+            "%d rps: %d answered, span loss %.4f, latency loss %.4f, ServiceEvents loss %.4f",
+            rps,
+            len(answered),
+            result["spans"]["loss_rate"],
+            result["latency_metric"]["loss_rate"],
+            result["service_events_request_count"]["loss_rate"],
+        )
+        self.mock_collector_client.clear_signals()
+        return result
+
+    def _correlation_completeness(self) -> Dict[str, float]:
+        client: MockCollectorClient = self.mock_collector_client
+        index: CorrelationIndex = CorrelationIndex(client.peek_traces(), client.peek_logs(), client.peek_metrics())
+        return index.completeness().to_report()
@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import Dict, List
 
-from mock_collector_client import ResourceScopeMetric, ResourceScopeSpan
+from mock_collector_client import ResourceScopeMetric, ResourceScopeSpan, span_of_kind
+from mock_collector_trace_index import SpanNode, TraceIndex
 from typing_extensions import override
 
 from amazon.base.contract_test_base import ContractTestBase
@@ -44,14 +45,14 @@ class NetCoreTest(ContractTestBase):
 
     @override
     def _assert_aws_span_attributes(self, resource_scope_spans: List[ResourceScopeSpan], path: str, **kwargs) -> None:
-        target_spans: List[Span] = []
-        for resource_scope_span in resource_scope_spans:
-            # pylint: disable=no-member
-            if resource_scope_span.span.kind == Span.SPAN_KIND_SERVER:
-                target_spans.append(resource_scope_span.span)
+        # pylint: disable=no-member
+        target_spans: List[SpanNode] = TraceIndex(resource_scope_spans).find(span_of_kind(Span.SPAN_KIND_SERVER))
 
         self.assertEqual(len(target_spans), 1)
-        self._assert_aws_attributes(target_spans[0].attributes, kwargs.get("request_method"), kwargs.get("local_operation"))
+        # The request comes from the test without trace context, so the server span must start the trace.
+        self.assertIsNone(target_spans[0].parent)
+        self.assertTrue(target_spans[0].is_local_root)
+        self._assert_aws_attributes(target_spans[0].span.attributes, kwargs.get("request_method"), kwargs.get("local_operation"))
 
     def _assert_aws_attributes(self, attributes_list: List[KeyValue], method: str, local_operation: str) -> None:
         attributes_dict: Dict[str, AnyValue] = self._get_attributes_dict(attributes_list)
@@ -0,0 +1,82 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""ServiceEvents contract tests for the OTEL_AWS_SERVICE_EVENTS_OUTPUT_FILE path.
+
+Same app and configuration as dotnet_test.py, but ServiceEvents writes NDJSON
+to a bind-mounted file instead of exporting OTLP. The file is tailed into the
+same ResourceScopeLogRecord / ResourceScopeMetric model as the OTLP path, so
+the OTLP assertion helpers double as the parity check between the two paths.
+The per-flush byte counts are reported by serviceevents_file_output_benchmark.py.
+"""
+import os
+
+from typing_extensions import override
+
+from amazon.serviceevents.serviceevents_contract_test_base import (
+    EXCEPTION_TYPE,
+    ServiceEventsTestInfrastructure,
+)
+
+
+class DotnetServiceEventsFileOutputTest(ServiceEventsTestInfrastructure):
+
+    @override
+    @staticmethod
+    def get_application_image_name() -> str:
+        return "aws-application-signals-tests-serviceevents.netcore-app"
+
+    @override
+    def is_output_file_enabled(self) -> bool:
+        return True
+
+    def test_file_endpoint_summary_success(self) -> None:
+        for _ in range(3):
+            self.assertEqual(200, self.send_request("GET", "success").status_code)
+        logs = [
+            log
+            for log in self.wait_for_file_logs("aws.service_events.endpoint_summary")
+            if self.attrs(log).get("url.route") == "/success"
+        ]
+        self.assertGreater(len(logs), 0, "Expected an EndpointSummary line for GET /success")
+        total_count = sum(self.attrs(log).get("aws.service_events.request.count", 0) for log in logs)
+        self.assertGreaterEqual(total_count, 3)
+        self.assert_endpoint_summary(logs[0], method="GET", route="/success", operation="GET /success")
+        self.assert_duration_structure(self.body(logs[0])["duration"])
+        resource_attrs = self.resource_attrs(logs[0])
+        self.assertEqual(resource_attrs.get("service.name"), self.get_application_otel_service_name())
+        self.assertEqual(resource_attrs.get("deployment.environment.name"), "test")
+
+    def test_file_deployment_event(self) -> None:
+        self.send_request("GET", "success")
+        logs = self.wait_for_file_logs("aws.service_events.deployment_event")
+        triggers = [self.attrs(log).get("aws.service_events.deployment.trigger") for log in logs]
+        self.assertIn("startup", triggers, "Expected a DeploymentEvent with trigger='startup'")
+
+    def test_file_endpoint_error_metric(self) -> None:
+        for _ in range(2):
+            self.send_request("GET", "exception")
+        metrics = self.wait_for_file_metric("count")
+        data_points = [
+            dp for rsm in metrics if rsm.metric.WhichOneof("data") == "sum" for dp in rsm.metric.sum.data_points
+        ]
+        matching = [
+            dp
+            for dp in data_points
+            if self.dp_attrs(dp).get("operation") == "GET /exception"
+            and self.dp_attrs(dp).get("exception") == EXCEPTION_TYPE
+        ]
+        self.assertGreater(len(matching), 0, f"Expected `count` dp for GET /exception / {EXCEPTION_TYPE}")
+        self.assertEqual(self.dp_attrs(matching[0]).get("Telemetry.Source"), "ServiceEvents")
+        self.assertEqual(metrics[0].scope_metrics.scope.name, "serviceevents")
+
+    def test_file_flush_accounting(self) -> None:
+        """Every byte the exporters appended is read exactly once and parses as a ServiceEvents line."""
+        for _ in range(5):
+            self.send_request("GET", "success")
+        self.wait_for_file_logs("aws.service_events.endpoint_summary")
+        self.file_tailer.stop()
+
+        flushes = self.file_tailer.flushes
+        self.assertEqual([], self.file_tailer.parse_errors)
+        self.assertEqual(os.path.getsize(self.file_tailer.host_path), self.file_tailer.bytes_read)
+        self.assertEqual(self.file_tailer.bytes_read, sum(flush.byte_count for flush in flushes))
@@ -0,0 +1,214 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Cardinality and flush cost of the ServiceEvents `EndpointMetricCollector` in ServiceEvents.NetCore.
+
+The collector keeps one aggregation per endpoint (method and route template) in a map it swaps on every flush; each
+aggregation has a latency histogram behind a lock and a nested exception breakdown. With `BENCHMARK_ROUTES` set the
+application registers that many routes (`GET /benchmark/route<i>`); `?exception=<k>` makes a route throw the k-th of the
+concrete exception types of `System.Private.CoreLib` (see its `Program.cs`). The periodic endpoint flush is turned off,
+so every flush below drains exactly the window of one scenario. Scenarios, all in one application:
+
+- `routes`: at every level of SERVICE_EVENTS_BENCHMARK_ROUTE_LEVELS (default 10,100,1000), load spread evenly over that
+  many routes, one aggregation each;
+- `exceptions`: at every level of SERVICE_EVENTS_BENCHMARK_EXCEPTION_LEVELS (default 10,50,100, capped at the number of
+  exception types the application has), faults on a single route, one exception breakdown entry per type;
+- `hot_endpoint`: the request count and rate of the largest `routes` level, all on one route, so every request takes
+  the same histogram lock. `hot_vs_spread_latency_ms` and `hot_vs_spread_server_duration_us` compare it with that
+  level: a contended lock shows as a higher latency of the hot endpoint.
+
+Each scenario sends SERVICE_EVENTS_BENCHMARK_REQUESTS_PER_VALUE (default 5) requests per distinct value at
+SERVICE_EVENTS_BENCHMARK_RPS (500) from SERVICE_EVENTS_BENCHMARK_CONCURRENCY (64) threads, then flushes the application
+through `/test/flush` and reports:
+
+- `latency_ms`: the request latency seen by the load generator, and `server_duration_us`, the mean and maximum duration
+  of the flushed EndpointSummary records of the scenario's routes;
+- `flush_ms`: how long the flush took, which includes exporting its logs and metrics, and `baseline_flush_ms`, the
+  next flush, whose window only holds the request that read the heap;
+- `endpoint_summaries`, `summary_request_count` and `log_export_bytes`/`log_export_requests`: the EndpointSummary
+  records, the requests they count and the log exports of the flush, with `log_bytes_per_value`;
+  `metric_export_bytes` covers the EndpointErrorMetrics of the flush;
+- `retained_heap_bytes_per_value`: the live managed heap (after a full collection) before the flush minus after it,
+  over the distinct values, i.e. what one aggregation or breakdown entry costs until it is flushed;
+- `resource_usage`: the application's CPU and memory during the load (see `resource_sampler`).
+
+The benchmark fails when a scenario exceeds a threshold of `benchmark_utils.resource_threshold_violations`. The report
+is written as `serviceevents_endpoint_collector.json`.
+
+Not collected by default; run with
+`pytest contract-tests/tests/test/amazon/serviceevents/serviceevents_benchmark.py`.
+"""
+import time
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, List, Optional
+
+from requests import Response
+from typing_extensions import override
+
+from amazon.base.resource_sampler import ResourceSampler, ResourceSeries, start_resource_sampler
+from amazon.serviceevents.serviceevents_contract_test_base import ServiceEventsTestInfrastructure
+from amazon.utils.benchmark_utils import (
+    delta,
+    get_int_env,
+    get_int_list_env,
+    resource_threshold_violations,
+    summarize,
+    write_benchmark_report,
+)
+from amazon.utils.load_generator import LoadResult, run_fixed_rate
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+ROUTE_LEVELS_ENV: str = "SERVICE_EVENTS_BENCHMARK_ROUTE_LEVELS"
+
+_REPORT_NAME: str = "serviceevents_endpoint_collector"
+_ENDPOINT_SUMMARY_EVENT: str = "aws.service_events.endpoint_summary"
+_ROUTE_PREFIX: str = "/benchmark/route"
+_DEFAULT_ROUTE_LEVELS: List[int] = [10, 100, 1000]
+# An hour: longer than any run, so only the benchmark's own flushes drain the collector.
+_NO_PERIODIC_FLUSH_MS: str = "3600000"
+
+
+class ServiceEventsEndpointBenchmark(ServiceEventsTestInfrastructure):
+    """Reuses the application and mock collector set-up of ServiceEventsTestInfrastructure; one application serves
+    every scenario."""
+
+    _rps: int = 0
+    _concurrency: int = 0
+
+    @override
+    @staticmethod
+    def get_application_image_name() -> str:
+        return "aws-application-signals-tests-serviceevents.netcore-app"
+
+    @override
+    def get_application_extra_environment_variables(self) -> Dict[str, str]:
+        return {
+            "BENCHMARK_ROUTES": str(max(get_int_list_env(ROUTE_LEVELS_ENV, _DEFAULT_ROUTE_LEVELS))),
+            "OTEL_AWS_SERVICE_EVENTS_ENDPOINT_FLUSH_INTERVAL": _NO_PERIODIC_FLUSH_MS,
+        }
+
+    def test_endpoint_collector_cardinality(self) -> None:
+        route_levels: List[int] = get_int_list_env(ROUTE_LEVELS_ENV, _DEFAULT_ROUTE_LEVELS)
+        exception_levels: List[int] = get_int_list_env("SERVICE_EVENTS_BENCHMARK_EXCEPTION_LEVELS", [10, 50, 100])
+        requests_per_value: int = get_int_env("SERVICE_EVENTS_BENCHMARK_REQUESTS_PER_VALUE", 5)
+        self._rps = get_int_env("SERVICE_EVENTS_BENCHMARK_RPS", 500)
+        self._concurrency = get_int_env("SERVICE_EVENTS_BENCHMARK_CONCURRENCY", 64)
+
+        exception_types: int = self.send_request("GET", "benchmark/exception-types").json()
+        # The first requests pay for JIT and the first exports.
+        self.send_request("GET", f"{_ROUTE_PREFIX.lstrip('/')}0")
+        self.send_request("GET", f"{_ROUTE_PREFIX.lstrip('/')}0?exception=0")
+        self._timed_flush()
+        self.mock_collector_client.clear_signals()
+
+        report: Dict[str, Any] = {
+            "requests_per_value": requests_per_value,
+            "rps": self._rps,
+            "concurrency": self._concurrency,
+            "exception_types": exception_types,
+            "routes": {},
+            "exceptions": {},
+        }
+        for level in route_levels:
+            urls: List[str] = [self._url(f"{_ROUTE_PREFIX}{i}") for i in range(level)]
+            report["routes"][str(level)] = self._measure(urls, level * requests_per_value)
+        for level in sorted({min(level, exception_types) for level in exception_levels}):
+            urls = [self._url(f"{_ROUTE_PREFIX}0?exception={k}") for k in range(level)]
+            report["exceptions"][str(level)] = self._measure(urls, level * requests_per_value)
+
+        spread: Dict[str, Any] = report["routes"][str(max(route_levels))]
+        hot: Dict[str, Any] = self._measure([self._url(f"{_ROUTE_PREFIX}0")], max(route_levels) * requests_per_value)
+        report["hot_endpoint"] = hot
+        report["hot_vs_spread_latency_ms"] = delta(hot["latency_ms"], spread["latency_ms"])
+        report["hot_vs_spread_server_duration_us"] = delta(hot["server_duration_us"], spread["server_duration_us"])
+        write_benchmark_report(_REPORT_NAME, report)
+
+        violations: List[str] = []
+        for scenario in ("routes", "exceptions"):
+            for level, result in report[scenario].items():
+                violations.extend(
+                    f"{scenario} at {level}: {violation}"
+                    for violation in resource_threshold_violations(result["resource_usage"])
+                )
+        violations.extend(
+            f"hot_endpoint: {violation}" for violation in resource_threshold_violations(hot["resource_usage"])
+        )
+        self.assertEqual([], violations)
+
+    def _measure(self, urls: List[str], request_count: int) -> Dict[str, Any]:
+        sampler: Optional[ResourceSampler] = start_resource_sampler({"application": self.application})
+        try:
+            load: LoadResult = run_fixed_rate("GET", urls, self._rps, request_count / self._rps, self._concurrency)
+        finally:
+            usage_by_target: Dict[str, ResourceSeries] = sampler.stop() if sampler is not None else {}
+        application_usage: Optional[ResourceSeries] = usage_by_target.get("application")
+        usage: Dict[str, Any] = application_usage.summary() if application_usage is not None else {}
+
+        heap_before: int = self._managed_heap_bytes()
+        flush_ms: float = self._timed_flush()
+        summaries: List = [
+            log
+            for log in self.get_otlp_logs_by_event_name(_ENDPOINT_SUMMARY_EVENT)
+            if str(self.attrs(log).get("url.route", "")).startswith(_ROUTE_PREFIX)
+        ]
+        export_sizes: Dict[str, int] = self.mock_collector_client.get_export_sizes()
+        export_counts: Dict[str, int] = self.mock_collector_client.get_export_counts()
+        heap_after: int = self._managed_heap_bytes()
+        baseline_flush_ms: float = self._timed_flush()
+        self.mock_collector_client.clear_signals()
+
+        distinct_values: int = len(urls)
+        durations: List[Dict[str, Any]] = [self.body(log)["duration"] for log in summaries]
+        duration_count: int = sum(duration["Count"] for duration in durations)
+        result: Dict[str, Any] = {
+            "distinct_values": distinct_values,
+            "requests": load.responses,
+            "transport_errors": load.transport_errors,
+            "status_counts": {str(status): count for status, count in load.status_counts.items()},
+            "latency_ms": summarize(load.latency_ms),
+            "server_duration_us": {
+                "mean": sum(duration["Sum"] for duration in durations) / duration_count if duration_count else 0.0,
+                "max": max((duration["Max"] for duration in durations), default=0.0),
+            },
+            "flush_ms": flush_ms,
+            "baseline_flush_ms": baseline_flush_ms,
+            "endpoint_summaries": len(summaries),
+            "summary_request_count": sum(
+                int(self.attrs(log).get("aws.service_events.request.count", 0)) for log in summaries
+            ),
+            "log_export_bytes": export_sizes["logs"],
+            "log_export_requests": export_counts["logs"],
+            "log_bytes_per_value": export_sizes["logs"] / distinct_values,
+            "metric_export_bytes": export_sizes["metrics"],
+            "retained_heap_bytes_per_value": (heap_before - heap_after) / distinct_values,
+            "resource_usage": usage,
+        }
+        _logger.info(
+            "%d values: flush %.1f ms, %d summaries, %d log bytes, %.0f heap bytes per value",
+            distinct_values,
+            flush_ms,
+            result["endpoint_summaries"],
+            result["log_export_bytes"],
+            result["retained_heap_bytes_per_value"],
+        )
+        return result
+
+    def _url(self, route: str) -> str:
+        address: str = self.application.get_container_host_ip()
+        port: str = self.application.get_exposed_port(self.get_application_port())
+        return f"http://{address}:{port}{route}"
+
+    def _managed_heap_bytes(self) -> int:
+        response: Response = self.send_request("GET", "benchmark/memory")
+        self.assertEqual(200, response.status_code)
+        return int(response.json())
+
+    def _timed_flush(self) -> float:
+        """Milliseconds the application took to answer a flush."""
+        start: float = time.monotonic()
+        response: Response = self.send_request("POST", "test/flush")
+        elapsed_ms: float = (time.monotonic() - start) * 1000
+        self.assertEqual(200, response.status_code, "the distro did not flush")
+        return elapsed_ms
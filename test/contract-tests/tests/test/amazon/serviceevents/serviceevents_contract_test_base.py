@@ -23,29 +23,47 @@ SDKs, adapted for .NET:
 Signals are asserted off the mock collector over OTLP (the .NET repo's mock
 collector, extended with a GetLogs RPC + an OTLP/HTTP receiver on port 4316).
 """
+import os
+import shutil
+import tempfile
 import time
 import uuid
 from logging import INFO, Logger, getLogger
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from unittest import TestCase
 
-from docker import DockerClient
-from docker.models.networks import Network, NetworkCollection
 from docker.types import EndpointConfig
 from mock_collector_client import MockCollectorClient
-from requests import Response, request
+from mock_collector_wait import AdaptiveBackoffWait, WaitTimeoutError, WaitTiming
+from requests import RequestException, Response, request
 from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
 
+from amazon.base.application_launcher import LAUNCHER_ENV, is_native_launch_enabled
+from amazon.base.parallel_execution import ContainerLease, container_slots
+from amazon.base.resource_sampler import ResourceSampler, ResourceSeries, start_resource_sampler
+from amazon.base.shared_mock_collector import (
+    MOCK_COLLECTOR_ALIAS,
+    MockCollectorHandle,
+    is_shared_collector_enabled,
+    shared_mock_collector,
+    start_mock_collector,
+)
+from amazon.serviceevents.serviceevents_file_tailer import ServiceEventsFileTailer
+
 _logger: Logger = getLogger(__name__)
 _logger.setLevel(INFO)
 
 SERVICE_EVENTS_FLUSH_INTERVAL_MS: str = "2000"
 OTLP_POLL_TIMEOUT: float = 30.0
-OTLP_POLL_INTERVAL: float = 1.0
+# Polls start fast so telemetry that is already exported is seen right away, then back off to half the flush
+# interval so a poll still lands soon after every flush.
+OTLP_INITIAL_POLL_INTERVAL: float = 0.05
+OTLP_POLL_INTERVAL: float = int(SERVICE_EVENTS_FLUSH_INTERVAL_MS) / 1000 / 2
 # The ServiceEvents dedicated MeterProvider flushes on a fixed 60s PeriodicExportingMetricReader
 # cadence (it does not honor OTEL_METRIC_EXPORT_INTERVAL), so metric polls must wait past one full
-# flush window. Matches the Java serviceevents suite, which polls ~90s for the same reason.
+# flush window. Matches the Java serviceevents suite, which polls ~90s for the same reason. With the app's
+# flush endpoint (see force_flush) metrics arrive on the first poll; the timeout only bounds the fallback.
 METRIC_POLL_TIMEOUT: float = 90.0
 
 # Global latency threshold (ms). /slow (sleeps ~6s) exceeds it; /slow-success
@@ -61,13 +79,17 @@ LATENCY_THRESHOLDS: str = "GET /slow-success:500,bad-entry:notanumber"
 EXCEPTION_TYPE: str = "System.InvalidOperationException"  # /exception, POST /data
 FAULT_EXCEPTION_TYPE: str = "System.ArithmeticException"  # /fault
 
-# Mock collector config (the .NET repo's collector image, extended for logs/HTTP).
-_MOCK_COLLECTOR_IMAGE: str = "aws-application-signals-mock-collector"
-_MOCK_COLLECTOR_GRPC_PORT: int = 4315
-_MOCK_COLLECTOR_HTTP_PORT: int = 4316
-_MOCK_COLLECTOR_ALIAS: str = "collector"
+# Network prefix for the per-test collector used when the session-wide collector is disabled.
 _NETWORK_NAME: str = "serviceevents-contract-test-network"
 
+# OTEL_AWS_SERVICE_EVENTS_OUTPUT_FILE target for suites that opt into the file path. The directory is a host
+# bind mount, so the tailer reads the file the container writes without exec'ing into it.
+_OUTPUT_FILE_CONTAINER_DIR: str = "/var/log/serviceevents"
+_OUTPUT_FILE_NAME: str = "service-events.ndjson"
+
+# Test-only endpoint of the contract-test apps that force-flushes the agent's providers and ServiceEvents.
+_FLUSH_PATH: str = "test/flush"
+
 # The .NET auto-instrumentation profiler GUID + plugin list. This is deliberately the
 # SINGLE standard entry that the distro's own launch scripts set (instrument.sh,
 # adot-launch.sh/.cmd, the PowerShell module) — no ServiceEvents-specific entry. ServiceEvents
@@ -82,45 +104,66 @@ _OTEL_DOTNET_AUTO_PLUGINS: str = (
 # pylint: disable=broad-exception-caught
 class ServiceEventsTestInfrastructure(TestCase):
     """Container lifecycle + OTLP assertion helpers. Telemetry is asserted via the
-    mock collector's OTLP logs/metrics (no file exporter)."""
+    mock collector's OTLP logs/metrics, or via the NDJSON output file for suites
+    that override is_output_file_enabled."""
 
     application: Optional[DockerContainer] = None
     mock_collector: Optional[DockerContainer] = None
     mock_collector_client: Optional[MockCollectorClient] = None
-    _network: Optional[Network] = None
+    file_tailer: Optional[ServiceEventsFileTailer] = None
+    # Set only when this test started its own collector (CONTRACT_TESTS_SHARED_COLLECTOR=false).
+    _own_collector: Optional[MockCollectorHandle] = None
+    _output_dir: Optional[str] = None
+    # The application's slot of the machine-wide container cap (see `parallel_execution`).
+    _container_lease: Optional[ContainerLease] = None
+    _wait_timings: List[WaitTiming] = []
+    _flush_supported: bool = True
+    # Sampled while the test runs (see `resource_sampler`); ServiceEvents aggregations grow the application's memory.
+    _resource_sampler: Optional[ResourceSampler] = None
+    resource_usage: Dict[str, ResourceSeries] = {}
 
     def setUp(self) -> None:
+        if is_native_launch_enabled():
+            # The application writes ServiceEvents files to a mounted volume and is reached by its network alias.
+            self.skipTest(f"ServiceEvents tests run their application in Docker; unset {LAUNCHER_ENV}")
         self.addCleanup(self.tear_down)
         self.application = None
         self.mock_collector = None
         self.mock_collector_client = None
-        self._network = None
-
-        # Unique network name per test to avoid 409 conflicts.
-        network_name = f"{_NETWORK_NAME}-{uuid.uuid4().hex[:8]}"
-        self._network = NetworkCollection(client=DockerClient()).create(network_name)
-        collector_networking_config = {network_name: EndpointConfig(version="1.22", aliases=[_MOCK_COLLECTOR_ALIAS])}
+        self.file_tailer = None
+        self._own_collector = None
+        self._output_dir = None
+        self._container_lease = None
+        self._wait_timings = []
+        self._flush_supported = True
+        self._resource_sampler = None
+        self.resource_usage = {}
+
+        if is_shared_collector_enabled():
+            collector: MockCollectorHandle = shared_mock_collector()
+        else:
+            # Unique network name per test to avoid 409 conflicts.
+            collector = start_mock_collector(f"{_NETWORK_NAME}-{uuid.uuid4().hex[:8]}")
+            self._own_collector = collector
+        network_name: str = collector.network.name
         app_networking_config = {network_name: EndpointConfig(version="1.22", aliases=["application"])}
+        collector_http_endpoint: str = f"http://{MOCK_COLLECTOR_ALIAS}:{collector.endpoint_http_port}"
 
-        self.mock_collector = (
-            DockerContainer(_MOCK_COLLECTOR_IMAGE)
-            .with_exposed_ports(_MOCK_COLLECTOR_GRPC_PORT, _MOCK_COLLECTOR_HTTP_PORT)
-            .with_kwargs(network=network_name, networking_config=collector_networking_config)
-        )
-        self.mock_collector.start()
-        wait_for_logs(self.mock_collector, "Ready", timeout=20)
-
-        collector_host = self.mock_collector.get_container_host_ip()
-        collector_grpc_port = self.mock_collector.get_exposed_port(_MOCK_COLLECTOR_GRPC_PORT)
-        self.mock_collector_client = MockCollectorClient(collector_host, collector_grpc_port)
+        self.mock_collector = collector.container
+        self.mock_collector_client = collector.create_client()
+        # A shared collector still holds what earlier tests exported. Cleared before the app starts, so the
+        # startup DeploymentEvent of this test's app is kept.
+        self.mock_collector_client.clear_signals()
 
-        otlp_logs_endpoint = f"http://{_MOCK_COLLECTOR_ALIAS}:{_MOCK_COLLECTOR_HTTP_PORT}/v1/logs"
-        otlp_metrics_endpoint = f"http://{_MOCK_COLLECTOR_ALIAS}:{_MOCK_COLLECTOR_HTTP_PORT}/v1/metrics"
+        otlp_logs_endpoint = f"{collector_http_endpoint}/v1/logs"
+        otlp_metrics_endpoint = f"{collector_http_endpoint}/v1/metrics"
 
         self.application = (
             DockerContainer(self.get_application_image_name())
             .with_exposed_ports(self.get_application_port())
-            .with_kwargs(network=network_name, networking_config=app_networking_config)
+            .with_kwargs(
+                network=network_name, networking_config=app_networking_config, extra_hosts=collector.extra_hosts
+            )
             # --- .NET auto-instrumentation load (profiler paths live in the Dockerfile) ---
             .with_env("CORECLR_ENABLE_PROFILING", "1")
             .with_env("CORECLR_PROFILER", _CORECLR_PROFILER_GUID)
@@ -161,13 +204,32 @@ class ServiceEventsTestInfrastructure(TestCase):
         for key, val in self.get_application_extra_environment_variables().items():
             self.application.with_env(key, val)
 
+        if self.is_output_file_enabled():
+            # The container writes as root; the directory must be writable regardless of the host user.
+            self._output_dir = tempfile.mkdtemp(prefix="serviceevents-")
+            os.chmod(self._output_dir, 0o777)
+            self.application.with_volume_mapping(self._output_dir, _OUTPUT_FILE_CONTAINER_DIR, "rw")
+            self.application.with_env(
+                "OTEL_AWS_SERVICE_EVENTS_OUTPUT_FILE", f"{_OUTPUT_FILE_CONTAINER_DIR}/{_OUTPUT_FILE_NAME}"
+            )
+            self.file_tailer = ServiceEventsFileTailer(os.path.join(self._output_dir, _OUTPUT_FILE_NAME))
+            self.file_tailer.start()
+
+        self._container_lease = container_slots().acquire(1)
         self.application.start()
         wait_for_logs(
             self.application, self.get_application_wait_pattern(), timeout=self.get_application_start_timeout()
         )
         time.sleep(0.5)
+        self._resource_sampler = start_resource_sampler(
+            {"application": self.application, "mock_collector": self.mock_collector}
+        )
 
     def tear_down(self) -> None:
+        if self._resource_sampler is not None:
+            self.resource_usage = self._resource_sampler.stop()
+        for timing in self._wait_timings:
+            _logger.info("Wait %s", timing.describe())
         try:
             if self.application is not None:
                 _logger.info("Application stdout:\n%s", self.application.get_logs()[0].decode())
@@ -175,16 +237,22 @@ class ServiceEventsTestInfrastructure(TestCase):
                 self.application.stop()
         except Exception:
             _logger.exception("Failed to tear down application")
+        if self._container_lease is not None:
+            self._container_lease.release()
         try:
-            if self.mock_collector is not None:
-                self.mock_collector.stop()
+            if self.file_tailer is not None:
+                self.file_tailer.stop()
+            if self._output_dir is not None:
+                shutil.rmtree(self._output_dir, ignore_errors=True)
         except Exception:
-            _logger.exception("Failed to tear down mock collector")
-        try:
-            if self._network is not None:
-                self._network.remove()
-        except Exception:
-            _logger.exception("Failed to remove Docker network")
+            _logger.exception("Failed to tear down ServiceEvents output file tailer")
+        if self._own_collector is not None:
+            self._own_collector.stop()
+        elif self.mock_collector_client is not None:
+            try:
+                self.mock_collector_client.clear_signals()
+            except Exception:
+                _logger.exception("Failed to clear the shared mock collector")
 
     # -------------------------------------------------------------------------
     # OTLP value parsing helpers
@@ -224,6 +292,44 @@ class ServiceEventsTestInfrastructure(TestCase):
     def resource_attrs(cls, log) -> Dict[str, Any]:
         return {kv.key: cls._any_value_to_python(kv.value) for kv in log.resource_logs.resource.attributes}
 
+    # -------------------------------------------------------------------------
+    # Polling
+    # -------------------------------------------------------------------------
+
+    def poll_until(self, poll: Callable[[], Any], done: Callable[[Any], bool], label: str, timeout: float) -> Any:
+        """Poll with backoff until `done(result)`; raises `WaitTimeoutError`. Timings are logged on teardown."""
+        strategy: AdaptiveBackoffWait = AdaptiveBackoffWait(OTLP_INITIAL_POLL_INTERVAL, OTLP_POLL_INTERVAL, timeout)
+        try:
+            return strategy.until(poll, done, label)
+        finally:
+            self._wait_timings.extend(strategy.timings)
+
+    def force_flush(self) -> bool:
+        """Ask the app to export everything it buffers now, instead of at the next flush or metric export.
+
+        Returns False, and stops trying for the rest of the test, when the app has no flush endpoint; the waits
+        then fall back to the regular export cadence.
+        """
+        if not self._flush_supported or self.application is None:
+            return False
+        try:
+            response: Response = self.send_request("POST", _FLUSH_PATH)
+        except RequestException:
+            _logger.exception("Flush request failed")
+            return False
+        if response.status_code == 404:
+            self._flush_supported = False
+        return response.status_code == 200
+
+    def flushed(self, poll: Callable[[], Any]) -> Callable[[], Any]:
+        """`poll` preceded by a force flush, so every poll sees what the app has recorded so far."""
+
+        def flush_and_poll() -> Any:
+            self.force_flush()
+            return poll()
+
+        return flush_and_poll
+
     # -------------------------------------------------------------------------
     # OTLP log helpers
     # -------------------------------------------------------------------------
@@ -238,20 +344,19 @@ class ServiceEventsTestInfrastructure(TestCase):
             self.fail("Mock collector not initialized — cannot poll OTLP logs")
         if timeout is None:
             timeout = OTLP_POLL_TIMEOUT
-        start = time.time()
-        records: List = []
-        while time.time() - start < timeout:
-            records = self.get_otlp_logs_by_event_name(event_name)
-            if len(records) >= min_count:
-                return records
-            time.sleep(OTLP_POLL_INTERVAL)
-        records = self.get_otlp_logs_by_event_name(event_name)
-        if len(records) < min_count:
+        try:
+            return self.poll_until(
+                self.flushed(lambda: self.get_otlp_logs_by_event_name(event_name)),
+                lambda records: len(records) >= min_count,
+                f"OTLP logs with event.name='{event_name}'",
+                timeout,
+            )
+        except WaitTimeoutError as error:
+            found: int = error.timing.sizes[-1] if error.timing.sizes else 0
             self.fail(
                 f"Timed out waiting for {min_count} OTLP log(s) with event.name='{event_name}'. "
-                f"Found {len(records)} after {timeout}s."
+                f"Found {found} after {timeout}s. {error.timing.describe()}"
             )
-        return records
 
     def get_endpoint_summary_logs(self, method: str, route: str) -> List:
         logs = self.get_otlp_logs_by_event_name("aws.service_events.endpoint_summary")
@@ -264,17 +369,52 @@ class ServiceEventsTestInfrastructure(TestCase):
     def wait_for_endpoint_summary(self, method: str, route: str, timeout: Optional[float] = None) -> List:
         if timeout is None:
             timeout = OTLP_POLL_TIMEOUT
-        start = time.time()
-        logs: List = []
-        while time.time() - start < timeout:
-            logs = self.get_endpoint_summary_logs(method, route)
-            if logs:
-                return logs
-            time.sleep(OTLP_POLL_INTERVAL)
-        logs = self.get_endpoint_summary_logs(method, route)
-        if not logs:
-            self.fail(f"Timed out waiting for EndpointSummary log for {method} {route} after {timeout}s.")
-        return logs
+        try:
+            return self.poll_until(
+                self.flushed(lambda: self.get_endpoint_summary_logs(method, route)),
+                bool,
+                f"EndpointSummary log for {method} {route}",
+                timeout,
+            )
+        except WaitTimeoutError as error:
+            self.fail(
+                f"Timed out waiting for EndpointSummary log for {method} {route} after {timeout}s. "
+                f"{error.timing.describe()}"
+            )
+
+    # -------------------------------------------------------------------------
+    # Output file helpers (only when is_output_file_enabled)
+    # -------------------------------------------------------------------------
+
+    def wait_for_file_logs(self, event_name: str, min_count: int = 1, timeout: Optional[float] = None) -> List:
+        if self.file_tailer is None:
+            self.fail("Output file is not enabled for this suite — cannot read file logs")
+        if timeout is None:
+            timeout = OTLP_POLL_TIMEOUT
+        records = self.file_tailer.wait_for_logs_by_event_name(event_name, min_count, timeout)
+        if len(records) < min_count:
+            self.fail(
+                f"Timed out waiting for {min_count} file log(s) with event.name='{event_name}'. "
+                f"Found {len(records)} after {timeout}s."
+            )
+        return records
+
+    def wait_for_file_metric(self, metric_name: str, timeout: Optional[float] = None) -> List:
+        """File metrics named `metric_name`, flushing before every poll; the default timeout relies on the flush
+        endpoint instead of the 60s metric reader cadence."""
+        if self.file_tailer is None:
+            self.fail("Output file is not enabled for this suite — cannot read file metrics")
+        if timeout is None:
+            timeout = OTLP_POLL_TIMEOUT
+        try:
+            return self.poll_until(
+                self.flushed(lambda: [m for m in self.file_tailer.peek_metrics() if m.metric.name == metric_name]),
+                bool,
+                f"file metric '{metric_name}'",
+                timeout,
+            )
+        except WaitTimeoutError as error:
+            self.fail(f"Timed out waiting for file metric '{metric_name}' after {timeout}s. {error.timing.describe()}")
 
     # -------------------------------------------------------------------------
     # OTLP metric helpers
@@ -302,18 +442,19 @@ class ServiceEventsTestInfrastructure(TestCase):
     def wait_for_error_count_metric(self, min_count: int = 1, timeout: Optional[float] = None) -> List:
         if timeout is None:
             timeout = METRIC_POLL_TIMEOUT
-        start = time.time()
-        data_points: List = []
-        while time.time() - start < timeout:
-            data_points = self._peek_error_count_data_points()
-            if len(data_points) >= min_count:
-                return data_points
-            time.sleep(OTLP_POLL_INTERVAL)
-        self.fail(
-            f"Timed out waiting for {min_count} '{self._ERROR_COUNT_METRIC_NAME}' data point(s). "
-            f"Found {len(data_points)}."
-        )
-        return data_points
+        try:
+            return self.poll_until(
+                self.flushed(self._peek_error_count_data_points),
+                lambda data_points: len(data_points) >= min_count,
+                f"'{self._ERROR_COUNT_METRIC_NAME}' data points",
+                timeout,
+            )
+        except WaitTimeoutError as error:
+            found: int = error.timing.sizes[-1] if error.timing.sizes else 0
+            self.fail(
+                f"Timed out waiting for {min_count} '{self._ERROR_COUNT_METRIC_NAME}' data point(s). "
+                f"Found {found}. {error.timing.describe()}"
+            )
 
     @classmethod
     def dp_attrs(cls, data_point) -> Dict[str, Any]:
@@ -390,6 +531,10 @@ class ServiceEventsTestInfrastructure(TestCase):
     def get_application_start_timeout(self) -> int:
         return 60
 
+    def is_output_file_enabled(self) -> bool:
+        """Export through OTEL_AWS_SERVICE_EVENTS_OUTPUT_FILE instead of OTLP; read it via `file_tailer`."""
+        return False
+
 
 class ServiceEventsContractTestBase(ServiceEventsTestInfrastructure):
     """Standard OTLP suite inherited by the framework test classes."""
@@ -434,14 +579,15 @@ class ServiceEventsContractTestBase(ServiceEventsTestInfrastructure):
             return sum(self.attrs(log).get(field, 0) for log in logs if self.attrs(log).get("url.route") == route)
 
         def _wait_total(route: str, field: str, minimum: int) -> int:
-            start = time.time()
-            total = 0
-            while time.time() - start < OTLP_POLL_TIMEOUT:
-                total = _sum(route, field)
-                if total >= minimum:
-                    return total
-                time.sleep(OTLP_POLL_INTERVAL)
-            return total
+            try:
+                return self.poll_until(
+                    self.flushed(lambda: _sum(route, field)),
+                    lambda total: total >= minimum,
+                    f"{field} on {route}",
+                    OTLP_POLL_TIMEOUT,
+                )
+            except WaitTimeoutError:
+                return _sum(route, field)
 
         for _ in range(3):
             self.assertEqual(400, self.send_request("GET", "error").status_code)
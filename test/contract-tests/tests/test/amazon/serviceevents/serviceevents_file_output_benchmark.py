@@ -0,0 +1,61 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Write and read pattern of the ServiceEvents NDJSON output file (OTEL_AWS_SERVICE_EVENTS_OUTPUT_FILE).
+
+ServiceEvents.NetCore gets SERVICE_EVENTS_FILE_BENCHMARK_REQUESTS (default 50) `GET /success` requests, is flushed, and
+the file is read to the end by `ServiceEventsFileTailer`. The report has how often the tailer woke up (`reads`), how
+many exporter writes those covered, and the bytes and lines per read, for comparison with the OTLP exporter; every
+byte must have been read exactly once and parse as a ServiceEvents line. The report is written as
+`serviceevents_file_output.json`.
+
+Not collected by default; run with
+`pytest contract-tests/tests/test/amazon/serviceevents/serviceevents_file_output_benchmark.py`.
+"""
+import os
+
+from typing_extensions import override
+
+from amazon.serviceevents.serviceevents_contract_test_base import ServiceEventsTestInfrastructure
+from amazon.utils.benchmark_utils import get_int_env, summarize, write_benchmark_report
+
+_REPORT_NAME: str = "serviceevents_file_output"
+
+
+class ServiceEventsFileOutputBenchmark(ServiceEventsTestInfrastructure):
+
+    @override
+    @staticmethod
+    def get_application_image_name() -> str:
+        return "aws-application-signals-tests-serviceevents.netcore-app"
+
+    @override
+    def is_output_file_enabled(self) -> bool:
+        return True
+
+    def test_file_output_flushes(self) -> None:
+        request_count: int = get_int_env("SERVICE_EVENTS_FILE_BENCHMARK_REQUESTS", 50)
+        for _ in range(request_count):
+            self.send_request("GET", "success")
+        self.force_flush()
+        self.wait_for_file_logs("aws.service_events.endpoint_summary")
+        self.file_tailer.stop()
+
+        flushes = self.file_tailer.flushes
+        self.assertEqual([], self.file_tailer.parse_errors)
+        self.assertEqual(os.path.getsize(self.file_tailer.host_path), self.file_tailer.bytes_read)
+
+        writes = sum(flush.writes for flush in flushes)
+        write_benchmark_report(
+            _REPORT_NAME,
+            {
+                "requests": request_count,
+                "inotify": self.file_tailer.uses_inotify,
+                "reads": len(flushes),
+                "exporter_writes": writes,
+                "total_bytes": self.file_tailer.bytes_read,
+                "bytes_per_write": self.file_tailer.bytes_read / writes if writes else 0,
+                "bytes_per_read": summarize([flush.byte_count for flush in flushes]),
+                "lines_per_read": summarize([flush.line_count for flush in flushes]),
+            },
+        )
@@ -0,0 +1,261 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Incremental reader for the ServiceEvents `OTEL_AWS_SERVICE_EVENTS_OUTPUT_FILE` NDJSON output.
+
+The app container writes the file into a host directory bind-mounted by the test. Both file exporters append one
+batch per flush with `File.AppendAllText` (open, write, close), so on Linux every flush ends in an inotify
+IN_CLOSE_WRITE on the host side. The tailer wakes on those events, reads only the bytes past its last offset, and
+records one `FileFlush` per read. Where inotify is unavailable (e.g. Docker Desktop file sharing) it falls back to
+polling the file size, and a `FileFlush` may then cover more than one exporter flush.
+
+Lines are converted into the mock collector client's query model so OTLP assertions can be reused unchanged:
+  * log lines `{eventName, timeUnixNano, traceId?, spanId?, flags?, attributes, body, resource}` become
+    `ResourceScopeLogRecord`s. The file format carries no instrumentation scope, so the scope ServiceEvents always
+    emits (`serviceevents` / `1.0`) is filled in.
+  * metric lines are OTLP/JSON `ExportMetricsServiceRequest`s and become `ResourceScopeMetric`s.
+"""
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import threading
+import time
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, List, Optional
+
+from google.protobuf import json_format
+from mock_collector_client import ResourceScopeLogRecord, ResourceScopeMetric
+from mock_collector_console_log_adapter import to_any_value, to_key_values
+
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import InstrumentationScope
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord, ResourceLogs, ScopeLogs
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+SERVICE_EVENTS_SCOPE_NAME: str = "serviceevents"
+SERVICE_EVENTS_SCOPE_VERSION: str = "1.0"
+
+_POLL_INTERVAL_SEC: float = 0.2
+_IN_CLOSE_WRITE: int = 0x00000008
+_IN_CREATE: int = 0x00000100
+_INOTIFY_EVENT_HEADER: struct.Struct = struct.Struct("iIII")
+
+
+class FileFlush:
+    """One incremental read of the output file: what was appended since the previous read."""
+
+    def __init__(self, byte_count: int, line_count: int, writes: int, observed_at: float):
+        self.byte_count: int = byte_count
+        self.line_count: int = line_count
+        # Number of exporter writes (IN_CLOSE_WRITE events) coalesced into this read; 1 when polling.
+        self.writes: int = writes
+        self.observed_at: float = observed_at
+
+
+class ServiceEventsFileTailer:
+    """Follows an NDJSON file in a background thread and keeps everything parsed so far.
+
+    The file does not need to exist when the tailer starts. Reads only consume complete lines; a partially written
+    trailing line stays buffered until its newline arrives.
+    """
+
+    def __init__(self, host_path: str):
+        self.host_path: str = host_path
+        self._offset: int = 0
+        self._pending: bytes = b""
+        self._flushes: List[FileFlush] = []
+        self._logs: List[ResourceScopeLogRecord] = []
+        self._metrics: List[ResourceScopeMetric] = []
+        self._parse_errors: List[str] = []
+        self._condition: threading.Condition = threading.Condition()
+        self._stopped: threading.Event = threading.Event()
+        self._watcher: Optional[_InotifyWatcher] = _InotifyWatcher.create(os.path.dirname(host_path))
+        self._thread: threading.Thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._watcher is not None
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join(timeout=5)
+        if self._watcher is not None:
+            self._watcher.close()
+        # Pick up anything written between the last wakeup and shutdown.
+        self._read_new_data(0)
+
+    def peek_logs(self) -> List[ResourceScopeLogRecord]:
+        with self._condition:
+            return list(self._logs)
+
+    def peek_logs_by_event_name(self, event_name: str) -> List[ResourceScopeLogRecord]:
+        return [
+            r
+            for r in self.peek_logs()
+            if any(kv.key == "event.name" and kv.value.string_value == event_name for kv in r.log_record.attributes)
+        ]
+
+    def peek_metrics(self) -> List[ResourceScopeMetric]:
+        with self._condition:
+            return list(self._metrics)
+
+    def wait_for_logs_by_event_name(
+        self, event_name: str, min_count: int, timeout: float
+    ) -> List[ResourceScopeLogRecord]:
+        """Block until `min_count` records of `event_name` were read or `timeout` expires; returns what was found."""
+        deadline: float = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                records: List[ResourceScopeLogRecord] = self.peek_logs_by_event_name(event_name)
+                remaining: float = deadline - time.monotonic()
+                if len(records) >= min_count or remaining <= 0:
+                    return records
+                self._condition.wait(remaining)
+
+    @property
+    def flushes(self) -> List[FileFlush]:
+        with self._condition:
+            return list(self._flushes)
+
+    @property
+    def parse_errors(self) -> List[str]:
+        with self._condition:
+            return list(self._parse_errors)
+
+    @property
+    def bytes_read(self) -> int:
+        with self._condition:
+            return self._offset
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            if self._watcher is not None:
+                writes: int = self._watcher.wait(os.path.basename(self.host_path), _POLL_INTERVAL_SEC)
+            else:
+                time.sleep(_POLL_INTERVAL_SEC)
+                writes = 0
+            try:
+                self._read_new_data(writes)
+            # pylint: disable=broad-exception-caught
+            except Exception:
+                _logger.exception("Error while tailing %s", self.host_path)
+
+    def _read_new_data(self, writes: int) -> None:
+        try:
+            with open(self.host_path, "rb") as output_file:
+                output_file.seek(0, os.SEEK_END)
+                size: int = output_file.tell()
+                if size < self._offset:
+                    _logger.warning("%s was truncated, reading from the start", self.host_path)
+                    self._offset, self._pending = 0, b""
+                output_file.seek(self._offset)
+                data: bytes = output_file.read()
+        except FileNotFoundError:
+            return
+        if not data:
+            return
+
+        buffered: bytes = self._pending + data
+        complete, _, pending = buffered.rpartition(b"\n")
+        lines: List[bytes] = [line for line in complete.split(b"\n") if line.strip()] if complete else []
+        logs: List[ResourceScopeLogRecord] = []
+        metrics: List[ResourceScopeMetric] = []
+        errors: List[str] = []
+        for line in lines:
+            try:
+                _parse_line(line, logs, metrics)
+            except (ValueError, json_format.ParseError) as error:
+                errors.append(f"{error}: {line[:200]!r}")
+
+        with self._condition:
+            self._offset += len(data)
+            self._pending = pending
+            self._flushes.append(FileFlush(len(data), len(lines), max(writes, 1), time.monotonic()))
+            self._logs.extend(logs)
+            self._metrics.extend(metrics)
+            self._parse_errors.extend(errors)
+            self._condition.notify_all()
+
+
+def _parse_line(line: bytes, logs: List[ResourceScopeLogRecord], metrics: List[ResourceScopeMetric]) -> None:
+    document: Dict[str, Any] = json.loads(line)
+    if "resourceMetrics" in document:
+        request: ExportMetricsServiceRequest = json_format.Parse(line, ExportMetricsServiceRequest())
+        for resource_metric in request.resource_metrics:
+            for scope_metric in resource_metric.scope_metrics:
+                for metric in scope_metric.metrics:
+                    metrics.append(ResourceScopeMetric(resource_metric, scope_metric, metric))
+    elif "eventName" in document:
+        resource_logs: ResourceLogs = ResourceLogs(
+            resource=Resource(attributes=to_key_values(document.get("resource", {})))
+        )
+        scope_logs: ScopeLogs = resource_logs.scope_logs.add(
+            scope=InstrumentationScope(name=SERVICE_EVENTS_SCOPE_NAME, version=SERVICE_EVENTS_SCOPE_VERSION)
+        )
+        log_record: LogRecord = scope_logs.log_records.add(
+            time_unix_nano=int(document.get("timeUnixNano", 0)),
+            attributes=to_key_values(document.get("attributes", {})),
+            body=to_any_value(document.get("body", {})),
+            trace_id=bytes.fromhex(document.get("traceId", "")),
+            span_id=bytes.fromhex(document.get("spanId", "")),
+            flags=int(document.get("flags", 0)),
+        )
+        logs.append(ResourceScopeLogRecord(resource_logs, scope_logs, log_record))
+    else:
+        raise ValueError("Line is neither a ServiceEvents log record nor an ExportMetricsServiceRequest")
+
+
+class _InotifyWatcher:
+    """IN_CLOSE_WRITE notifications for one directory through libc, without third-party packages."""
+
+    def __init__(self, libc: ctypes.CDLL, inotify_fd: int):
+        self._libc: ctypes.CDLL = libc
+        self._fd: int = inotify_fd
+
+    @staticmethod
+    def create(directory: str) -> Optional["_InotifyWatcher"]:
+        library: Optional[str] = ctypes.util.find_library("c")
+        if library is None:
+            return None
+        try:
+            libc: ctypes.CDLL = ctypes.CDLL(library, use_errno=True)
+            inotify_fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (AttributeError, OSError):
+            return None
+        if inotify_fd < 0:
+            return None
+        if libc.inotify_add_watch(inotify_fd, os.fsencode(directory), _IN_CLOSE_WRITE | _IN_CREATE) < 0:
+            os.close(inotify_fd)
+            return None
+        return _InotifyWatcher(libc, inotify_fd)
+
+    def wait(self, file_name: str, timeout: float) -> int:
+        """Wait up to `timeout` for events and return how many IN_CLOSE_WRITE events concerned `file_name`."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return 0
+        try:
+            buffer: bytes = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return 0
+        writes: int = 0
+        position: int = 0
+        while position + _INOTIFY_EVENT_HEADER.size <= len(buffer):
+            _, mask, _, name_length = _INOTIFY_EVENT_HEADER.unpack_from(buffer, position)
+            name_start: int = position + _INOTIFY_EVENT_HEADER.size
+            name: str = os.fsdecode(buffer[name_start : name_start + name_length].rstrip(b"\0"))
+            if name == file_name and mask & _IN_CLOSE_WRITE:
+                writes += 1
+            position = name_start + name_length
+        return writes
+
+    def close(self) -> None:
+        os.close(self._fd)
@@ -0,0 +1,170 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Startup benchmark of the sample applications: profiler attach, distro plugin initialization and its feature toggles.
+
+Every sample application is launched `STARTUP_BENCHMARK_LAUNCHES` times (default 5) in every configuration of
+`_CONFIGURATIONS`, each launch a fresh application started by the class's launcher (so `CONTRACT_TESTS_LAUNCHER=native`
+measures without container start-up). From the moment the launch starts, the benchmark sends the application's
+request every few milliseconds until one is answered, and records:
+
+- `time_to_ready_ms`: until the first response; the first request to succeed is also the application's first request,
+  so nothing else is traced before it;
+- `first_request_ms`: how long that cold request took;
+- `time_to_first_span_ms`: until its server span arrived at the mock collector (instrumented configurations only).
+
+With Docker, the times include creating the container, which is the same for every configuration and cancels out in
+the deltas: `overhead_vs_uninstrumented_ms` compares each configuration with the run without any instrumentation, and
+`delta_vs_default_ms` compares each feature toggle with the distro's defaults. `STARTUP_BENCHMARK_APPLICATIONS`
+restricts the run to some of `_APPLICATIONS` (comma separated).
+
+Not collected by default; run with `pytest contract-tests/tests/test/amazon/startup/startup_benchmark.py`.
+"""
+import os
+import time
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, List
+
+from requests import RequestException, Response, request
+from typing_extensions import override
+
+from amazon.base.application_pool import Application
+from amazon.base.benchmark_base import BenchmarkBase
+from amazon.utils.benchmark_utils import (
+    UNINSTRUMENTED_ENVIRONMENT,
+    delta,
+    get_int_env,
+    summarize,
+    write_benchmark_report,
+)
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+APPLICATIONS_ENV: str = "STARTUP_BENCHMARK_APPLICATIONS"
+
+# Sample applications that start without dependency containers, and a request each that produces a server span.
+_APPLICATIONS: Dict[str, Dict[str, str]] = {
+    "AppSignals.NetCore": {"image": "aws-application-signals-tests-appsignals.netcore-app", "path": "success"},
+    "TestSimpleApp.EfCore": {"image": "aws-application-signals-tests-testsimpleapp.efcore-app", "path": "blogs"},
+}
+_UNINSTRUMENTED: str = "uninstrumented"
+_DEFAULT: str = "default"
+# Environment on top of the one ContractTestBase gives every application (Application Signals on, runtime metrics off,
+# ServiceEvents following Application Signals, dynamic instrumentation off).
+_CONFIGURATIONS: Dict[str, Dict[str, str]] = {
+    _UNINSTRUMENTED: UNINSTRUMENTED_ENVIRONMENT,
+    # The startup hook still initializes the SDK and the plugin; only bytecode instrumentation is missing.
+    "profiler_off": {"CORECLR_ENABLE_PROFILING": "0"},
+    _DEFAULT: {},
+    "application_signals_off": {"OTEL_AWS_APPLICATION_SIGNALS_ENABLED": "false"},
+    "runtime_metrics_on": {"OTEL_AWS_APPLICATION_SIGNALS_RUNTIME_ENABLED": "true"},
+    "service_events_off": {"OTEL_AWS_SERVICE_EVENTS_ENABLED": "false"},
+    "dynamic_instrumentation_on": {"OTEL_AWS_DYNAMIC_INSTRUMENTATION_ENABLED": "true"},
+}
+_START_TIMEOUT_SEC: float = 300
+_SPAN_WAIT_TIMEOUT_SEC: float = 30
+_POLL_INTERVAL_SEC: float = 0.01
+_REQUEST_TIMEOUT_SEC: float = 30
+
+
+class StartupBenchmark(BenchmarkBase):
+    """The applications are launched per measurement."""
+
+    _application_name: str = next(iter(_APPLICATIONS))
+    _configuration: Dict[str, str] = {}
+
+    @override
+    def get_application_image_name(self) -> str:
+        return _APPLICATIONS[self._application_name]["image"]
+
+    @override
+    def get_application_extra_environment_variables(self) -> Dict[str, str]:
+        return self._configuration
+
+    @override
+    def get_application_wait_pattern(self) -> str:
+        # Launches return as soon as the application is started; readiness is what this benchmark measures.
+        return ""
+
+    def test_startup_time(self) -> None:
+        launches: int = get_int_env("STARTUP_BENCHMARK_LAUNCHES", 5)
+        selected: str = os.environ.get(APPLICATIONS_ENV, "").strip()
+        names: List[str] = [name.strip() for name in selected.split(",")] if selected else list(_APPLICATIONS)
+
+        report: Dict[str, Any] = {"launches": launches, "launcher": type(self.application_launcher).__name__}
+        for name in names:
+            self.assertIn(name, _APPLICATIONS, f"{APPLICATIONS_ENV} names an unknown application")
+            report[name] = self._measure_application(name, launches)
+        write_benchmark_report("startup", report)
+
+    def _measure_application(self, name: str, launches: int) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        for configuration, environment in _CONFIGURATIONS.items():
+            samples: Dict[str, List[float]] = {
+                "time_to_ready_ms": [],
+                "first_request_ms": [],
+                "time_to_first_span_ms": [],
+            }
+            for _ in range(launches):
+                for key, value in self._launch(name, environment, configuration != _UNINSTRUMENTED).items():
+                    samples[key].append(value)
+            results[configuration] = {key: summarize(values) for key, values in samples.items()}
+
+        results["overhead_vs_uninstrumented_ms"] = {
+            configuration: {
+                key: delta(results[configuration][key], results[_UNINSTRUMENTED][key])
+                for key in ("time_to_ready_ms", "first_request_ms")
+            }
+            for configuration in _CONFIGURATIONS
+            if configuration != _UNINSTRUMENTED
+        }
+        results["delta_vs_default_ms"] = {
+            configuration: {
+                key: delta(results[configuration][key], results[_DEFAULT][key])
+                for key in ("time_to_ready_ms", "first_request_ms", "time_to_first_span_ms")
+            }
+            for configuration in _CONFIGURATIONS
+            if configuration not in (_UNINSTRUMENTED, _DEFAULT)
+        }
+        return results
+
+    def _launch(self, name: str, environment: Dict[str, str], instrumented: bool) -> Dict[str, float]:
+        self._application_name = name
+        self._configuration = environment
+
+        started: float = time.monotonic()
+        with self.launched(_START_TIMEOUT_SEC) as application:
+            sample: Dict[str, float] = self._first_response(application, started)
+            if instrumented:
+                sample["time_to_first_span_ms"] = self._first_server_span(started)
+            return sample
+
+    def _first_response(self, application: Application, started: float) -> Dict[str, float]:
+        deadline: float = started + _START_TIMEOUT_SEC
+        path: str = _APPLICATIONS[self._application_name]["path"]
+        while True:
+            sent: float = time.monotonic()
+            try:
+                port: str = application.get_exposed_port(self.get_application_port())
+                url: str = f"http://{application.get_container_host_ip()}:{port}/{path}"
+                response: Response = request("GET", url, timeout=_REQUEST_TIMEOUT_SEC)
+            except (RequestException, RuntimeError):
+                # Not listening yet; a native application has not even reported its port.
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(_POLL_INTERVAL_SEC)
+                continue
+            answered: float = time.monotonic()
+            self.assertLess(response.status_code, 500, f"{self._application_name} failed its first request")
+            return {"time_to_ready_ms": (answered - started) * 1000, "first_request_ms": (answered - sent) * 1000}
+
+    def _first_server_span(self, started: float) -> float:
+        deadline: float = time.monotonic() + _SPAN_WAIT_TIMEOUT_SEC
+        while time.monotonic() < deadline:
+            # pylint: disable=no-member
+            if len(self.mock_collector_client.get_span_table().where(kind=Span.SPAN_KIND_SERVER)) > 0:
+                return (time.monotonic() - started) * 1000
+            time.sleep(_POLL_INTERVAL_SEC)
+        self.fail(f"No server span from {self._application_name} within {_SPAN_WAIT_TIMEOUT_SEC}s")
@@ -0,0 +1,155 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Helpers shared by the benchmark modules: sample summaries and JSON report output.
+
+Benchmarks live next to the contract tests they exercise, in modules named `*_benchmark.py`. Pytest does not
+collect those by default, so they only run when passed explicitly, e.g.
+`pytest contract-tests/tests/test/amazon/awslambda/lambda_cold_start_benchmark.py`.
+
+A report of an earlier run can serve as the baseline of the next: copy it to `$BENCHMARK_BASELINE_DIR` and benchmarks
+that support it compare against it (`load_baseline_report`).
+
+Benchmarks that sample the resource usage of the application (see `resource_sampler`) fail when it exceeds a threshold
+set in the environment (`resource_threshold_violations`): BENCHMARK_MAX_RSS_MB caps its peak memory,
+BENCHMARK_MAX_RSS_GROWTH_MB how much its memory grew over the measurement and BENCHMARK_MAX_CPU_PERCENT its mean CPU
+usage (100 being one core). Unset thresholds are not checked.
+"""
+import csv
+import json
+import math
+import os
+from datetime import datetime, timezone
+from logging import INFO, Logger, getLogger
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_logger: Logger = getLogger(__name__)
+_logger.setLevel(INFO)
+
+BENCHMARK_OUTPUT_DIR_ENV: str = "BENCHMARK_OUTPUT_DIR"
+_DEFAULT_BENCHMARK_OUTPUT_DIR: str = "benchmark-results"
+BENCHMARK_BASELINE_DIR_ENV: str = "BENCHMARK_BASELINE_DIR"
+MAX_RSS_MB_ENV: str = "BENCHMARK_MAX_RSS_MB"
+MAX_RSS_GROWTH_MB_ENV: str = "BENCHMARK_MAX_RSS_GROWTH_MB"
+MAX_CPU_PERCENT_ENV: str = "BENCHMARK_MAX_CPU_PERCENT"
+
+# Added to the environment ContractTestBase gives an application, leaves the distro out entirely: neither the profiler
+# nor the startup hook (which would initialize the SDK and the plugin on its own) is loaded.
+UNINSTRUMENTED_ENVIRONMENT: Dict[str, str] = {
+    "CORECLR_ENABLE_PROFILING": "0",
+    "DOTNET_STARTUP_HOOKS": "",
+    "DOTNET_ADDITIONAL_DEPS": "",
+    "DOTNET_SHARED_STORE": "",
+}
+
+# Exporter cadence of the SDK's defaults (a 5 s batch delay, metrics every 60 s), instead of the contract tests'
+# near-immediate one, for benchmarks that measure a production configuration.
+PRODUCTION_EXPORT_ENVIRONMENT: Dict[str, str] = {
+    "OTEL_BSP_SCHEDULE_DELAY": "5000",
+    "OTEL_METRIC_EXPORT_INTERVAL": "60000",
+}
+
+
+def get_int_env(name: str, default: int) -> int:
+    value: str = os.environ.get(name, "")
+    return int(value) if value.strip() else default
+
+
+def get_int_list_env(name: str, default: Sequence[int]) -> List[int]:
+    """Comma separated integers, e.g. `100,500,1000`."""
+    value: str = os.environ.get(name, "")
+    return [int(item) for item in value.split(",") if item.strip()] if value.strip() else list(default)
+
+
+def get_float_env(name: str) -> Optional[float]:
+    value: str = os.environ.get(name, "")
+    return float(value) if value.strip() else None
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples`. Returns 0 for an empty sequence."""
+    if not samples:
+        return 0.0
+    ordered: List[float] = sorted(samples)
+    rank: int = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """Summarize a list of measurements (usually milliseconds) into the statistics every report uses."""
+    if not samples:
+        return {"count": 0, "min": 0.0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "count": len(samples),
+        "min": min(samples),
+        "mean": sum(samples) / len(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "max": max(samples),
+    }
+
+
+def delta(instrumented: Dict[str, float], baseline: Dict[str, float]) -> Dict[str, float]:
+    """Per-statistic difference between two `summarize` results (instrumented minus baseline)."""
+    return {key: instrumented[key] - baseline[key] for key in instrumented if key != "count" and key in baseline}
+
+
+def write_benchmark_report(name: str, report: Dict[str, Any]) -> str:
+    """Write `report` as `<BENCHMARK_OUTPUT_DIR>/<name>.json` and return the path of the written file."""
+    path: str = _output_path(f"{name}.json")
+    document: Dict[str, Any] = {
+        "benchmark": name,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "results": report,
+    }
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(document, report_file, indent=2, sort_keys=True)
+    _logger.info("Benchmark report written to %s", path)
+    return path
+
+
+def write_benchmark_table(name: str, rows: List[Dict[str, Any]]) -> str:
+    """Write `rows` as `<BENCHMARK_OUTPUT_DIR>/<name>.csv`, with the keys of the first row as columns."""
+    path: str = _output_path(f"{name}.csv")
+    with open(path, "w", encoding="utf-8", newline="") as table_file:
+        writer: csv.DictWriter = csv.DictWriter(table_file, fieldnames=list(rows[0]) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
+    _logger.info("Benchmark table written to %s", path)
+    return path
+
+
+def load_baseline_report(name: str) -> Optional[Dict[str, Any]]:
+    """The results of `<BENCHMARK_BASELINE_DIR>/<name>.json`, or None when there is no baseline for `name`."""
+    baseline_dir: str = os.environ.get(BENCHMARK_BASELINE_DIR_ENV, "").strip()
+    path: str = os.path.join(baseline_dir, f"{name}.json")
+    if not baseline_dir or not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as report_file:
+        results: Dict[str, Any] = json.load(report_file)["results"]
+    _logger.info("Comparing with the baseline in %s", path)
+    return results
+
+
+def resource_threshold_violations(summary: Dict[str, Any]) -> List[str]:
+    """How a `ResourceSeries.summary()` exceeds the thresholds set in the environment; empty when it does not."""
+    if not summary.get("samples"):
+        return []
+    checks: List[Tuple[str, float]] = [
+        (MAX_RSS_MB_ENV, summary["rss_mb"]["max"]),
+        (MAX_RSS_GROWTH_MB_ENV, summary["rss_growth_mb"]),
+        (MAX_CPU_PERCENT_ENV, summary["cpu_percent"]["mean"]),
+    ]
+    violations: List[str] = []
+    for env, value in checks:
+        threshold: Optional[float] = get_float_env(env)
+        if threshold is not None and value > threshold:
+            violations.append(f"{value:.1f} exceeds {env}={threshold:g}")
+    return violations
+
+
+def _output_path(file_name: str) -> str:
+    output_dir: str = os.environ.get(BENCHMARK_OUTPUT_DIR_ENV, _DEFAULT_BENCHMARK_OUTPUT_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, file_name)
@@ -0,0 +1,133 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+HTTP load for the benchmarks: at a fixed request rate (`run_fixed_rate`) or as fast as possible (`run_closed_loop`).
+
+Fixed-rate load is open loop: request `i` is due at `start + i / rps` whether or not earlier ones have been answered,
+and its latency is measured from when it was due, so a slow application shows up as latency instead of as a lower
+request rate (no coordinated omission). `service_time_ms` is measured from when the request was actually sent. Every
+worker thread keeps its own keep-alive session.
+
+Fixed-rate load can rotate over several URLs: request `i` goes to `urls[i % len(urls)]`, so every URL gets its share
+of the requests however many there are.
+
+With `id_header`, every request carries a unique id in that header and the ids of the answered requests are kept, so a
+benchmark can tell exactly which requests the telemetry it received accounts for.
+
+The generator runs in the test process and is bounded by it: a ceiling found by `run_closed_loop` is the lower of the
+application's and the generator's, which is still comparable between runs on the same machine.
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from requests import RequestException, Response, Session
+
+_REQUEST_TIMEOUT_SEC: float = 30
+
+
+class LoadResult:
+    """Outcome of one load run."""
+
+    def __init__(self):
+        self.latency_ms: List[float] = []
+        self.service_time_ms: List[float] = []
+        # Responses by status code; requests that got no response are counted in `transport_errors`.
+        self.status_counts: Dict[int, int] = {}
+        self.transport_errors: int = 0
+        # Filled only when the load was run with an `id_header`.
+        self.answered_request_ids: List[str] = []
+        self.elapsed_seconds: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def responses(self) -> int:
+        return sum(self.status_counts.values())
+
+    @property
+    def achieved_rps(self) -> float:
+        return self.responses / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def record(self, due: float, sent: float, response: Response, request_id: Optional[str] = None) -> None:
+        answered: float = time.monotonic()
+        with self._lock:
+            self.latency_ms.append((answered - due) * 1000)
+            self.service_time_ms.append((answered - sent) * 1000)
+            self.status_counts[response.status_code] = self.status_counts.get(response.status_code, 0) + 1
+            if request_id is not None:
+                self.answered_request_ids.append(request_id)
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.transport_errors += 1
+
+
+def run_fixed_rate(
+    method: str,
+    url: Union[str, Sequence[str]],
+    rps: float,
+    duration_seconds: float,
+    concurrency: int,
+    id_header: Optional[str] = None,
+) -> LoadResult:
+    """Send `rps` requests per second for `duration_seconds` from up to `concurrency` threads."""
+    result: LoadResult = LoadResult()
+    # Rounded rather than truncated: a duration given as `requests / rps` must send exactly that many requests, and the
+    # product can land just below it (29 / 100 * 100 is 28.999999999999996).
+    request_count: int = round(rps * duration_seconds)
+    urls: Sequence[str] = [url] if isinstance(url, str) else url
+    send: Callable[[float, str], None] = _sender(method, result, id_header)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start: float = time.monotonic()
+        futures: List[Future] = []
+        for index in range(request_count):
+            due: float = start + index / rps
+            delay: float = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(executor.submit(send, due, urls[index % len(urls)]))
+        for future in futures:
+            future.result()
+        result.elapsed_seconds = time.monotonic() - start
+    return result
+
+
+def run_closed_loop(method: str, url: str, duration_seconds: float, concurrency: int) -> LoadResult:
+    """Keep `concurrency` requests in flight for `duration_seconds`; the achieved rate is the throughput ceiling."""
+    result: LoadResult = LoadResult()
+    send: Callable[[float, str], None] = _sender(method, result)
+    start: float = time.monotonic()
+    deadline: float = start + duration_seconds
+
+    def worker() -> None:
+        while time.monotonic() < deadline:
+            send(time.monotonic(), url)
+
+    threads: List[threading.Thread] = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.elapsed_seconds = time.monotonic() - start
+    return result
+
+
+def _sender(method: str, result: LoadResult, id_header: Optional[str] = None) -> Callable[[float, str], None]:
+    sessions: threading.local = threading.local()
+
+    def send(due: float, url: str) -> None:
+        session: Session = getattr(sessions, "session", None) or Session()
+        sessions.session = session
+        request_id: Optional[str] = uuid.uuid4().hex if id_header is not None else None
+        headers: Dict[str, str] = {id_header: request_id} if request_id is not None else {}
+        sent: float = time.monotonic()
+        try:
+            response: Response = session.request(method, url, headers=headers, timeout=_REQUEST_TIMEOUT_SEC)
+        except RequestException:
+            result.record_error()
+            return
+        result.record(due, sent, response, request_id)
+
+    return send
@@ -0,0 +1,99 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Accounting of the telemetry a load run produced against the requests the application answered.
+
+The load is run with `REQUEST_ID_HEADER` as the `id_header` of `load_generator.run_fixed_rate`, and the application
+with `REQUEST_ID_CAPTURE_ENVIRONMENT`, so that the ASP.NET Core instrumentation records every request's id on its server
+span. `reconcile_spans` then matches the server spans at the mock collector with the answered requests one by one,
+once every answered request has its span or the spans have stopped arriving for longer than one batch span processor
+schedule delay (the batch that was still queued when the application was flushed would be exported by then).
+Metrics carry no request id; `reconcile_total` compares a total, e.g. the count of the `latency` histogram
+(`latency_metric_count`), with the number of answered requests.
+
+Both return `missing` and `loss_rate` (`missing` over the answered requests); a negative `missing` means more was
+received than answered.
+"""
+from typing import Any, Callable, Dict, List, Sized, Set
+
+from mock_collector_client import MockCollectorClient
+from mock_collector_query import attr, field, metrics
+from mock_collector_tables import SpanTable
+from mock_collector_wait import FixedIntervalWait, WaitTimeoutError, stable_for
+
+from amazon.utils.application_signals_constants import AWS_LOCAL_OPERATION, AWS_SPAN_KIND, LATENCY_METRIC
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+REQUEST_ID_HEADER: str = "X-Load-Request-Id"
+REQUEST_ID_ATTRIBUTE: str = f"http.request.header.{REQUEST_ID_HEADER.lower()}"
+REQUEST_ID_CAPTURE_ENVIRONMENT: Dict[str, str] = {
+    "OTEL_DOTNET_AUTO_TRACES_ASPNETCORE_INSTRUMENTATION_CAPTURE_REQUEST_HEADERS": REQUEST_ID_HEADER,
+}
+SPAN_WAIT_TIMEOUT: float = 120.0
+
+_SPAN_POLL_INTERVAL: float = 0.5
+# Added to the schedule delay, for the export itself and the poll interval.
+_SETTLE_MARGIN: float = 2.0
+
+
+def reconcile_spans(
+    client: MockCollectorClient, answered: Set[str], schedule_delay_ms: int, timeout: float = SPAN_WAIT_TIMEOUT
+) -> Dict[str, Any]:
+    """Server spans received, and those `missing`, duplicated or with an id that was never answered (`unknown`).
+
+    `schedule_delay_ms` is the application's OTEL_BSP_SCHEDULE_DELAY. Whatever has arrived after `timeout` is
+    reconciled, so spans that never arrive count as `missing` rather than failing the run.
+    """
+    settled: Callable[[Sized], bool] = stable_for(schedule_delay_ms / 1000 + _SETTLE_MARGIN)
+    last: List[List[str]] = [[]]
+
+    def poll() -> List[str]:
+        last[0] = _received_request_ids(client.peek_span_table())
+        return last[0]
+
+    def done(received_ids: List[str]) -> bool:
+        # `settled` is called on every poll, so that it sees every change of the count.
+        return settled(received_ids) or answered.issubset(received_ids)
+
+    try:
+        FixedIntervalWait(_SPAN_POLL_INTERVAL, timeout).until(poll, done, "server spans")
+    except WaitTimeoutError:
+        pass
+    received: List[str] = last[0]
+    unique: Set[str] = set(received)
+    missing: int = len(answered - unique)
+    return {
+        "received": len(received),
+        "missing": missing,
+        "duplicates": len(received) - len(unique),
+        "unknown": len(unique - answered),
+        "loss_rate": missing / len(answered) if answered else 0.0,
+    }
+
+
+def _received_request_ids(table: SpanTable) -> List[str]:
+    received: List[str] = []
+    for span in table.where(kind=Span.SPAN_KIND_SERVER):  # pylint: disable=no-member
+        value: Any = span.attribute(REQUEST_ID_ATTRIBUTE)
+        # Captured headers are string arrays, which the table holds as tuples.
+        received.extend(value if isinstance(value, tuple) else [value] if value is not None else [])
+    return received
+
+
+def reconcile_total(received: int, answered: int) -> Dict[str, Any]:
+    missing: int = answered - received
+    return {"received": received, "missing": missing, "loss_rate": missing / answered if answered else 0.0}
+
+
+def latency_metric_count(client: MockCollectorClient, operation: str) -> int:
+    """Requests counted by the `latency` histograms of `operation` that the mock collector holds."""
+    return int(
+        client.query(
+            metrics().where(
+                field("name") == LATENCY_METRIC,
+                attr(AWS_LOCAL_OPERATION) == operation,
+                attr(AWS_SPAN_KIND) == "LOCAL_ROOT",
+            ),
+            sum_column=field("count"),
+        )
+    )
@@ -20,7 +20,7 @@ rm -rf dist/contract_tests*
 # Install python dependency for contract-test
 pip3 install pymysql
 pip3 install cryptography
-pip3 install build pytest
+pip3 install build pytest pytest-xdist
 
 # To be clear, install binary for psycopg2 have no negative influence on otel here
 # since Otel-Instrumentation running in container that install psycopg2 from source
@@ -48,6 +48,16 @@ do
   fi
 done
 
+# Create Lambda sample image used by the Lambda cold-start benchmark, which the regular test run does not collect.
+# Only built on request: BUILD_LAMBDA_BENCHMARK_IMAGE=true ./set-up-contract-tests.sh
+if [ "${BUILD_LAMBDA_BENCHMARK_IMAGE:-false}" = "true" ]; then
+  docker build .. -t aws-application-signals-tests-simplelambdafunction-app -f ../sample-applications/lambda-test-apps/SimpleLambdaFunction/Dockerfile
+  if [ $? = 1 ]; then
+    echo "Docker build for simplelambdafunction application failed"
+    exit 1
+  fi
+fi
+
 # Build and install mock-collector
 cd contract-tests/images/mock-collector
 python3 -m build --outdir ../../../dist